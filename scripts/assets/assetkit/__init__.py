@@ -0,0 +1,6 @@
+"""
+RunGame 资源生成工具包
+
+scripts/assets/ 下各生成脚本共享的图像处理模块。
+脚本以 `python3 scripts/assets/xxx.py` 方式运行时，本目录自动位于 sys.path 中。
+"""
@@ -0,0 +1,95 @@
+"""
+增量构建缓存
+
+为每个输出文件计算输入指纹（绘制函数源码、配色表、字体文件内容、尺寸、编码参数），
+指纹与清单记录一致且文件仍在磁盘上时跳过该输出。
+清单保存在 .asset-cache/manifest.json，CI 可直接缓存该目录。
+"""
+
+import PIL
+import hashlib
+import inspect
+import json
+import os
+
+CACHE_FILE = '.asset-cache/manifest.json'
+
+
+class BuildCache:
+    """基于内容哈希的输出清单"""
+
+    def __init__(self, path=CACHE_FILE, enabled=True):
+        """enabled=False（--force）时不跳过任何输出，但仍记录本次生成的指纹并写回清单"""
+        self.path = path
+        self.enabled = enabled
+        self.outputs = {}
+        self.files = {}
+        self.dirty = False
+
+        # --force 时同样读取旧清单：本次没有重新生成的输出（如 --only 之外的）保留原记录
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.outputs = data.get('outputs', {})
+                self.files = data.get('files', {})
+            except (OSError, ValueError):
+                # 清单损坏时视为全部失效
+                self.outputs, self.files = {}, {}
+
+    def file_digest(self, path):
+        """文件内容哈希；mtime 和大小未变时复用清单中的结果，避免重复读取大字体文件"""
+        stat = os.stat(path)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        entry = self.files.get(path)
+        if entry and entry['stamp'] == stamp:
+            return entry['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        self.files[path] = {'stamp': stamp, 'sha256': digest.hexdigest()}
+        self.dirty = True
+        return self.files[path]['sha256']
+
+    def fonts_digest(self, font_paths):
+        """候选字体中所有存在文件的内容哈希"""
+        return {path: self.file_digest(path) for path in font_paths if os.path.exists(path)}
+
+    def key(self, *parts):
+        """
+        计算输出指纹
+
+        函数按源码参与哈希，其余参数按 JSON 规范化；Pillow 版本始终计入，
+        因为编码器升级同样会改变输出字节。
+        """
+        normalized = [PIL.__version__]
+        for part in parts:
+            if callable(part):
+                normalized.append(inspect.getsource(part))
+            else:
+                normalized.append(part)
+        payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_fresh(self, output, key):
+        """指纹一致且文件存在时无需重新生成"""
+        return self.enabled and self.outputs.get(output) == key and os.path.exists(output)
+
+    def record(self, output, key):
+        """记录已生成输出的指纹"""
+        if self.outputs.get(output) != key:
+            self.outputs[output] = key
+            self.dirty = True
+
+    def save(self):
+        """清单有变化时写回磁盘"""
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'outputs': self.outputs, 'files': self.files}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,238 @@
+"""
+内容寻址的本地图片仓库
+
+lib/gamepix-image-upload.ts 每上传一张图都要下载、计算 SHA-256，再调用一次
+fileExistsInR2 远程确认是否已存在。这里在本地维护同样以 SHA-256 寻址的仓库：
+
+  <根目录>/objects/ab/cd/abcd…<后缀>   原图按哈希前 4 位分两级目录存放
+  <根目录>/index.sqlite                 哈希 → 字节数、尺寸、格式、派生图；来源 → 哈希
+
+批量导入和派生图生成只需查一次本地索引即可判断“是否已有”，不再逐个走网络。
+索引使用 SQLite（标准库自带，WAL 模式），单进程写入，可多进程只读查询。
+"""
+
+from PIL import Image
+import hashlib
+import io
+import os
+import shutil
+import sqlite3
+import time
+
+STORE_DIR = '.asset-store'
+
+# 每次提交的最大记录数：批量导入时合并到少量事务中
+BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    hash TEXT PRIMARY KEY,
+    bytes INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    format TEXT,
+    ext TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS variants (
+    hash TEXT NOT NULL REFERENCES objects(hash),
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    PRIMARY KEY (hash, name)
+);
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    hash TEXT NOT NULL REFERENCES objects(hash)
+);
+"""
+
+# Pillow 格式 → 文件后缀
+EXTENSIONS = {
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "WEBP": ".webp",
+    "GIF": ".gif",
+    "AVIF": ".avif",
+}
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def inspect_image(data):
+    """只读取文件头，返回 (宽, 高, 格式)；无法识别时返回 (None, None, None)"""
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            return img.width, img.height, img.format
+    except (OSError, Image.DecompressionBombError):
+        return None, None, None
+
+
+def describe(data):
+    """计算一份原图的索引信息（可在进程池 worker 中执行）"""
+    width, height, fmt = inspect_image(data)
+    return {
+        "hash": sha256_bytes(data),
+        "bytes": len(data),
+        "width": width,
+        "height": height,
+        "format": fmt,
+        "ext": EXTENSIONS.get(fmt, ".bin"),
+    }
+
+
+def describe_file(path):
+    with open(path, 'rb') as f:
+        return describe(f.read())
+
+
+def describe_record(record):
+    """
+    批量导入的 worker 函数：record 为 assetkit.sources 产出的 {"path", "source", ...}
+
+    文件无法读取时返回 {"file", "source", "error"}，不中断整批导入。
+    """
+    try:
+        info = describe_file(record["path"])
+    except Exception as e:
+        info = {"error": str(e) or type(e).__name__}
+    info["file"] = record["path"]
+    info["source"] = record.get("source")
+    return info
+
+
+class ContentStore:
+    """SHA-256 寻址的本地仓库"""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(root, 'index.sqlite'))
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._pending = 0
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def object_path(self, digest, ext):
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:4], digest + ext)
+
+    # ---- 查询 ----
+
+    def has(self, digest):
+        return self.db.execute("SELECT 1 FROM objects WHERE hash = ?", (digest,)).fetchone() is not None
+
+    def missing(self, digests):
+        """批量查询：返回不在仓库中的哈希（保持输入顺序）"""
+        digests = list(digests)
+        known = set()
+        for i in range(0, len(digests), 500):
+            chunk = digests[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.execute(f"SELECT hash FROM objects WHERE hash IN ({placeholders})", chunk)
+            known.update(row[0] for row in rows)
+        return [digest for digest in digests if digest not in known]
+
+    def get(self, digest):
+        """返回对象信息（含 path 和 variants），不存在时返回 None"""
+        row = self.db.execute("SELECT * FROM objects WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        entry["path"] = self.object_path(digest, entry["ext"])
+        entry["variants"] = {
+            variant["name"]: {"path": variant["path"], "bytes": variant["bytes"]}
+            for variant in self.db.execute("SELECT name, path, bytes FROM variants WHERE hash = ?", (digest,))
+        }
+        return entry
+
+    def objects(self):
+        """逐个产出 (哈希, 文件路径)"""
+        for digest, ext in self.db.execute("SELECT hash, ext FROM objects ORDER BY hash"):
+            yield digest, self.object_path(digest, ext)
+
+    def lookup_source(self, source):
+        """来源（URL 或原始路径）→ 哈希；未导入过时返回 None"""
+        row = self.db.execute("SELECT hash FROM sources WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def stats(self):
+        count, total = self.db.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM objects").fetchone()
+        variants = self.db.execute("SELECT COUNT(*) FROM variants").fetchone()[0]
+        sources = self.db.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+        return {"objects": count, "bytes": total, "variants": variants, "sources": sources}
+
+    # ---- 写入 ----
+
+    def _commit_later(self, n=1):
+        self._pending += n
+        if self._pending >= BATCH_SIZE:
+            self.db.commit()
+            self._pending = 0
+
+    def _add(self, info, write, source):
+        digest = info["hash"]
+        created = not self.has(digest)
+        if created:
+            path = self.object_path(digest, info["ext"])
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                write(tmp_path)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self.db.execute(
+                "INSERT INTO objects (hash, bytes, width, height, format, ext, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (digest, info["bytes"], info["width"], info["height"], info["format"], info["ext"], time.time()),
+            )
+        if source is not None:
+            self.db.execute("INSERT OR REPLACE INTO sources (source, hash) VALUES (?, ?)", (source, digest))
+        self._commit_later()
+        return digest, created
+
+    def put(self, data, source=None, info=None):
+        """
+        存入一份原图，返回 (哈希, 是否新增)
+
+        info 为 describe(data) 的结果，已在 worker 中算好时可直接传入。
+        """
+        def write(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+
+        return self._add(info or describe(data), write, source)
+
+    def put_file(self, path, source=None, info=None):
+        """按文件导入（直接复制，不经过内存），info 为 describe_file(path) 的结果"""
+        return self._add(info or describe_file(path), lambda tmp_path: shutil.copyfile(path, tmp_path), source)
+
+    def add_variant(self, digest, name, path, size):
+        """登记一份派生图（如 "320.webp"）"""
+        self.db.execute(
+            "INSERT OR REPLACE INTO variants (hash, name, path, bytes) VALUES (?, ?, ?, ?)",
+            (digest, name, path, size),
+        )
+        self._commit_later()
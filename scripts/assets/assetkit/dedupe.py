@@ -0,0 +1,95 @@
+"""
+输出去重
+
+同一次生成中内容完全相同的输出（如 og-image.png 与 twitter-image.png）只编码、只写入一次，
+其余路径通过硬链接（不支持时复制）指向第一次写出的文件。还可以预先索引已有目录
+（如 public/logo），与其中文件字节相同的新输出同样直接链接。
+运行结束时报告所有字节相同的输出，避免 CDN 和 Service Worker 用不同的键缓存同一张图。
+可在多个线程之间共享（写入串行执行）。
+"""
+
+import glob
+import hashlib
+import os
+import shutil
+import threading
+
+
+def image_digest(img):
+    """图片像素内容的哈希（用于在编码前识别重复图片）"""
+    digest = hashlib.sha256()
+    digest.update(f"{img.mode}:{img.size}".encode('utf-8'))
+    digest.update(img.tobytes())
+    return digest.hexdigest()
+
+
+def bytes_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class OutputStore:
+    """按字节哈希写出文件：相同内容只写一次"""
+
+    def __init__(self, seed_dirs=()):
+        self.seed_dirs = list(seed_dirs)
+        self.first = {}       # 哈希 → 第一次出现的路径
+        self.groups = {}      # 哈希 → 本次写出（或链接）的全部路径
+        self._seeded = False
+        self._lock = threading.Lock()
+
+    def _seed(self):
+        """索引已有目录中的文件（只在第一次写入时执行）"""
+        if self._seeded:
+            return
+        self._seeded = True
+        for directory in self.seed_dirs:
+            for path in sorted(glob.glob(os.path.join(directory, '*'))):
+                if os.path.isfile(path):
+                    with open(path, 'rb') as f:
+                        self.first.setdefault(bytes_digest(f.read()), path)
+
+    def write(self, path, data):
+        """
+        写出文件，返回与之字节相同的已有路径（没有重复时返回 None）
+
+        始终先写临时文件再替换，不会通过硬链接改动其他输出。
+        """
+        digest = bytes_digest(data)
+        with self._lock:
+            return self._write(path, data, digest)
+
+    def _write(self, path, data, digest):
+        self._seed()
+        source = self.first.get(digest)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        duplicate = source and os.path.abspath(source) != os.path.abspath(path) and os.path.exists(source)
+        if duplicate:
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copyfile(source, tmp_path)
+        else:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        os.replace(tmp_path, path)
+
+        self.first.setdefault(digest, path)
+        group = self.groups.setdefault(digest, [] if source is None else [source])
+        if path not in group:
+            group.append(path)
+        return source if duplicate else None
+
+    def duplicates(self):
+        """字节相同的输出分组（每组至少两个路径）"""
+        return [paths for paths in self.groups.values() if len(paths) > 1]
+
+    def report(self):
+        groups = self.duplicates()
+        if not groups:
+            return
+        print("\n🔗 字节相同的输出（已共享同一份数据）:")
+        for paths in groups:
+            print(f"  • {' = '.join(paths)}")
@@ -0,0 +1,167 @@
+"""
+PNG 编码优化与体积预算
+
+品牌资源只用到主题中的几种品牌色加上抗锯齿过渡，大多可以无损感知地
+转为带 alpha 的调色板 PNG。每个输出会尝试：
+  1. 全彩 PNG（optimize=True，即原脚本的编码方式，同时作为对比基准）
+  2. 自适应调色板量化（256 / 128 / 64 色，保留 alpha）
+量化结果与原图的差异（预乘 alpha，0-255）不超过阈值时才会被采用，最终取字节数最小的一种。
+
+Pillow 的 PNG 编码器不支持指定扫描线滤波器，压缩级别由 optimize=True 固定为最高级，
+因此这里的可选项只有颜色模式和调色板大小。
+
+超出 ASSET_BUDGETS 中对应预算的输出会被报告为失败，脚本以非零状态退出。
+"""
+
+from PIL import Image
+import fnmatch
+import io
+import os
+
+from assetkit.dedupe import OutputStore, image_digest
+from assetkit.metrics import image_diff
+from assetkit.profiling import stage
+
+KB = 1024
+
+# 依次尝试的调色板大小（颜色越少越小，但误差越大）
+DEFAULT_PALETTES = (256, 128, 64)
+
+# 量化结果可接受的误差：平均通道差 / 单像素最大通道差
+MAX_MEAN_ERROR = 1.5
+MAX_PIXEL_ERROR = 64
+
+# 每类资源的体积预算（按输出路径匹配，先匹配先生效）
+ASSET_BUDGETS = {
+    "*favicon-16x16.png": 2 * KB,
+    "*favicon-32x32.png": 4 * KB,
+    "*favicon-48x48.png": 6 * KB,
+    "*favicon-64x64.png": 8 * KB,
+    "*favicon-128x128.png": 16 * KB,
+    "*favicon-256x256.png": 24 * KB,
+    "*favicon-512x512.png": 32 * KB,
+    "*apple-touch-icon.png": 20 * KB,
+    "*icon-192x192.png": 12 * KB,
+    "*icon-512x512.png": 24 * KB,
+    "*og-image.png": 80 * KB,
+    "*twitter-image.png": 80 * KB,
+    "*/og/*.png": 80 * KB,
+    "*logo-rungame-*1024.png": 96 * KB,
+    "*logo-rungame-*.png": 64 * KB,
+}
+
+
+def budget_for(path, budgets=ASSET_BUDGETS):
+    """返回输出路径对应的字节预算，没有匹配项时返回 None"""
+    normalized = path.replace(os.sep, '/')
+    for pattern, budget in budgets.items():
+        if fnmatch.fnmatch(normalized, pattern):
+            return budget
+    return None
+
+
+def within_budget(path, size=None):
+    """输出是否在 path 对应的字节预算内；size 缺省时读取已有文件的大小，没有预算时视为在预算内"""
+    budget = budget_for(path)
+    return budget is None or (os.path.getsize(path) if size is None else size) <= budget
+
+
+def _png_bytes(img):
+    with stage('png-deflate'):
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def encode_png(img, palettes=DEFAULT_PALETTES, max_mean=MAX_MEAN_ERROR, max_pixel=MAX_PIXEL_ERROR,
+               baseline=True):
+    """
+    选出最小的可接受编码
+
+    返回 (PNG 字节, 信息)，信息包含 method（truecolor / palette-N）、
+    baseline（全彩编码字节数）和 error（所选编码的平均误差）。
+    baseline=False 时只在没有可接受的调色板结果时才做全彩编码（批量渲染时省去最慢的一次编码），
+    此时信息中的 baseline 可能为 None。
+    """
+    best = _png_bytes(img) if baseline or img.mode not in ('RGB', 'RGBA') else None
+    info = {"method": "truecolor", "baseline": len(best) if best else None, "error": 0.0}
+
+    if img.mode in ('RGB', 'RGBA'):
+        for colors in sorted(palettes, reverse=True):
+            with stage('quantize'):
+                quantized = img.quantize(colors=colors, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+                diff = image_diff(quantized.convert(img.mode), img)
+            if diff["mean"] > max_mean or diff["max"] > max_pixel:
+                # 颜色更少只会误差更大，无需继续尝试
+                break
+            candidate = _png_bytes(quantized)
+            if best is None or len(candidate) < len(best):
+                best = candidate
+                info.update(method=f"palette-{colors}", error=diff["mean"])
+
+    if best is None:
+        best = _png_bytes(img)
+        info["baseline"] = len(best)
+    return best, info
+
+
+class PngEncoder:
+    """
+    编码并写出 PNG，记录体积变化和预算检查结果
+
+    像素完全相同的图片只编码一次；字节相同的输出由 OutputStore 共享同一份数据。
+    """
+
+    def __init__(self, budgets=ASSET_BUDGETS, quantize=True, store=None):
+        self.budgets = budgets
+        self.palettes = DEFAULT_PALETTES if quantize else ()
+        self.store = store or OutputStore()
+        self.results = []
+        self._encoded = {}
+
+    @property
+    def options(self):
+        """影响输出字节的编码参数（用于构建缓存指纹）"""
+        return {
+            "palettes": list(self.palettes),
+            "max_mean": MAX_MEAN_ERROR,
+            "max_pixel": MAX_PIXEL_ERROR,
+        }
+
+    def save(self, img, path):
+        """
+        编码并写入文件，返回是否在预算之内
+
+        超出预算的文件仍会写出以便检查，但调用方不应将其记入构建缓存。
+        """
+        digest = image_digest(img)
+        if digest not in self._encoded:
+            self._encoded[digest] = encode_png(img, self.palettes)
+        data, info = self._encoded[digest]
+        self.store.write(path, data)
+
+        budget = budget_for(path, self.budgets)
+        ok = budget is None or len(data) <= budget
+        self.results.append({"path": path, "bytes": len(data), "budget": budget, "ok": ok, **info})
+        return ok
+
+    def report(self):
+        """打印体积报告，返回是否全部在预算之内"""
+        if not self.results:
+            return True
+
+        print("\n📦 PNG 编码报告:")
+        for r in self.results:
+            budget = f"{r['budget'] / KB:.0f}KB" if r["budget"] else "-"
+            mark = "✓" if r["ok"] else "✗"
+            print(f"  {mark} {r['path']}: {r['baseline'] / KB:.1f}KB → {r['bytes'] / KB:.1f}KB "
+                  f"({r['method']}, 预算 {budget})")
+
+        before = sum(r["baseline"] for r in self.results)
+        after = sum(r["bytes"] for r in self.results)
+        print(f"  合计 {before / KB:.1f}KB → {after / KB:.1f}KB，节省 {(before - after) / KB:.1f}KB")
+
+        failed = [r for r in self.results if not r["ok"]]
+        for r in failed:
+            print(f"❌ 超出体积预算: {r['path']} {r['bytes'] / KB:.1f}KB > {r['budget'] / KB:.0f}KB")
+        return not failed
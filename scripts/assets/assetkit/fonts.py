@@ -0,0 +1,113 @@
+"""
+字体注册表
+
+所有图标 / OG 图片绘制函数共用：字体族的候选路径只探测一次，
+FreeTypeFont 对象按 (路径, 字号) 做 LRU 缓存，批量生成时不会反复加载 TTC 文件。
+默认使用 scripts/assets/fonts/ 下随仓库提供的 DejaVu Sans Bold，与平台无关；系统字体需显式指定（add_font）。
+
+除默认的 sans 外，按文字体系另有 cjk / arabic / hebrew 字体族，供多语言 OG 卡片
+（assetkit/locale_cards.py）使用。中日韩字体不随仓库提供，系统上也没有时 resolve_font('cjk') 返回 None，
+由调用方报错，不退回到画不出汉字的默认字体。
+"""
+
+from PIL import ImageFont
+import contextlib
+import functools
+import os
+
+from assetkit.profiling import stage
+
+BUNDLED_FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fonts')
+BUNDLED_FONT = os.path.join(BUNDLED_FONTS_DIR, 'DejaVuSans-Bold.ttf')
+
+# 字体族 → 候选路径（按优先级）。生成的资源默认只用随仓库提供的字体，macOS 设计机与 Linux CI 的输出一致；
+# 需要系统字体时用 add_font（命令行 --font sans=/System/Library/Fonts/Helvetica.ttc）显式指定
+FONT_FAMILIES = {
+    "sans": [BUNDLED_FONT],
+    # 中日韩字体体积太大，不随仓库提供，只能在系统路径中查找
+    "cjk": [
+        # macOS
+        "/System/Library/Fonts/PingFang.ttc",
+        "/System/Library/Fonts/STHeiti Medium.ttc",
+        "/System/Library/Fonts/Hiragino Sans GB.ttc",
+        # Linux 发行版常见路径（fonts-noto-cjk、wqy）
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/google-noto-cjk/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc",
+        "/usr/share/fonts/wenquanyi/wqy-microhei/wqy-microhei.ttc",
+    ],
+    # DejaVu 含阿拉伯文和希伯来文字形
+    "arabic": [BUNDLED_FONT],
+    "hebrew": [BUNDLED_FONT],
+}
+
+# 同时缓存的 FreeTypeFont 数量上限
+FONT_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_font(family="sans"):
+    """返回字体族中第一个可用的字体文件路径，找不到时返回 None"""
+    for path in FONT_FAMILIES[family]:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def _load_font(path, size):
+    with stage('font-load') as event:
+        event["font"] = f"{os.path.basename(path)}@{size}"
+        return ImageFont.truetype(path, size)
+
+
+def get_font(size, family="sans"):
+    """获取指定字号的字体；无可用字体或加载失败时退回 Pillow 默认字体"""
+    path = resolve_font(family)
+    if path:
+        try:
+            return _load_font(path, int(size))
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+
+def font_files(family="sans"):
+    """当前实际使用的字体文件列表（用于构建缓存指纹）"""
+    path = resolve_font(family)
+    return [path] if path else []
+
+
+def font_option(value):
+    """命令行 --font 的取值 "字体族=路径" → (字体族, 路径)"""
+    family, sep, path = value.partition('=')
+    if not sep or family not in FONT_FAMILIES:
+        raise ValueError(f"--font 的格式为 字体族=路径，字体族可选: {', '.join(FONT_FAMILIES)}")
+    return family, path
+
+
+def add_font(family, path):
+    """把字体文件放到字体族候选列表的最前面（命令行 --font 指定系统字体等）"""
+    if not os.path.exists(path):
+        raise ValueError(f"字体文件不存在: {path}")
+    candidates = FONT_FAMILIES.setdefault(family, [])
+    if path in candidates:
+        candidates.remove(path)
+    candidates.insert(0, path)
+    resolve_font.cache_clear()
+
+
+@contextlib.contextmanager
+def bundled_only(family="sans"):
+    """临时只使用随仓库提供的字体（基准测试、黄金图像比对需要与平台无关的渲染结果）"""
+    candidates = FONT_FAMILIES[family]
+    FONT_FAMILIES[family] = [BUNDLED_FONT]
+    resolve_font.cache_clear()
+    _load_font.cache_clear()
+    try:
+        yield BUNDLED_FONT
+    finally:
+        FONT_FAMILIES[family] = candidates
+        resolve_font.cache_clear()
+        _load_font.cache_clear()
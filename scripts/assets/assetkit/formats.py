@@ -0,0 +1,139 @@
+"""
+WebP / AVIF 输出变体
+
+每个 PNG 输出旁边额外生成 WebP（无损 / 高质量有损）和 AVIF（Pillow 支持时）版本，
+直接复用内存中已渲染好的图片，不重新绘制或解码。编码在线程池中并行执行
+（Pillow 编码时会释放 GIL）。所有变体的字节数写入 public/asset-variants.json，
+Next.js 端可据此为每个客户端选择最小的格式。
+
+注：Pillow 未暴露 libwebp 的 near_lossless 预处理参数，这里用 quality=90、
+alpha 无损的有损 WebP 作为“近无损”档位。
+"""
+
+from PIL import features
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import os
+
+from assetkit.dedupe import OutputStore, image_digest
+from assetkit.parallel import default_workers
+from assetkit.profiling import stage
+
+PUBLIC_DIR = 'public'
+VARIANTS_MANIFEST = 'public/asset-variants.json'
+
+# 格式名 → (Pillow 格式, 编码参数, 文件后缀)
+FORMATS = {
+    "webp": ("WEBP", {"lossless": True, "method": 4}, ".webp"),
+    "webp-lossy": ("WEBP", {"quality": 90, "alpha_quality": 100, "method": 4}, ".lossy.webp"),
+    "avif": ("AVIF", {"quality": 80}, ".avif"),
+}
+
+
+def available_formats():
+    """当前 Pillow 构建支持的变体格式"""
+    return [name for name, (fmt, _, _) in FORMATS.items() if features.check(fmt.lower())]
+
+
+def variant_path(png_path, name):
+    """foo/bar.png → foo/bar.webp 等"""
+    return os.path.splitext(png_path)[0] + FORMATS[name][2]
+
+
+def web_path(path, root=PUBLIC_DIR):
+    """磁盘路径 → 站点 URL 路径（public/logo/a.png → /logo/a.png）"""
+    return '/' + os.path.relpath(path, root).replace(os.sep, '/')
+
+
+def encode_variant(img, name, asset=None):
+    """把已渲染的图片编码为指定变体格式，返回字节；asset 为性能记录中的资源名"""
+    fmt, options, _ = FORMATS[name]
+    with stage(name, asset) as event:
+        buffer = io.BytesIO()
+        img.save(buffer, fmt, **options)
+        event["bytes"] = buffer.tell()
+    return buffer.getvalue()
+
+
+def write_variant(img, png_path, name):
+    """编码并写出一个变体，返回清单条目"""
+    data = encode_variant(img, name)
+    path = variant_path(png_path, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return {"path": web_path(path), "bytes": len(data)}
+
+
+def write_variants(img, png_path, formats=None):
+    """串行写出全部变体（供进程池 worker 使用），返回 {格式: 条目}"""
+    return {name: write_variant(img, png_path, name) for name in (formats or available_formats())}
+
+
+class VariantWriter:
+    """
+    并行编码变体并维护 asset-variants.json 清单
+
+    像素相同的图片只编码一次，写出时经 OutputStore 共享字节相同的文件。
+    """
+
+    def __init__(self, formats=None, manifest=VARIANTS_MANIFEST, workers=None, store=None):
+        self.formats = formats or available_formats()
+        self.manifest_path = manifest
+        self.manifest = {}
+        if os.path.exists(manifest):
+            with open(manifest, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        self.pool = ThreadPoolExecutor(max_workers=workers or default_workers())
+        self.store = store or OutputStore()
+        self.pending = {}
+        self._encoding = {}
+
+    def is_fresh(self, png_path):
+        """清单中已记录全部格式且文件都还在"""
+        entry = self.manifest.get(web_path(png_path))
+        if not entry:
+            return False
+        return all(name in entry and os.path.exists(variant_path(png_path, name)) for name in self.formats)
+
+    def submit(self, img, png_path):
+        """提交一张已写出 PNG 的图片，后台编码其全部变体"""
+        img.load()
+        digest = image_digest(img)
+        futures = {}
+        for name in self.formats:
+            if (digest, name) not in self._encoding:
+                self._encoding[digest, name] = self.pool.submit(encode_variant, img, name, png_path)
+            futures[name] = self._encoding[digest, name]
+        self.pending[png_path] = futures
+
+    def record(self, png_path, variants):
+        """登记在其他进程中生成的变体"""
+        entry = {"png": {"path": web_path(png_path), "bytes": os.path.getsize(png_path)}}
+        entry.update(variants)
+        self.manifest[web_path(png_path)] = entry
+
+    def finish(self):
+        """等待所有编码完成，写出清单并打印各格式体积"""
+        if self.pending:
+            print("\n🗜️  WebP / AVIF 变体:")
+        for png_path, futures in self.pending.items():
+            entries = {}
+            for name, future in futures.items():
+                data = future.result()
+                path = variant_path(png_path, name)
+                self.store.write(path, data)
+                entries[name] = {"path": web_path(path), "bytes": len(data)}
+            self.record(png_path, entries)
+            entry = self.manifest[web_path(png_path)]
+            best = min(entry, key=lambda name: entry[name]["bytes"])
+            sizes = ", ".join(f"{name} {item['bytes'] / 1024:.1f}KB" for name, item in entry.items())
+            print(f"  ✓ {png_path}: {sizes}（最小: {best}）")
+
+        self.pool.shutdown()
+        self.pending = {}
+        self._encoding = {}
+
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
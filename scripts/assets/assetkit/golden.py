@@ -0,0 +1,198 @@
+"""
+黄金图像比对
+
+按 asset-spec.json 渲染每个输出资源的图片（编码前的 RGBA 结果），与 tests/golden/ 下
+提交的无损 PNG 逐一比较，用于证明绘制、缩放链、着色等优化没有改变输出：
+
+  - 比较前转换为预乘 alpha，完全透明像素中无意义的 RGB 值不计入差异
+  - 逐通道（R / G / B / A）的最大差和平均差，以及超过通道容差的像素比例
+  - SSIM（7×7 窗口，积分图计算），预乘后的亮度和 alpha 分别计算，取较小者
+  - 不通过时写出差异热力图：期望 | 实际 | 差异（黑 → 红 → 黄 → 白）
+
+渲染复用 assetkit/pipeline.py 的依赖图（共享母版只画一次，分支并发执行），
+比较在线程池中进行（NumPy 运算释放 GIL）。字体固定为随仓库提供的字体，结果与平台无关。
+svg 节点的结果取决于渲染后端，黄金图像按后端分别保存（无后端时为位图回退 bitmap）。
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+import os
+
+import numpy as np
+
+from assetkit.build_cache import BuildCache
+from assetkit.fonts import bundled_only
+from assetkit.loader import ASSETS_DIR
+from assetkit.parallel import default_workers
+from assetkit.pipeline import OUTPUT_OPS, SPEC_FILE, AssetGraph, ancestors, load_spec, select, topological_order
+
+GOLDEN_DIR = os.path.join(ASSETS_DIR, 'tests', 'golden')
+
+HEATMAP_DIR = '.asset-cache/golden-diff'
+
+# 默认阈值（0-255 刻度）：
+#   channel   单个通道允许的差异，超过即计为离群像素
+#   outliers  离群像素占比上限
+#   mean      任一通道平均差上限
+#   ssim      SSIM 下限
+TOLERANCE = {"channel": 8, "outliers": 0.0001, "mean": 0.5, "ssim": 0.995}
+
+CHANNELS = "RGBA"
+
+# SSIM 的窗口边长和稳定常数（L = 255）
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+# 预乘 RGB → 亮度（ITU-R BT.601）
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def premultiplied(img):
+    """RGBA 图片 → 预乘 alpha 的 float32 数组 (h, w, 4)，0-255 刻度"""
+    arr = np.asarray(img.convert('RGBA'), dtype=np.float32)
+    out = arr.copy()
+    out[..., :3] *= arr[..., 3:] / 255.0
+    return out
+
+
+def _box_mean(x, window):
+    """window × window 滑动窗口均值（只取完整窗口），用积分图计算"""
+    integral = np.zeros((x.shape[0] + 1, x.shape[1] + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(x, axis=0, dtype=np.float64), axis=1, out=integral[1:, 1:])
+    total = (integral[window:, window:] - integral[:-window, window:]
+             - integral[window:, :-window] + integral[:-window, :-window])
+    return total / (window * window)
+
+
+def ssim(a, b, window=SSIM_WINDOW):
+    """两张单通道 float 数组的平均 SSIM；图片小于窗口时窗口缩小到图片尺寸"""
+    window = min(window, *a.shape)
+    mu_a, mu_b = _box_mean(a, window), _box_mean(b, window)
+    var_a = _box_mean(a * a, window) - mu_a * mu_a
+    var_b = _box_mean(b * b, window) - mu_b * mu_b
+    cov = _box_mean(a * b, window) - mu_a * mu_b
+    num = (2 * mu_a * mu_b + SSIM_C1) * (2 * cov + SSIM_C2)
+    den = (mu_a * mu_a + mu_b * mu_b + SSIM_C1) * (var_a + var_b + SSIM_C2)
+    return float(np.mean(num / den))
+
+
+def compare(expected, actual, tolerance=None):
+    """
+    比较两张图片，返回度量和不通过的原因
+
+    {"ok", "failures": [...], "max": {R,G,B,A}, "mean": {R,G,B,A}, "outliers", "ssim"}
+    """
+    tolerance = {**TOLERANCE, **(tolerance or {})}
+    if expected.size != actual.size:
+        return {"ok": False, "failures": [f"尺寸不一致: 期望 {expected.size}，实际 {actual.size}"]}
+
+    a, b = premultiplied(expected), premultiplied(actual)
+    diff = np.abs(a - b)
+    max_diff = diff.reshape(-1, 4).max(axis=0)
+    mean_diff = diff.reshape(-1, 4).mean(axis=0)
+    outliers = float(np.mean(diff.max(axis=2) > tolerance["channel"]))
+    score = min(ssim(a[..., :3] @ LUMA, b[..., :3] @ LUMA), ssim(a[..., 3], b[..., 3]))
+
+    failures = []
+    if outliers > tolerance["outliers"]:
+        failures.append(f"{outliers:.3%} 的像素通道差超过 {tolerance['channel']}（上限 {tolerance['outliers']:.3%}）")
+    worst = int(np.argmax(mean_diff))
+    if mean_diff[worst] > tolerance["mean"]:
+        failures.append(f"{CHANNELS[worst]} 通道平均差 {mean_diff[worst]:.3f}（上限 {tolerance['mean']}）")
+    if score < tolerance["ssim"]:
+        failures.append(f"SSIM {score:.4f}（下限 {tolerance['ssim']}）")
+
+    return {
+        "ok": not failures,
+        "failures": failures,
+        "max": {c: float(v) for c, v in zip(CHANNELS, max_diff)},
+        "mean": {c: round(float(v), 4) for c, v in zip(CHANNELS, mean_diff)},
+        "outliers": outliers,
+        "ssim": score,
+    }
+
+
+def _checkerboard(size, cell=8):
+    """透明区域的棋盘格背景"""
+    w, h = size
+    y, x = np.mgrid[:h, :w]
+    tile = np.where((x // cell + y // cell) % 2, 204, 255).astype(np.uint8)
+    return Image.fromarray(tile, 'L').convert('RGBA')
+
+
+def heatmap(expected, actual):
+    """差异热力图：期望 | 实际 | 差异；差异按本图最大差归一化，细微差异也可见"""
+    w, h = expected.size
+    canvas = Image.new('RGBA', (w * 3, h), (255, 255, 255, 255))
+    background = _checkerboard((w, h))
+    for i, img in enumerate((expected, actual)):
+        canvas.paste(Image.alpha_composite(background, img.convert('RGBA').resize((w, h))), (w * i, 0))
+
+    diff = np.abs(premultiplied(expected) - premultiplied(actual.resize((w, h)))).max(axis=2)
+    v = diff / max(float(diff.max()), 1.0)
+    rgb = np.stack([np.clip(3 * v, 0, 1), np.clip(3 * v - 1, 0, 1), np.clip(3 * v - 2, 0, 1)], axis=2)
+    canvas.paste(Image.fromarray((rgb * 255).astype(np.uint8), 'RGB').convert('RGBA'), (w * 2, 0))
+    return canvas
+
+
+def golden_targets(nodes, only=None):
+    """需要比对的图片节点：被 --only 选中的输出直接使用的节点（拓扑序）"""
+    targets = {dep for name in select(nodes, only) for dep in nodes[name].deps}
+    return [name for name in topological_order(nodes) if name in targets and nodes[name].op not in OUTPUT_OPS]
+
+
+def golden_path(graph, name, golden_dir=GOLDEN_DIR):
+    """节点的黄金图像路径；svg 节点按渲染后端区分"""
+    node = graph.nodes[name]
+    if node.op == 'svg':
+        name = f"{name}.{graph.backend or 'bitmap'}"
+    return os.path.join(golden_dir, f"{name}.png")
+
+
+def render(graph, names, workers=None):
+    """渲染 names 中的节点（及其上游），返回 {节点名: 图片}"""
+    order = [name for name in topological_order(graph.nodes) if name in ancestors(graph.nodes, names)]
+    return graph.run(order, workers, keep=set(names))
+
+
+def _load(path):
+    with Image.open(path) as img:
+        return img.convert('RGBA')
+
+
+def verify(spec_path=SPEC_FILE, only=None, workers=None, update=False,
+           golden_dir=GOLDEN_DIR, heatmap_dir=HEATMAP_DIR, tolerance=None):
+    """
+    渲染并比对，返回 [{"name", "golden", ...compare() 的结果}]（拓扑序）
+
+    update=True 时把渲染结果写为新的黄金图像（不比较）；
+    没有黄金图像的节点视为不通过。heatmap_dir 为 None 时不写热力图。
+    """
+    nodes = load_spec(spec_path)
+    names = golden_targets(nodes, only)
+    graph = AssetGraph(nodes, BuildCache(enabled=False), None, None)
+    workers = workers or default_workers()
+    with bundled_only():
+        images = render(graph, names, workers)
+
+    def check(name):
+        path = golden_path(graph, name, golden_dir)
+        actual = images[name]
+        if update:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            actual.save(path, 'PNG', optimize=True)
+            return {"name": name, "golden": path, "ok": True, "failures": [], "updated": True}
+        if not os.path.exists(path):
+            return {"name": name, "golden": path, "ok": False, "failures": ["缺少黄金图像（用 --update 生成）"]}
+
+        expected = _load(path)
+        result = {"name": name, "golden": path, **compare(expected, actual, tolerance)}
+        if not result["ok"] and heatmap_dir:
+            result["heatmap"] = os.path.join(heatmap_dir, f"{name.replace('/', '__')}.png")
+            os.makedirs(heatmap_dir, exist_ok=True)
+            heatmap(expected, actual).save(result["heatmap"])
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(check, names))
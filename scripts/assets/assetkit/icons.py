@@ -0,0 +1,109 @@
+"""
+多尺寸图标容器（ICO / ICNS）
+
+Pillow 的 ICO 编码器只用传入的一张图片，再按 sizes 自行重采样出各个尺寸：
+为每个尺寸单独缩放（或手工微调）好的位图被丢弃，小尺寸经过二次重采样变得模糊。
+这里把调用方给出的每个尺寸的位图原样打包，不做任何缩放：
+
+  - ICO：边长小于 PNG_MIN_SIZE 的条目存为 32 位 BMP（BGRA + AND 掩码，只认 BMP 条目的
+    旧程序也能读取），其余存为 PNG
+  - ICNS：全部为 PNG 条目，每个尺寸按 1x 和对应的 @2x 类型各写一项（共用同一份数据）
+
+Windows 只保证支持 32 位 RGBA 的 PNG 条目，因此条目不做调色板量化，只用 optimize=True 编码。
+"""
+
+import struct
+
+from assetkit.encode import encode_png
+
+# 边长不小于此值的 ICO 条目存为 PNG
+PNG_MIN_SIZE = 64
+
+# ICO 条目的最大边长（目录项中 0 表示 256）
+ICO_MAX_SIZE = 256
+
+# ICNS 中各边长对应的条目类型：1x 以及作为半尺寸 @2x 的类型
+ICNS_TYPES = {
+    16: (b'icp4',),
+    32: (b'icp5', b'ic11'),
+    64: (b'icp6', b'ic12'),
+    128: (b'ic07',),
+    256: (b'ic08', b'ic13'),
+    512: (b'ic09', b'ic14'),
+    1024: (b'ic10',),
+}
+
+
+def _square_sizes(images, allowed):
+    """检查每张图片为正方形、边长受支持且不重复，返回边长列表"""
+    sizes = []
+    for img in images:
+        width, height = img.size
+        if width != height:
+            raise ValueError(f"图标条目必须是正方形: {img.size}")
+        if not allowed(width):
+            raise ValueError(f"不支持的图标尺寸: {width}x{height}")
+        if width in sizes:
+            raise ValueError(f"图标尺寸重复: {width}x{height}")
+        sizes.append(width)
+    return sizes
+
+
+def bmp_entry(img):
+    """ICO 中的 BMP 条目：BITMAPINFOHEADER + 自下而上的 BGRA 行 + 1 位 AND 掩码"""
+    img = img.convert('RGBA')
+    width, height = img.size
+    xor = img.tobytes('raw', 'BGRA', 0, -1)
+    # AND 掩码：完全透明的像素置 1，每行按 4 字节对齐
+    mask = img.getchannel('A').point(lambda a: 255 if a == 0 else 0).convert('1')
+    stride = (width + 31) // 32 * 4
+    and_mask = mask.tobytes('raw', '1', stride, -1)
+    # 高度为 XOR 与 AND 两部分之和
+    header = struct.pack('<IiiHHIIiiII', 40, width, height * 2, 1, 32, 0, len(xor) + len(and_mask), 0, 0, 0, 0)
+    return header + xor + and_mask
+
+
+def png_entry(img):
+    """32 位 RGBA PNG 条目"""
+    return encode_png(img.convert('RGBA'), palettes=())[0]
+
+
+def pack_ico(images, png_min_size=PNG_MIN_SIZE):
+    """按给定顺序把各尺寸位图打包为 ICO 字节"""
+    sizes = _square_sizes(images, lambda size: 0 < size <= ICO_MAX_SIZE)
+    payloads = []
+    for img, size in zip(images, sizes):
+        if size >= png_min_size:
+            payloads.append(png_entry(img))
+        else:
+            payloads.append(bmp_entry(img))
+
+    header = struct.pack('<HHH', 0, 1, len(images))
+    offset = len(header) + 16 * len(images)
+    entries = []
+    for size, data in zip(sizes, payloads):
+        dimension = size % ICO_MAX_SIZE  # 256 记为 0
+        entries.append(struct.pack('<BBBBHHII', dimension, dimension, 0, 0, 1, 32, len(data), offset))
+        offset += len(data)
+    return header + b''.join(entries) + b''.join(payloads)
+
+
+def pack_icns(images):
+    """把各尺寸位图打包为 ICNS 字节（PNG 条目）"""
+    sizes = _square_sizes(images, lambda size: size in ICNS_TYPES)
+    chunks = []
+    for img, size in sorted(zip(images, sizes), key=lambda item: item[1]):
+        data = png_entry(img)
+        for icon_type in ICNS_TYPES[size]:
+            chunks.append(icon_type + struct.pack('>I', len(data) + 8) + data)
+    body = b''.join(chunks)
+    return b'icns' + struct.pack('>I', len(body) + 8) + body
+
+
+def write_icon(path, images, format='ICO', **options):
+    """写出 ICO / ICNS 文件，返回字节数"""
+    data = pack_ico(images, **options) if format == 'ICO' else pack_icns(images, **options)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
@@ -0,0 +1,52 @@
+"""
+按文件名加载生成脚本
+
+生成脚本的文件名带连字符（如 generate-icons-gamepad.py），无法直接 import。
+基准测试等工具通过这里复用脚本中的绘制函数。可在多个线程中同时调用。
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 模块在执行完之前就已放入 sys.modules，并发加载时其他线程不能拿到半初始化的模块
+_lock = threading.RLock()
+
+
+def _module_name(name):
+    return 'asset_script_' + name.replace('-', '_')
+
+
+def load_script(name):
+    """加载 scripts/assets/<name>.py 为模块（同名只加载一次）"""
+    module_name = _module_name(name)
+    with _lock:
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+
+        path = os.path.join(ASSETS_DIR, f'{name}.py')
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+        return module
+
+
+def reload_script(name):
+    """丢弃已加载的模块并重新执行脚本（watch 模式下脚本被修改后调用）"""
+    with _lock:
+        previous = sys.modules.pop(_module_name(name), None)
+        try:
+            return load_script(name)
+        except BaseException:
+            # 修改后的脚本执行失败时保留旧模块，修复后再次重新加载
+            if previous is not None:
+                sys.modules[_module_name(name)] = previous
+            raise
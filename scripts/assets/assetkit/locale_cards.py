@@ -0,0 +1,300 @@
+"""
+多语言 OG 卡片
+
+站点按 app/(site)/[locale]/... 为每种语言提供页面，这里为 i18n/messages/ 下的每个消息目录
+（每种语言一个 JSON）× 每种页面类型渲染一张卡片。版式与 assetkit/og_cards.py 相同，
+静态底图同样来自 og_composer()，区别在于：
+
+  - 文字取自消息目录，PAGES 列出每种页面用到的消息键
+  - 按语言选择字体族（assetkit/fonts.py）：中日韩用 cjk，阿拉伯语、希伯来语等从右向左书写的语言
+    用对应字体族并右对齐。Pillow 带 libraqm 时由它做字形整形和双向排序；没有时只把字符反转成视觉顺序
+    （拉丁词组和数字保持原序），阿拉伯字母不连写
+  - 中日韩文字没有空格，按字折行，句末标点不放在行首
+  - emoji 在各平台都没有可用的字体，文字中的 emoji 直接去掉
+
+文字的宽度和栅格化后的遮罩按 (文字, 字号, 字体族, 方向) 缓存在模块级 LRU 中：同一进程渲染的
+所有卡片共用（站点名、页脚在一种语言的每张卡片上都相同，选字号、截断时反复测量的前缀也只测一次），
+每张卡片只剩复制底图、贴遮罩和编码。generate-locale-og-cards.py 按语言分批交给进程池，
+同一语言的卡片在同一个 worker 中渲染，字体只加载一次。
+"""
+
+from PIL import Image, ImageDraw, features
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+
+from assetkit.encode import encode_png, within_budget
+from assetkit.fonts import FONT_FAMILIES, add_font, font_files, get_font, resolve_font
+from assetkit.loader import load_script
+from assetkit.og_cards import CARD_PALETTES, CONTENT_WIDTH, CONTENT_X, TITLE_SIZES
+from assetkit.profiling import stage
+from assetkit.theme import get_theme
+
+MESSAGES_DIR = 'i18n/messages'
+
+# 每张卡片共用的消息键
+CARD_MESSAGES = {"label": "common.siteName", "footer": "footer.description"}
+
+# 页面类型 → 标题、副标题的消息键（与 app/(site)/[locale]/ 下的路由对应）
+PAGES = {
+    "home": {"title": "home.hero", "subtitle": "home.heroDesc"},
+    "games": {"title": "games.title", "subtitle": "games.description"},
+    "category": {"title": "common.allCategories", "subtitle": "common.browseCategoriesDescription"},
+    "tag": {"title": "common.allTags", "subtitle": "common.browseTagsDescription"},
+    "search": {"title": "search.search", "subtitle": "search.enterSearchTerm"},
+    "about": {"title": "about.title", "subtitle": "about.subtitle"},
+    "contact": {"title": "contact.title", "subtitle": "contact.subtitle"},
+    "privacy": {"title": "privacy.title", "subtitle": "privacy.subtitle"},
+    "terms": {"title": "terms.title", "subtitle": "terms.subtitle"},
+}
+
+# 语言 → 字体族（未列出的语言用 sans）
+LANGUAGE_FAMILIES = {
+    "zh": "cjk", "ja": "cjk", "ko": "cjk",
+    "ar": "arabic", "fa": "arabic", "ur": "arabic",
+    "he": "hebrew",
+}
+
+# 从右向左书写的语言
+RTL_LANGUAGES = {"ar", "fa", "ur", "he"}
+
+# 宽度只是一个浮点数，多缓存一些；遮罩最大约 630×100 字节
+MEASURE_CACHE_SIZE = 8192
+RASTER_CACHE_SIZE = 1024
+
+RAQM = features.check('raqm')
+
+LOCALE_PATTERN = re.compile(r'^[A-Za-z]{2,3}(-[A-Za-z0-9]+)*$')
+
+# 中日韩文字（含全角标点）；折行时每个字是一个单位，句末标点跟随前一个字
+CJK = '\u2e80-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef'
+CLOSING = '，。、！？：；）」』》】'
+TOKEN = re.compile(rf'\s+|[{CJK}][{CLOSING}]*|[^\s{CJK}]+')
+
+# 不反转的从左向右片段（拉丁词组、数字，含其间的空格和标点）
+LTR_RUN = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9.,:;!?%'&/ -]*[A-Za-z0-9.!?%])?")
+
+EMOJI = re.compile('[\U0001F000-\U0001FAFF\u2600-\u27bf\u2b00-\u2bff\u200d\ufe0e\ufe0f]')
+
+# worker 进程内的输出目录
+_output_dir = None
+
+
+def language(locale):
+    return locale.split('-')[0].lower()
+
+
+def locale_family(locale):
+    """语言 → 字体族；该字体族没有可用字体时报错，不退回到画不出这种文字的字体"""
+    family = LANGUAGE_FAMILIES.get(language(locale), 'sans')
+    if resolve_font(family) is None:
+        raise ValueError(f"语言 {locale} 需要 {family} 字体，但没有找到（候选: {', '.join(FONT_FAMILIES[family])}；"
+                         f"可用 --font {family}=<路径> 指定）")
+    return family
+
+
+def load_catalogs(directory=MESSAGES_DIR, locales=None):
+    """读取消息目录 → {语言: 消息字典}（按语言排序）"""
+    if not os.path.isdir(directory):
+        raise ValueError(f"消息目录不存在: {directory}")
+    available = sorted(name[:-5] for name in os.listdir(directory) if name.endswith('.json'))
+    for locale in locales or []:
+        if locale not in available:
+            raise ValueError(f"没有语言 {locale} 的消息目录（可选: {', '.join(available)}）")
+
+    catalogs = {}
+    for locale in locales or available:
+        if not LOCALE_PATTERN.match(locale):
+            raise ValueError(f"不是合法的语言代码: {locale}")
+        with open(os.path.join(directory, f'{locale}.json'), 'r', encoding='utf-8') as f:
+            catalogs[locale] = json.load(f)
+    return catalogs
+
+
+def message(catalog, key):
+    """按 "a.b.c" 取消息"""
+    value = catalog
+    for part in key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            raise ValueError(f"消息目录缺少 {key}")
+        value = value[part]
+    if not isinstance(value, str):
+        raise ValueError(f"消息 {key} 不是字符串")
+    return value
+
+
+def strip_emoji(text):
+    return ' '.join(EMOJI.sub('', text).split())
+
+
+def card_text(catalog, page):
+    """消息目录 + 页面类型 → 卡片上的文字"""
+    if page not in PAGES:
+        raise ValueError(f"未知的页面类型: {page}")
+    keys = {**CARD_MESSAGES, **PAGES[page]}
+    text = {field: strip_emoji(message(catalog, key)) for field, key in keys.items()}
+    text["label"] = text["label"].upper()
+    return text
+
+
+def _visual(text, direction):
+    """逻辑顺序的文字 → 交给 FreeType 的 (文字, direction 参数)"""
+    if direction != 'rtl':
+        return text, None
+    if RAQM:
+        return text, 'rtl'
+    # 没有 libraqm：片段倒序排列，拉丁词组和数字保持原序，其余字符逐个反转
+    runs = [match.group() for match in re.finditer(rf'{LTR_RUN.pattern}|.', text, re.S)]
+    return ''.join(reversed(runs)), None
+
+
+@functools.lru_cache(maxsize=MEASURE_CACHE_SIZE)
+def measure(text, size, family='sans', direction=None):
+    """文字宽度"""
+    visual, flag = _visual(text, direction)
+    return get_font(size, family).getlength(visual, direction=flag)
+
+
+@functools.lru_cache(maxsize=RASTER_CACHE_SIZE)
+def rasterize(text, size, family='sans', direction=None):
+    """文字遮罩 → (L 模式遮罩, 相对绘制起点的偏移)；返回的遮罩在卡片之间共享，只读"""
+    with stage('text-raster') as event:
+        event["text"] = f"{family}@{size}"
+        visual, flag = _visual(text, direction)
+        font = get_font(size, family)
+        left, top, right, bottom = font.getbbox(visual, direction=flag)
+        mask = Image.new('L', (max(1, right - left), max(1, bottom - top)))
+        ImageDraw.Draw(mask).text((-left, -top), visual, fill=255, font=font, direction=flag)
+        return mask, (left, top)
+
+
+class Typesetter:
+    """一种语言的排版参数（字体族、书写方向）；宽度和遮罩走模块级缓存"""
+
+    def __init__(self, locale):
+        self.locale = locale
+        self.family = locale_family(locale)
+        self.direction = 'rtl' if language(locale) in RTL_LANGUAGES else None
+
+    def width(self, text, size):
+        return measure(text, size, self.family, self.direction)
+
+    def fit(self, text, sizes, max_width):
+        """放得下的最大字号；都放不下时返回最小字号"""
+        for size in sizes:
+            if self.width(text, size) <= max_width:
+                return size
+        return sizes[-1]
+
+    def truncate(self, text, size, max_width, clipped=False):
+        """超出宽度（或 clipped：后面还有被截掉的内容）时截断并追加省略号"""
+        if not clipped and self.width(text, size) <= max_width:
+            return text
+        while text and self.width(text + "…", size) > max_width:
+            text = text[:-1]
+        return text.rstrip() + "…"
+
+    def wrap(self, text, size, max_width, max_lines):
+        """在空格处和中日韩文字之间折行，最多 max_lines 行，最后一行超出时截断"""
+        lines, current = [], ""
+        for token in TOKEN.findall(text):
+            candidate = current + token
+            if not current or self.width(candidate.rstrip(), size) <= max_width:
+                current = candidate.lstrip()
+            else:
+                lines.append(current.rstrip())
+                current = token.lstrip()
+        if current.strip():
+            lines.append(current.rstrip())
+
+        if len(lines) > max_lines:
+            lines = lines[:max_lines]
+            lines[-1] = self.truncate(lines[-1], size, max_width, clipped=True)
+        return [self.truncate(line, size, max_width) for line in lines]
+
+    def draw(self, img, y, text, size, fill):
+        """在文字区域内绘制一行（从右向左书写的语言右对齐）"""
+        if not text:
+            return
+        mask, (dx, dy) = rasterize(text, size, self.family, self.direction)
+        x = CONTENT_X
+        if self.direction == 'rtl':
+            x += CONTENT_WIDTH - round(self.width(text, size))
+        img.paste(fill, (x + dx, y + dy), mask)
+
+
+def render_card(text, typesetter):
+    """在静态底图副本上绘制一张卡片的文字（位置、字号与 og_cards.render_card 相同）"""
+    colors = get_theme().colors
+    img = load_script('generate-icons-gamepad').og_composer().canvas()
+
+    typesetter.draw(img, 110, text["label"], 28, colors["accent"])
+
+    size = typesetter.fit(text["title"], TITLE_SIZES, CONTENT_WIDTH)
+    typesetter.draw(img, 160, typesetter.truncate(text["title"], size, CONTENT_WIDTH), size, colors["primary"])
+
+    for i, line in enumerate(typesetter.wrap(text["subtitle"], 34, CONTENT_WIDTH, 3)):
+        typesetter.draw(img, 290 + i * 48, line, 34, colors["light"])
+
+    if text["footer"]:
+        footer = typesetter.truncate(text["footer"], 30, CONTENT_WIDTH)
+        typesetter.draw(img, 500, footer, 30, colors["accent"])
+
+    return img
+
+
+@functools.lru_cache(maxsize=None)
+def template_version():
+    """模板代码指纹：任何版式改动都会生成新的文件名"""
+    gamepad = load_script('generate-icons-gamepad')
+    sources = [inspect.getsource(obj) for obj in (
+        card_text, _visual, rasterize, Typesetter, render_card, encode_png,
+    )]
+    sources.append(gamepad.og_composer().key)
+    sources.append(f"raqm={RAQM}")
+    return hashlib.sha256("\n".join(sources).encode('utf-8')).hexdigest()
+
+
+def card_path(locale, page, text, typesetter):
+    """内容寻址的输出路径：<语言>/<页面>-<hash>.png（字体文件、书写方向变了也会生成新文件）"""
+    payload = json.dumps([text, font_files(typesetter.family), typesetter.direction], sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256((payload + template_version()).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(locale, f"{page}-{digest}.png")
+
+
+def init_worker(output_dir, fonts=()):
+    """worker 初始化：登记命令行指定的字体，预先加载静态底图"""
+    global _output_dir
+    for family, path in fonts:
+        add_font(family, path)
+    load_script('generate-icons-gamepad').og_composer().static()
+    _output_dir = output_dir
+
+
+def render_locale(task):
+    """
+    渲染一种语言的一批卡片：task 为 (语言, [(页面, 文字), ...])
+    返回 [(键, 相对路径, 是否新生成, 是否在体积预算内), ...]
+
+    文件名包含内容哈希，同名文件已存在即说明内容未变，直接跳过（仍按已有文件检查体积预算）。
+    """
+    locale, pages = task
+    typesetter = Typesetter(locale)
+    results = []
+    for page, text in pages:
+        relative = card_path(locale, page, text, typesetter)
+        path = os.path.join(_output_dir, relative)
+        key = f"{locale}/{page}"
+        if os.path.exists(path):
+            results.append((key, relative, False, within_budget(path)))
+            continue
+
+        data, _ = encode_png(render_card(text, typesetter), CARD_PALETTES, baseline=False)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        results.append((key, relative, True, within_budget(path, len(data))))
+    return results
@@ -0,0 +1,111 @@
+"""
+Logo 多尺寸 × 多配色变体
+
+矢量母版（SVG）：每个 worker 按目标尺寸直接光栅化，单色版本通过替换 SVG 填充色得到。
+位图母版（PNG）：只读取一次，以原始像素缓冲区传给每个 worker，
+每个 worker 负责一个输出：缩放 → 着色 → 编码。
+"""
+
+from PIL import Image
+import os
+
+from assetkit.encode import encode_png, budget_for
+from assetkit.formats import write_variants
+from assetkit.memory import apply_memory_limit, convert_strips, open_image, strip_budget
+from assetkit.recolor import recolor, recolor_strips
+from assetkit.resize import resize_strips
+from assetkit.svg import rasterize, read_svg, substitute_fill
+from assetkit.theme import get_theme
+
+# 配色方案：None 表示保留原色；品牌色取自默认主题（themes.json）
+COLORWAYS = {
+    "color": None,
+    "white": "#FFFFFF",
+    "dark": get_theme().hex("dark"),
+    "monochrome": get_theme().hex("primary"),
+}
+
+LOGO_SIZES = [16, 32, 64, 128, 180, 192, 256, 512, 1024]
+
+# worker 进程内的母版缓存（位图母版或 SVG 文本 + 渲染后端）
+_master = None
+_svg = None
+_backend = None
+
+
+def load_master(path, size=1024):
+    """
+    读取母版为 RGBA；SVG 按 size 光栅化（需要 assetkit/svg.py 中的任一后端）
+
+    比 size 更大的位图母版先按条带缩小到 size，超大原图不会整张转换为 RGBA，
+    传给各 worker 的缓冲区也只有输出所需的最大尺寸。
+    """
+    if path.lower().endswith('.svg'):
+        return rasterize(read_svg(path), size)
+    w, h = open_image(path).size
+    scale = size / max(w, h)
+    if scale >= 1:
+        return convert_strips(open_image(path))
+    target = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return resize_strips(open_image(path, target), target)
+
+
+def variant_filename(colorway, size):
+    """输出文件名，与 public/logo 现有命名保持一致"""
+    if colorway == "color":
+        return f"logo-rungame-{size}.png"
+    return f"logo-rungame-{colorway}-{size}.png"
+
+
+def init_worker(size, data, memory_limit=None):
+    """worker 初始化：从原始缓冲区重建母版，每个进程只做一次；可选设置内存上限"""
+    global _master
+    _master = Image.frombytes('RGBA', size, data)
+    apply_memory_limit(memory_limit)
+
+
+def init_svg_worker(svg, backend, memory_limit=None):
+    """矢量母版的 worker 初始化"""
+    global _svg, _backend
+    _svg, _backend = svg, backend
+    apply_memory_limit(memory_limit)
+
+
+def render_variant(task):
+    """
+    生成单个变体并写入磁盘（PNG + WebP/AVIF）
+
+    返回 (路径, 字节数, 全彩编码字节数, 是否在预算内, WebP/AVIF 清单条目)
+    """
+    colorway, size, output_dir = task
+
+    color = COLORWAYS[colorway]
+    if _svg is not None:
+        img = rasterize(substitute_fill(_svg, color) if color else _svg, size, _backend)
+    else:
+        img = _master
+        if img.size != (size, size):
+            img = img.resize((size, size), Image.Resampling.LANCZOS)
+        if color is not None:
+            img = recolor(img, color)
+
+    path = os.path.join(output_dir, variant_filename(colorway, size))
+    data, info = encode_png(img)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    budget = budget_for(path)
+    return path, len(data), info["baseline"], budget is None or len(data) <= budget, write_variants(img, path)
+
+
+def render_monochrome(path, color, size, backend=None, memory_limit=None):
+    """
+    单色 Logo（generate-white-logo.py）：SVG 母版替换填充色后按 size 渲染，位图母版按条带着色
+
+    设置 memory_limit 时应在独立的 worker 进程中调用：RLIMIT_AS 限制的是整个进程的地址空间，
+    主进程中编码线程池的线程栈和 malloc arena 也会计入，上限按图片数据估算时会让这些线程失败。
+    """
+    apply_memory_limit(memory_limit)
+    if path.lower().endswith('.svg'):
+        return rasterize(substitute_fill(read_svg(path), color), size, backend)
+    return recolor_strips(open_image(path), color, strip_budget(memory_limit))
@@ -0,0 +1,122 @@
+"""
+大尺寸原图的内存控制
+
+8K 宣传图或超大封面整张解码后再 convert('RGBA') 会同时占用两份完整缓冲区，
+多个 worker 并行时容易被 OOM 杀掉。这里提供三件事：
+
+  open_image()         延迟解码；JPEG 用 Image.draft 直接按 1/2、1/4、1/8 比例解码
+  strips()             按字节预算把图片切成水平条带，着色 / 缩放逐条进行，
+                       模式转换等中间缓冲区只有条带大小
+  apply_memory_limit() 每个 worker 的内存上限（Linux 上通过 RLIMIT_AS 强制），
+                       超出时该任务以 MemoryError 失败，而不是整个进程被系统杀掉
+
+上限可通过各批处理脚本的 --memory-limit 参数或 ASSET_WORKER_MEMORY_MB 环境变量设置。
+"""
+
+from PIL import Image
+import math
+import os
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+MEMORY_ENV = 'ASSET_WORKER_MEMORY_MB'
+
+MB = 1024 * 1024
+
+# 每个条带的默认字节预算（按 RGBA 计算）
+DEFAULT_STRIP_BYTES = 32 * MB
+
+# Pillow 内部存储每像素字节数（RGB 也按 4 字节存储）
+_BYTES_PER_PIXEL = {'1': 1, 'L': 1, 'P': 1, 'LA': 4, 'PA': 4, 'I;16': 2}
+
+
+def image_bytes(size, mode='RGBA'):
+    """解码后的缓冲区大小"""
+    w, h = size
+    return w * h * _BYTES_PER_PIXEL.get(mode, 4)
+
+
+def memory_limit_mb(value=None):
+    """命令行参数优先，其次环境变量；都未设置时返回 None（不限制）"""
+    if value is None:
+        value = os.environ.get(MEMORY_ENV)
+    return int(value) if value else None
+
+
+def strip_budget(limit_mb=None):
+    """条带预算：内存上限的 1/8，且不超过默认值"""
+    if not limit_mb:
+        return DEFAULT_STRIP_BYTES
+    return max(MB, min(DEFAULT_STRIP_BYTES, limit_mb * MB // 8))
+
+
+def _virtual_size():
+    """当前进程已占用的虚拟内存（仅 Linux）"""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def apply_memory_limit(limit_mb):
+    """
+    限制当前进程在此之后最多再分配 limit_mb MB
+
+    上限 = 当前虚拟内存 + limit_mb（解释器和已导入模块不计入）。
+    只在 Linux 上生效（macOS 不强制 RLIMIT_AS），返回是否已设置。
+    """
+    if not limit_mb or resource is None or not os.path.exists('/proc/self/statm'):
+        return False
+    # 先加载全部格式插件（含 WebP / AVIF 编码器的扩展模块），避免设限后才导入失败
+    Image.init()
+    limit = _virtual_size() + limit_mb * MB
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    return True
+
+
+def draft_for(img, target):
+    """
+    尚未解码的 JPEG 按不小于 2 倍 target 的最小比例解码
+
+    保留 2 倍缩放余量，之后再 Lanczos 缩小，画质与整图解码后缩放一致；其他格式不受影响。
+    """
+    if target and img.format == 'JPEG':
+        w, h = target
+        img.draft(img.mode, (w * 2, h * 2))
+    return img
+
+
+def open_image(path, target=None):
+    """打开图片但不解码；target 为最终需要的 (宽, 高)，见 draft_for()"""
+    return draft_for(Image.open(path), target)
+
+
+def strips(size, mode='RGBA', budget=DEFAULT_STRIP_BYTES):
+    """按字节预算切分的水平条带 [(y0, y1), ...]"""
+    w, h = size
+    rows = max(1, budget // max(1, image_bytes((w, 1), mode)))
+    return [(y, min(h, y + rows)) for y in range(0, h, rows)]
+
+
+def convert_strips(img, mode='RGBA', budget=DEFAULT_STRIP_BYTES):
+    """
+    逐条转换模式，避免整图 convert 时源图与结果的中间副本同时存在
+
+    结果与 img.convert(mode) 完全一致。
+    """
+    if img.mode == mode:
+        return img
+    out = Image.new(mode, img.size)
+    for y0, y1 in strips(img.size, mode, budget):
+        out.paste(img.crop((0, y0, img.width, y1)).convert(mode), (0, y0))
+    return out
+
+
+def source_rows(oy0, oy1, scale, height, support=3.0):
+    """输出行 [oy0, oy1) 的 Lanczos 滤波需要读取的源图行范围"""
+    margin = support * max(scale, 1.0) + 1
+    return max(0, math.floor(oy0 * scale - margin)), min(height, math.ceil(oy1 * scale + margin))
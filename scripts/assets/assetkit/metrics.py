@@ -0,0 +1,21 @@
+"""
+图像差异度量
+
+比较前先转换为预乘 alpha（RGBa），完全透明像素中无意义的 RGB 值不计入差异。
+数值均为 0-255 刻度。
+"""
+
+from PIL import ImageChops, ImageStat
+
+
+def image_diff(a, b):
+    """返回 {'max': 最大通道差, 'mean': 平均通道差}"""
+    if a.size != b.size:
+        raise ValueError(f"尺寸不一致: {a.size} vs {b.size}")
+
+    diff = ImageChops.difference(a.convert('RGBA').convert('RGBa'), b.convert('RGBA').convert('RGBa'))
+    stat = ImageStat.Stat(diff)
+    return {
+        'max': max(high for _, high in diff.getextrema()),
+        'mean': sum(stat.mean) / len(stat.mean),
+    }
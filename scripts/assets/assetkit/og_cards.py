@@ -0,0 +1,171 @@
+"""
+批量 OG 卡片模板
+
+版式沿用 create_gamepad_og_image()：深色背景 + 右侧装饰圆 + 游戏手柄徽标，
+左侧替换为每个游戏 / 分类 / 标签自己的文字。静态图层由 og_composer() 缓存
+（见 assetkit/og_compose.py），每张卡片只需复制底图并绘制文字。
+
+输入记录字段与 lib/og-image-helpers.ts 中的参数一致：
+  game:     {"type": "game", "slug", "title", "category"?, "tags"?}
+  category: {"type": "category", "slug", "name", "description"?, "gameCount"?}
+  tag:      {"type": "tag", "slug", "name", "description"?, "gameCount"?}
+"""
+
+from PIL import ImageDraw
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+
+from assetkit.encode import encode_png, within_budget
+from assetkit.fonts import get_font
+from assetkit.loader import load_script
+from assetkit.theme import get_theme
+
+CONTENT_X = 80
+CONTENT_WIDTH = 630          # 文字区域宽度，右侧留给徽标
+TITLE_SIZES = [84, 72, 60, 48]
+
+# 卡片只用少量品牌色，直接尝试 64 色调色板，批量时省去全彩基准编码
+CARD_PALETTES = (64,)
+
+TYPE_LABELS = {
+    "game": "GAME",
+    "category": "CATEGORY",
+    "tag": "TAG",
+}
+
+# worker 进程内的输出目录
+_output_dir = None
+
+
+def card_text(record):
+    """把导出记录转换为卡片上的文字"""
+    kind = record["type"]
+    if kind not in TYPE_LABELS:
+        raise ValueError(f"未知的记录类型: {kind}")
+
+    if kind == "game":
+        footer = record.get("tags") or ""
+        return {
+            "label": TYPE_LABELS[kind],
+            "title": record["title"],
+            "subtitle": record.get("category") or "Free Online Game",
+            "footer": footer,
+        }
+
+    count = int(record.get("gameCount") or 0)
+    return {
+        "label": TYPE_LABELS[kind],
+        "title": record["name"],
+        "subtitle": record.get("description") or "",
+        "footer": f"{count:,} GAMES" if count else "",
+    }
+
+
+def truncate(draw, text, font, max_width):
+    """超出宽度时截断并追加省略号"""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > max_width:
+        text = text[:-1]
+    return text.rstrip() + "…"
+
+
+def wrap(draw, text, font, max_width, max_lines):
+    """按单词折行，最多 max_lines 行，最后一行超出时截断"""
+    lines, current = [], ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if draw.textlength(candidate, font=font) <= max_width or not current:
+            current = candidate
+        else:
+            lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = truncate(draw, lines[-1] + " …", font, max_width)
+    return [truncate(draw, line, font, max_width) for line in lines]
+
+
+def render_card(text):
+    """在静态底图副本上绘制一张卡片的文字"""
+    colors = get_theme().colors
+    img = load_script('generate-icons-gamepad').og_composer().canvas()
+    draw = ImageDraw.Draw(img)
+
+    draw.text((CONTENT_X, 110), text["label"], fill=colors["accent"], font=get_font(28))
+
+    # 标题：优先缩小字号，最小字号仍放不下时截断
+    for size in TITLE_SIZES:
+        title_font = get_font(size)
+        if draw.textlength(text["title"], font=title_font) <= CONTENT_WIDTH:
+            break
+    title = truncate(draw, text["title"], title_font, CONTENT_WIDTH)
+    draw.text((CONTENT_X, 160), title, fill=colors["primary"], font=title_font)
+
+    subtitle_font = get_font(34)
+    for i, line in enumerate(wrap(draw, text["subtitle"], subtitle_font, CONTENT_WIDTH, 3)):
+        draw.text((CONTENT_X, 290 + i * 48), line, fill=colors["light"], font=subtitle_font)
+
+    if text["footer"]:
+        footer_font = get_font(30)
+        footer = truncate(draw, text["footer"], footer_font, CONTENT_WIDTH)
+        draw.text((CONTENT_X, 500), footer, fill=colors["accent"], font=footer_font)
+
+    return img
+
+
+@functools.lru_cache(maxsize=None)
+def template_version():
+    """模板代码指纹：任何版式改动都会生成新的文件名"""
+    gamepad = load_script('generate-icons-gamepad')
+    sources = [inspect.getsource(fn) for fn in (
+        card_text, render_card, truncate, wrap, encode_png,
+    )]
+    # 合成器的指纹包含主题配色
+    sources.append(gamepad.og_composer().key)
+    return hashlib.sha256("\n".join(sources).encode('utf-8')).hexdigest()
+
+
+def card_path(record, text):
+    """内容寻址的输出路径：<type>/<slug>-<hash>.png"""
+    payload = json.dumps(text, sort_keys=True, ensure_ascii=False) + template_version()
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+    slug = re.sub(r'[^A-Za-z0-9_-]+', '-', record["slug"]).strip('-') or 'untitled'
+    return os.path.join(record["type"], f"{slug}-{digest}.png")
+
+
+def init_worker(output_dir):
+    """worker 初始化：预先加载静态底图（磁盘缓存命中时无需重新绘制）"""
+    global _output_dir
+    load_script('generate-icons-gamepad').og_composer().static()
+    _output_dir = output_dir
+
+
+def render_record(record):
+    """
+    渲染一条记录，返回 (键, 相对路径, 是否新生成, 是否在体积预算内)
+
+    文件名包含内容哈希，同名文件已存在即说明内容未变，直接跳过（仍按已有文件检查体积预算）。
+    """
+    text = card_text(record)
+    relative = card_path(record, text)
+    path = os.path.join(_output_dir, relative)
+    key = f"{record['type']}/{record['slug']}"
+
+    if os.path.exists(path):
+        return key, relative, False, within_budget(path)
+
+    data, _ = encode_png(render_card(text), CARD_PALETTES, baseline=False)
+    ok = within_budget(path, len(data))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return key, relative, True, ok
@@ -0,0 +1,71 @@
+"""
+进程池工具
+
+所有批量生成脚本共用：每个输出作为一个任务分发到独立进程，
+只读的大对象（如母版图片）通过 initializer 在每个 worker 中加载一次。
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import os
+
+
+def default_workers():
+    """默认 worker 数量：CPU 核数"""
+    return os.cpu_count() or 1
+
+
+def run_pool(fn, tasks, workers=None, initializer=None, initargs=()):
+    """
+    在进程池中对每个任务执行 fn，按任务顺序返回结果
+
+    workers=1 时直接在当前进程串行执行，便于调试和单核环境。
+    """
+    tasks = list(tasks)
+    workers = min(workers or default_workers(), max(1, len(tasks)))
+
+    if workers == 1:
+        if initializer:
+            initializer(*initargs)
+        return [fn(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        return list(pool.map(fn, tasks))
+
+
+def stream_pool(fn, tasks, workers=None, initializer=None, initargs=(), window=None):
+    """
+    按任务顺序逐个产出结果，tasks 可以是任意长度的迭代器
+
+    同时提交到进程池的任务不超过 window 个（默认 worker 数的 4 倍），
+    处理数万条记录时内存占用保持恒定。
+    """
+    workers = workers or default_workers()
+
+    if workers == 1:
+        if initializer:
+            initializer(*initargs)
+        for task in tasks:
+            yield fn(task)
+        return
+
+    window = window or workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(fn, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def chunks(iterable, size):
+    """把任意迭代器切成每批 size 个的列表（小任务合并分发，减少进程间通信）"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
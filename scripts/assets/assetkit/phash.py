@@ -0,0 +1,199 @@
+"""
+感知哈希与近似重复分组
+
+上传流程的 SHA-256 只能识别字节完全相同的文件，GamePix 经常返回同一封面的
+重新编码版或不同宽度版本。这里为每张图计算 64 位 dHash（相邻像素梯度）和
+pHash（32×32 DCT 低频分量），两者的汉明距离都在阈值内即视为近似重复。
+
+分组不做 O(n²) 两两比较，而是多索引汉明搜索：把 dHash 切成 r+1 段，
+距离 ≤ r 的两张图至少有一段完全相同（抽屉原理），只在同段相同的候选对上
+计算距离。每段用排序 + 相邻比较在 NumPy 中批量生成候选对，最后用
+向量化的并查集合并连通分量。
+"""
+
+from PIL import Image
+import numpy as np
+
+HASH_SIZE = 8           # 8×8 = 64 位
+PHASH_SAMPLE = 32       # pHash 的 DCT 输入尺寸
+
+# 默认阈值（64 位中的不同位数）
+DHASH_THRESHOLD = 6
+PHASH_THRESHOLD = 10
+
+
+def _dct_matrix(n, rows):
+    k = np.arange(rows)[:, None]
+    x = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * x + 1) * k / (2 * n))
+
+
+_DCT = _dct_matrix(PHASH_SAMPLE, HASH_SIZE)     # 只需要前 8 个频率
+
+
+def _pack(bits):
+    """(n, 64) 布尔数组 → (n,) uint64"""
+    packed = np.packbits(bits.reshape(len(bits), -1), axis=1)
+    return packed.view('>u8').reshape(-1).astype(np.uint64)
+
+
+def load_gray(path):
+    """读取为灰度图；透明区域按白色背景处理，JPEG 直接以缩小的比例解码"""
+    with Image.open(path) as img:
+        size = img.size     # draft() 之后 img.size 变为解码尺寸，先记下原图尺寸
+        img.draft('L', (PHASH_SAMPLE * 2, PHASH_SAMPLE * 2))
+        if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+            rgba = img.convert('RGBA')
+            background = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
+            return Image.alpha_composite(background, rgba).convert('L'), size
+        return img.convert('L'), size
+
+
+def samples(gray):
+    """一张灰度图 → (dHash 输入 8×9, pHash 输入 32×32)"""
+    d = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BOX), dtype=np.float32)
+    p = np.asarray(gray.resize((PHASH_SAMPLE, PHASH_SAMPLE), Image.Resampling.BOX), dtype=np.float32)
+    return d, p
+
+
+def dhash_batch(d):
+    """(n, 8, 9) → (n,) uint64：每行相邻像素是否变亮"""
+    return _pack(d[:, :, 1:] > d[:, :, :-1])
+
+
+def phash_batch(p):
+    """(n, 32, 32) → (n,) uint64：8×8 低频 DCT 系数是否高于中位数"""
+    low = np.einsum('kx,nxy,ly->nkl', _DCT, p, _DCT).reshape(len(p), -1)
+    return _pack(low > np.median(low, axis=1, keepdims=True))
+
+
+def hash_files(paths):
+    """
+    批量计算感知哈希（进程池 worker 函数，每个任务处理一批文件）
+
+    返回 [(路径, 宽, 高, dhash, phash) 或 (路径, 错误信息)]。
+    """
+    results, d_samples, p_samples, loaded = [], [], [], []
+    for path in paths:
+        try:
+            gray, size = load_gray(path)
+        except (OSError, Image.DecompressionBombError) as e:
+            results.append((path, str(e)))
+            continue
+        d, p = samples(gray)
+        d_samples.append(d)
+        p_samples.append(p)
+        loaded.append((path, size))
+
+    if loaded:
+        dhashes = dhash_batch(np.stack(d_samples))
+        phashes = phash_batch(np.stack(p_samples))
+        for (path, (w, h)), dh, ph in zip(loaded, dhashes, phashes):
+            results.append((path, w, h, int(dh), int(ph)))
+    return results
+
+
+def popcount(values):
+    """uint64 数组（或标量）逐元素统计 1 的个数，结果形状与输入相同"""
+    values = np.asarray(values, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    # NumPy < 2.0：按字节展开再求和；标量先展平成一维，最后还原形状
+    flat = np.ascontiguousarray(values).reshape(-1)
+    return np.unpackbits(flat.view(np.uint8).reshape(len(flat), 8), axis=1).sum(axis=1).reshape(values.shape)
+
+
+def _block_masks(blocks):
+    """把 64 位切成 blocks 段，返回 [(右移位数, 掩码)]"""
+    edges = np.linspace(0, 64, blocks + 1).astype(int)
+    return [(int(lo), (1 << int(hi - lo)) - 1) for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def _equal_key_pairs(keys):
+    """
+    逐批产出 keys 中取值相同的下标对 (左, 右)，每对只出现一次
+
+    排序后相同的值连续排列；对偏移 d = 1, 2, … 只保留剩余长度仍大于 d 的位置，
+    总工作量等于候选对数，每批不超过 len(keys)，内存占用不随候选对总数增长。
+    """
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    n = len(keys)
+    boundary = np.flatnonzero(np.diff(sorted_keys)) + 1
+    starts = np.concatenate(([0], boundary))
+    lengths = np.diff(np.concatenate((starts, [n])))
+    # 每个位置到所在段末尾的剩余长度
+    remaining = np.repeat(starts + lengths, lengths) - np.arange(n)
+
+    active = np.flatnonzero(remaining > 1)
+    d = 1
+    while len(active):
+        yield order[active], order[active + d]
+        d += 1
+        active = active[remaining[active] > d]
+
+
+def _connected_components(n, a, b):
+    """向量化并查集：返回每个节点所在分量的最小下标"""
+    labels = np.arange(n)
+    if not len(a):
+        return labels
+    while True:
+        merged = np.minimum(labels[a], labels[b])
+        np.minimum.at(labels, a, merged)
+        np.minimum.at(labels, b, merged)
+        jumped = labels[labels]
+        while not np.array_equal(jumped, labels):
+            labels = jumped
+            jumped = labels[labels]
+        if np.array_equal(labels[a], labels[b]):
+            return labels
+
+
+def near_duplicate_pairs(dhashes, phashes, dhash_threshold=DHASH_THRESHOLD, phash_threshold=PHASH_THRESHOLD):
+    """
+    查找近似重复：dHash 与 pHash 距离都在阈值内
+
+    输入为 uint64 数组。哈希完全相同的图片先合并，只在不同哈希之间搜索，返回 (inverse, a, b)：
+    inverse[i] 是第 i 张图片所属的去重哈希下标（inverse 相同即完全重复），
+    a、b 为去重哈希下标数组，(a[k], b[k]) 是一对近似重复的哈希，且 a[k] < b[k]。
+    """
+    dhashes = np.asarray(dhashes, dtype=np.uint64)
+    phashes = np.asarray(phashes, dtype=np.uint64)
+
+    # 哈希完全相同（常见于同一封面的不同宽度）直接归为一组
+    combined = np.stack([dhashes, phashes], axis=1)
+    unique, inverse = np.unique(combined, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    ud, up = unique[:, 0], unique[:, 1]
+
+    pairs_a, pairs_b = [], []
+    for shift, mask in _block_masks(dhash_threshold + 1):
+        keys = (ud >> np.uint64(shift)) & np.uint64(mask)
+        for a, b in _equal_key_pairs(keys):
+            # 候选对很多，先用 dHash 过滤再取 pHash，减少随机访存
+            close = popcount(ud[a] ^ ud[b]) <= dhash_threshold
+            a, b = a[close], b[close]
+            close = popcount(up[a] ^ up[b]) <= phash_threshold
+            a, b = a[close], b[close]
+            pairs_a.append(np.minimum(a, b))
+            pairs_b.append(np.maximum(a, b))
+
+    a = np.concatenate(pairs_a) if pairs_a else np.empty(0, dtype=np.intp)
+    b = np.concatenate(pairs_b) if pairs_b else np.empty(0, dtype=np.intp)
+    if len(a):
+        a, b = np.unique(np.stack([a, b], axis=1), axis=0).T
+    return inverse, a, b
+
+
+def group_near_duplicates(dhashes, phashes, dhash_threshold=DHASH_THRESHOLD, phash_threshold=PHASH_THRESHOLD):
+    """
+    按近似重复关系分组（传递闭包），返回至少包含两张图片的分组（原始下标列表）
+    """
+    inverse, a, b = near_duplicate_pairs(dhashes, phashes, dhash_threshold, phash_threshold)
+    labels = _connected_components(int(inverse.max()) + 1 if len(inverse) else 0, a, b)[inverse]
+
+    grouped = np.flatnonzero(np.bincount(labels)[labels] > 1)
+    order = grouped[np.argsort(labels[grouped], kind='stable')]
+    boundary = np.flatnonzero(np.diff(labels[order])) + 1
+    return [group.tolist() for group in np.split(order, boundary) if len(group) > 1]
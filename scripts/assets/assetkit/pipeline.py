@@ -0,0 +1,503 @@
+"""
+声明式资源构建
+
+asset-spec.json 把每个资源描述为节点（render → resize → recolor → encode），
+节点通过 from 显式声明依赖，这里把规格展开为有向无环图并调度执行：
+
+  - 同一个中间结果（如 512 母版）只计算一次，被所有下游节点共享
+  - 同一来源的 resize 节点共用一条金字塔缩放链（assetkit/resize.py）
+  - 输出节点的指纹由上游节点的指纹逐级组合，指纹未变且文件仍在时整条分支都不执行
+  - 相互独立的分支在线程池中并发执行（Pillow 缩放和编码时会释放 GIL）
+
+每个输出路径只能由一个节点写出，两个节点写同一文件时加载规格即报错。
+--only 按节点名或输出路径（支持通配符）选择目标，只执行目标的上游节点。
+themes 为主题名列表时（themes.json，见 assetkit/theme.py），render 节点及其下游为每个主题各复制一份，
+在同一次构建中一起生成；同一场景图同一尺寸的几何在各主题间共用，只有着色按主题进行。
+每个节点作为一个阶段记入 assetkit/profiling.py 的报告（默认 .asset-cache/build-report.json）。
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from PIL import Image
+import fnmatch
+import json
+import os
+import threading
+
+from assetkit.build_cache import BuildCache
+from assetkit.dedupe import OutputStore
+from assetkit.encode import PngEncoder, encode_png
+from assetkit.fonts import font_files
+from assetkit.formats import FORMATS, VariantWriter, available_formats
+from assetkit.icons import ICNS_TYPES, PNG_MIN_SIZE, bmp_entry, pack_icns, pack_ico, png_entry, write_icon
+from assetkit.loader import ASSETS_DIR, load_script
+from assetkit.parallel import default_workers
+from assetkit.profiling import REPORT_FILE, Profiler, stage
+from assetkit.recolor import recolor
+from assetkit.resize import Resizer, plan_resizes
+from assetkit.scene import RASTER_MODULES
+from assetkit.svg import default_backend, rasterize, read_svg, substitute_fill
+from assetkit.theme import DEFAULT_THEME, get_theme
+
+SPEC_FILE = os.path.join(ASSETS_DIR, 'asset-spec.json')
+
+LOGO_DIR = 'public/logo'
+
+# 产出图片的节点类型
+IMAGE_OPS = ('render', 'load', 'svg', 'resize', 'recolor')
+
+# 写出文件的节点类型：encode 由其他节点的 output 字段展开，ico / icns 直接写出 output
+OUTPUT_OPS = ('encode', 'ico', 'icns')
+
+# 节点类型 → 性能报告中的阶段名
+STAGES = {
+    'render': 'draw',
+    'load': 'decode',
+    'svg': 'rasterize',
+    'resize': 'resize',
+    'recolor': 'recolor',
+    'encode': 'encode',
+    'ico': 'ico',
+    'icns': 'icns',
+}
+
+
+class Node:
+    """图中的一个节点；deps 为上游节点名（按声明顺序）"""
+
+    def __init__(self, name, op, params, deps=(), output=None):
+        self.name = name
+        self.op = op
+        self.params = params
+        self.deps = list(deps)
+        self.output = output
+
+    def __repr__(self):
+        return f"Node({self.name!r}, {self.op!r})"
+
+
+def _as_size(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _expand(name, entry):
+    """resize 节点的 sizes 展开为每个尺寸一个节点，名称和输出路径中的 {size} 替换为尺寸"""
+    if 'sizes' not in entry:
+        return [(name, entry)]
+    if entry.get('op') != 'resize':
+        raise ValueError(f"{name}: 只有 resize 节点支持 sizes")
+    if '{size}' not in name:
+        raise ValueError(f"{name}: 带 sizes 的节点名需要包含 {{size}}")
+    expanded = []
+    for size in entry['sizes']:
+        item = {k: v for k, v in entry.items() if k != 'sizes'}
+        item['size'] = size
+        if 'output' in item:
+            item['output'] = [path.format(size=size) for path in _as_list(item['output'])]
+        expanded.append((name.format(size=size), item))
+    return expanded
+
+
+def parse_spec(spec):
+    """
+    规格字典 → {节点名: Node}
+
+    图片节点的 output（字符串或列表）展开为以输出路径命名的 encode 节点；
+    ico / icns 节点的 output 即其自身写出的文件。
+    """
+    nodes = {}
+
+    def add(node):
+        existing = nodes.get(node.name)
+        if existing is not None and existing.op == node.op == 'encode':
+            raise ValueError(f"输出冲突: {node.output} 同时由 {existing.deps[0]} 和 {node.deps[0]} 写出")
+        if existing is not None:
+            raise ValueError(f"节点重名: {node.name}")
+        nodes[node.name] = node
+
+    for name, entry in spec['nodes'].items():
+        for node_name, item in _expand(name, entry):
+            op = item.get('op')
+            if op not in IMAGE_OPS + ('ico', 'icns'):
+                raise ValueError(f"{node_name}: 未知的节点类型 {op!r}")
+            params = {k: v for k, v in item.items() if k not in ('op', 'from', 'output')}
+            deps = _as_list(item.get('from'))
+            outputs = _as_list(item.get('output'))
+
+            if op in ('ico', 'icns'):
+                if len(outputs) != 1:
+                    raise ValueError(f"{node_name}: {op} 节点需要且只能有一个 output")
+                add(Node(node_name, op, params, deps, outputs[0]))
+                continue
+
+            add(Node(node_name, op, params, deps))
+            for path in outputs:
+                add(Node(path, 'encode', {}, [node_name], path))
+
+    validate(nodes)
+    return nodes
+
+
+def load_spec(path=SPEC_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_spec(json.load(f))
+
+
+def output_owners(spec_path=SPEC_FILE):
+    """
+    {规格中的输出路径（绝对路径）: 负责生成它的节点名}；encode 输出取其上游的图片节点
+
+    其他脚本写同一路径前先查这里，避免两个生产者交替覆盖、互相让对方的增量缓存失效。
+    """
+    return {os.path.abspath(node.output): node.deps[0] if node.op == 'encode' else node.name
+            for node in load_spec(spec_path).values() if node.output}
+
+
+def validate(nodes):
+    """检查依赖存在、无环、每个输出路径只有一个写出者"""
+    writers = {}
+    for node in nodes.values():
+        for dep in node.deps:
+            if dep not in nodes:
+                raise ValueError(f"{node.name}: 依赖的节点不存在: {dep}")
+        if node.op in ('resize', 'recolor', 'encode') and len(node.deps) != 1:
+            raise ValueError(f"{node.name}: {node.op} 节点需要且只能有一个 from")
+        if node.op in ('ico', 'icns') and not node.deps:
+            raise ValueError(f"{node.name}: {node.op} 节点需要至少一个 from")
+        if node.output:
+            path = os.path.normpath(node.output)
+            if path in writers:
+                raise ValueError(f"输出冲突: {node.output} 同时由 {writers[path]} 和 {node.name} 写出")
+            writers[path] = node.name
+    topological_order(nodes)
+
+
+def topological_order(nodes):
+    """按依赖排序的节点名列表（同层保持声明顺序）；有环时抛出 ValueError"""
+    order, state = [], {}
+
+    def visit(name, stack):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"依赖成环: {' → '.join(stack + [name])}")
+        state[name] = 'visiting'
+        for dep in nodes[name].deps:
+            visit(dep, stack + [name])
+        state[name] = 'done'
+        order.append(name)
+
+    for name in nodes:
+        visit(name, [])
+    return order
+
+
+def ancestors(nodes, names):
+    """names 及其全部上游节点"""
+    result, stack = set(), list(names)
+    while stack:
+        name = stack.pop()
+        if name not in result:
+            result.add(name)
+            stack.extend(nodes[name].deps)
+    return result
+
+
+def descendants(nodes, names):
+    """names 及其全部下游节点"""
+    children = {}
+    for node in nodes.values():
+        for dep in node.deps:
+            children.setdefault(dep, []).append(node.name)
+    result, stack = set(), list(names)
+    while stack:
+        name = stack.pop()
+        if name not in result:
+            result.add(name)
+            stack.extend(children.get(name, []))
+    return result
+
+
+def select(nodes, patterns=None):
+    """
+    --only 选择的输出节点
+
+    模式匹配节点名或输出路径（fnmatch 通配符）；匹配到中间节点时选择其下游的全部输出。
+    没有模式时选择全部输出；有模式但什么都没匹配到时抛出 ValueError。
+    """
+    outputs = [name for name in topological_order(nodes) if nodes[name].op in OUTPUT_OPS]
+    if not patterns:
+        return outputs
+
+    matched = set()
+    for pattern in patterns:
+        hits = {name for name, node in nodes.items()
+                if fnmatch.fnmatch(name, pattern) or (node.output and fnmatch.fnmatch(node.output, pattern))}
+        if not hits:
+            raise ValueError(f"--only {pattern} 没有匹配任何节点或输出")
+        matched |= hits
+    selected = descendants(nodes, matched)
+    return [name for name in outputs if name in selected]
+
+
+def with_themes(nodes, targets, themes):
+    """
+    为每个非默认主题复制一份受主题影响的节点（render 节点及其全部下游）
+
+    复制的 render 节点在 kwargs 中加上 theme，节点名加上 themes/<主题名>/ 前缀，输出路径改为
+    该主题的目录（Theme.output_path）。返回 (节点, 目标)：目标为 targets 中受主题影响的输出在各主题下的
+    副本；themes 包含默认主题时再加上 targets 本身（与主题无关的输出只随默认主题生成）。
+    """
+    themed = descendants(nodes, [name for name, node in nodes.items() if node.op == 'render'])
+    result, selected = dict(nodes), []
+    for theme in [get_theme(name) for name in themes]:
+        if theme.name == DEFAULT_THEME:
+            selected += targets
+            continue
+        renamed = {}
+        for name in topological_order(nodes):
+            if name not in themed:
+                continue
+            node = nodes[name]
+            params = node.params
+            if node.op == 'render':
+                params = {**params, 'kwargs': {**params.get('kwargs', {}), 'theme': theme.name}}
+            output = theme.output_path(node.output) if node.output else None
+            renamed[name] = output if node.op == 'encode' else f"themes/{theme.name}/{name}"
+            deps = [renamed.get(dep, dep) for dep in node.deps]
+            result[renamed[name]] = Node(renamed[name], node.op, params, deps, output)
+        selected += [renamed[name] for name in targets if name in renamed]
+    validate(result)
+    return result, list(dict.fromkeys(selected))
+
+
+def theme_key(params):
+    """render 节点所用主题的配色指纹（未指定时为默认主题）"""
+    return get_theme(params.get('kwargs', {}).get('theme')).key
+
+
+class AssetGraph:
+    """按规格计算节点指纹并调度执行"""
+
+    def __init__(self, nodes, cache, encoder, variants):
+        self.nodes = nodes
+        self.cache = cache
+        self.encoder = encoder
+        self.variants = variants
+        self.backend = default_backend()
+        self.fonts = cache.fonts_digest(font_files())
+        self.raster = [cache.file_digest(path) for path in RASTER_MODULES]
+        self._keys = {}
+        self._resizers = {}
+        self._resizer_locks = {name: threading.Lock() for name in nodes}
+        # 同一来源的全部 resize 尺寸（按完整规格而不是 --only 的选择计算，保证结果一致）
+        self.resize_sizes = {}
+        for node in nodes.values():
+            if node.op == 'resize':
+                self.resize_sizes.setdefault(node.deps[0], set()).add(_as_size(node.params['size']))
+
+    # ---- 指纹 ----
+
+    def key(self, name):
+        """节点指纹：自身参数 + 相关代码 + 上游节点指纹"""
+        if name not in self._keys:
+            node = self.nodes[name]
+            upstream = [self.key(dep) for dep in node.deps]
+            self._keys[name] = self.cache.key(node.op, node.params, upstream, *self._key_parts(node))
+        return self._keys[name]
+
+    def _key_parts(self, node):
+        params = node.params
+        if node.op == 'render':
+            script = os.path.join(ASSETS_DIR, f"{params['script']}.py")
+            return [self.cache.file_digest(script), self.fonts, self.raster, theme_key(params)]
+        if node.op == 'load':
+            return [self.cache.file_digest(params['path'])]
+        if node.op == 'svg':
+            parts = [self.cache.file_digest(params['path']), self.backend, substitute_fill, rasterize]
+            if self.backend is None and params.get('fallback'):
+                parts += [self.cache.file_digest(params['fallback']), Resizer, recolor]
+            return parts
+        if node.op == 'resize':
+            return [Resizer, plan_resizes, sorted(self.resize_sizes[node.deps[0]])]
+        if node.op == 'recolor':
+            return [recolor]
+        if node.op == 'encode':
+            formats = self.variants.formats if self.variants else available_formats()
+            return [encode_png, self.encoder.options, FORMATS, formats]
+        if node.op == 'ico':
+            return [pack_ico, bmp_entry, png_entry, PNG_MIN_SIZE]
+        if node.op == 'icns':
+            return [pack_icns, png_entry, ICNS_TYPES]
+        return []
+
+    def is_fresh(self, name):
+        node = self.nodes[name]
+        if not self.cache.is_fresh(node.output, self.key(name)):
+            return False
+        return node.op != 'encode' or self.variants is None or self.variants.is_fresh(node.output)
+
+    # ---- 执行 ----
+
+    def plan(self, targets):
+        """需要执行的节点（拓扑序）和跳过的输出"""
+        stale = [name for name in targets if not self.is_fresh(name)]
+        skipped = [name for name in targets if name not in stale]
+        needed = ancestors(self.nodes, stale)
+        return [name for name in topological_order(self.nodes) if name in needed], skipped
+
+    def _render(self, node, inputs):
+        params = node.params
+        if node.op == 'render':
+            fn = getattr(load_script(params['script']), params['function'])
+            return fn(*params.get('args', []), **params.get('kwargs', {}))
+        if node.op == 'load':
+            with Image.open(params['path']) as img:
+                return img.convert('RGBA')
+        if node.op == 'svg':
+            size = _as_size(params['size'])
+            fill = params.get('fill')
+            if self.backend is None and params.get('fallback'):
+                # 没有 SVG 渲染后端时退回位图母版：缩放后按同一颜色着色
+                with Image.open(params['fallback']) as img:
+                    img = img.convert('RGBA')
+                if img.size != size:
+                    img = img.resize(size, Image.Resampling.LANCZOS)
+                return recolor(img, fill) if fill else img
+            svg = read_svg(params['path'])
+            return rasterize(substitute_fill(svg, fill) if fill else svg, size, self.backend)
+        if node.op == 'resize':
+            source = node.deps[0]
+            with self._resizer_locks[source]:
+                if source not in self._resizers:
+                    self._resizers[source] = Resizer(inputs[0], self.resize_sizes[source])
+                return self._resizers[source].get(params['size'])
+        if node.op == 'recolor':
+            return recolor(inputs[0], params['color'])
+        raise ValueError(f"{node.name}: 未知的节点类型 {node.op!r}")
+
+    def _write(self, node, inputs):
+        if node.op == 'encode':
+            img = inputs[0]
+            # 不生成变体时（watch 模式）输出还不完整，不记入增量缓存，下次完整构建会补齐
+            if self.encoder.save(img, node.output) and self.variants:
+                self.cache.record(node.output, self.key(node.name))
+            if self.variants:
+                self.variants.submit(img, node.output)
+        else:
+            # ico / icns：各输入原样作为一个尺寸的条目，不再重采样
+            write_icon(node.output, inputs, node.op.upper(), **node.params)
+            self.cache.record(node.output, self.key(node.name))
+        print(f"  ✓ {node.output}")
+
+    def _execute(self, name, results):
+        node = self.nodes[name]
+        inputs = [results[dep] for dep in node.deps]
+        with stage(STAGES[node.op], name) as event:
+            if node.op not in OUTPUT_OPS:
+                return self._render(node, inputs)
+            os.makedirs(os.path.dirname(node.output) or '.', exist_ok=True)
+            self._write(node, inputs)
+            event["bytes"] = os.path.getsize(node.output)
+
+    def run(self, order, workers=None, keep=()):
+        """
+        执行 order 中的节点：依赖全部完成的节点立即提交到线程池
+
+        中间结果在最后一个下游节点完成后释放，keep 中的节点除外；返回 {keep 中的节点: 结果}。
+        任一节点失败时抛出异常。
+        """
+        planned = set(order)
+        waiting = {name: len(self.nodes[name].deps) for name in order}
+        users = {name: 0 for name in order}
+        children = {name: [] for name in order}
+        for name in order:
+            for dep in self.nodes[name].deps:
+                users[dep] += 1
+                children[dep].append(name)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=workers or default_workers()) as pool:
+            running = {}
+
+            def submit(name):
+                running[pool.submit(self._execute, name, results)] = name
+
+            for name in order:
+                if not waiting[name]:
+                    submit(name)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    for dep in self.nodes[name].deps:
+                        users[dep] -= 1
+                        if not users[dep] and dep not in keep:
+                            results.pop(dep, None)
+                    for child in children[name]:
+                        waiting[child] -= 1
+                        if not waiting[child] and child in planned:
+                            submit(child)
+        return {name: results[name] for name in keep if name in results}
+
+
+def build(spec_path=SPEC_FILE, only=None, force=False, workers=None, report=REPORT_FILE, profile=None,
+          state=None, verbose=True, variants=True, themes=None):
+    """
+    按规格生成资源，返回是否全部在体积预算之内
+
+    only 为 --only 模式列表；force=True 时忽略增量缓存。
+    themes 为主题名列表时生成所选输出在这些主题下的版本（见 with_themes）。
+    report 为 JSON 性能报告路径（None 不写出），profile 为 cProfile 数据路径（None 不采样）。
+    state 为跨次构建保留的内存状态（assetkit/watch.py 的 WarmState），由它创建调度图；
+    verbose=False 时不逐个列出跳过的输出，也不打印阶段汇总；variants=False 时只写 PNG，
+    不生成 WebP / AVIF 变体，这些 PNG 也不记入增量缓存，下次完整构建时重新生成。
+    """
+    with Profiler(cprofile=bool(profile)) as profiler:
+        with stage('plan'):
+            nodes = load_spec(spec_path)
+            targets = select(nodes, only)
+            if themes:
+                nodes, targets = with_themes(nodes, targets, themes)
+
+            cache = BuildCache(enabled=not force)
+            # 字节相同的输出只写一次；同时与 public/logo 中已有文件比对
+            store = OutputStore(seed_dirs=[LOGO_DIR])
+            encoder = PngEncoder(store=store)
+            writer = VariantWriter(store=store) if variants else None
+            graph = (state.graph if state else AssetGraph)(nodes, cache, encoder, writer)
+            order, skipped = graph.plan(targets)
+
+        workers = workers or default_workers()
+        profiler.meta.update(spec=spec_path, only=only, themes=themes, force=force, workers=workers,
+                             targets=len(targets), executed=len(order), skipped=len(skipped))
+        if verbose:
+            for name in skipped:
+                print(f"  · {nodes[name].output} (未变化，跳过)")
+        elif skipped:
+            print(f"  · {len(skipped)} 个输出未变化，跳过")
+        if order:
+            print(f"\n🔧 执行 {len(order)} 个节点（{len([n for n in order if nodes[n].op in OUTPUT_OPS])} 个输出）...")
+            graph.run(order, workers)
+
+        if writer:
+            writer.finish()
+        cache.save()
+
+    store.report()
+    ok = encoder.report()
+    if verbose:
+        profiler.print_summary()
+    if report:
+        profiler.write(report)
+        print(f"  📊 性能报告: {report}")
+    if profile and profiler.dump_profile(profile):
+        print(f"  🔥 cProfile 数据: {profile}（可用 snakeviz / flameprof 查看）")
+    return ok
@@ -0,0 +1,213 @@
+"""
+资源构建的分阶段性能记录
+
+每个阶段（绘制、字体加载、缩放、着色、PNG 编码、WebP / AVIF 变体……）记录：
+  wall       墙钟时间（含嵌套的子阶段）；self_wall 为扣除子阶段后的时间
+  cpu        当前线程的 CPU 时间（time.thread_time，线程池中各自计算）；self_cpu 同理
+  peak_rss   阶段结束时进程的峰值 RSS；rss_growth 为该阶段把峰值推高了多少
+  bytes      输出字节数（编码类阶段）
+
+代码中通过模块级的 stage() 打点，没有激活的 Profiler 时不做任何事。
+报告以 JSON 写出，可按时间保存以追踪回归；cprofile=True 时同时收集 cProfile 数据
+（每个线程的顶层阶段单独采样后合并），dump 文件可用 snakeviz / flameprof 生成火焰图。
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+
+import PIL
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+REPORT_FILE = '.asset-cache/build-report.json'
+
+_active = None
+_local = threading.local()
+
+
+def peak_rss():
+    """进程峰值 RSS（字节）；不支持的平台返回 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+class Profiler:
+    """收集阶段事件；作为上下文管理器使用时成为当前激活的 Profiler"""
+
+    def __init__(self, cprofile=False):
+        self.events = []
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._lock = threading.Lock()
+        self.stats = None
+        self.cprofile = cprofile
+        self.meta = {}
+
+    def __enter__(self):
+        global _active
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self._previous
+        self.wall = time.perf_counter() - self._start
+        self.cpu = time.process_time() - self._cpu_start
+
+    @contextlib.contextmanager
+    def stage(self, name, asset=None):
+        """
+        记录一个阶段；yield 的事件字典可由调用方补充 bytes 等字段
+
+        嵌套阶段未指定 asset 时归属外层阶段的资源（如 PNG 编码内部的量化）。
+        """
+        stack = _stack()
+        if asset is None and stack:
+            asset = stack[-1]["asset"]
+        event = {"stage": name, "asset": asset, "bytes": None,
+                 "parent": stack[-1]["stage"] if stack else None, "_children": 0.0, "_children_cpu": 0.0}
+        # 每个线程只在顶层阶段采样（同一线程不能同时运行两个 cProfile）
+        profile = cProfile.Profile() if self.cprofile and not stack else None
+        stack.append(event)
+        peak_before = peak_rss()
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        if profile:
+            profile.enable()
+        try:
+            yield event
+        finally:
+            if profile:
+                profile.disable()
+            wall = time.perf_counter() - start
+            cpu = time.thread_time() - cpu_start
+            peak = peak_rss()
+            stack.pop()
+            event.update(
+                start=start - self._start,
+                wall=wall,
+                self_wall=wall - event.pop("_children"),
+                cpu=cpu,
+                self_cpu=cpu - event.pop("_children_cpu"),
+                peak_rss=peak,
+                rss_growth=peak - peak_before if peak is not None else None,
+            )
+            if stack:
+                stack[-1]["_children"] += wall
+                stack[-1]["_children_cpu"] += cpu
+            with self._lock:
+                self.events.append(event)
+                if profile:
+                    if self.stats is None:
+                        self.stats = pstats.Stats(profile)
+                    else:
+                        self.stats.add(profile)
+
+    # ---- 汇总 ----
+
+    def stages(self):
+        """按阶段汇总：次数、墙钟 / CPU（含与不含子阶段）、输出字节、最大峰值推高量"""
+        summary = {}
+        for event in self.events:
+            entry = summary.setdefault(event["stage"], {
+                "count": 0, "wall": 0.0, "self_wall": 0.0, "cpu": 0.0, "self_cpu": 0.0, "bytes": 0, "rss_growth": 0,
+            })
+            entry["count"] += 1
+            entry["wall"] += event["wall"]
+            entry["self_wall"] += event["self_wall"]
+            entry["cpu"] += event["cpu"]
+            entry["self_cpu"] += event["self_cpu"]
+            entry["bytes"] += event["bytes"] or 0
+            entry["rss_growth"] = max(entry["rss_growth"], event["rss_growth"] or 0)
+        return summary
+
+    def assets(self):
+        """按资源（节点 / 输出路径）汇总各阶段的自身耗时"""
+        summary = {}
+        for event in self.events:
+            if event["asset"] is None:
+                continue
+            entry = summary.setdefault(event["asset"], {"wall": 0.0, "cpu": 0.0, "bytes": 0, "stages": {}})
+            entry["wall"] += event["self_wall"]
+            entry["cpu"] += event["self_cpu"]
+            entry["bytes"] += event["bytes"] or 0
+            entry["stages"][event["stage"]] = entry["stages"].get(event["stage"], 0.0) + event["self_wall"]
+        return summary
+
+    def report(self):
+        return {
+            "started_at": time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started_at)),
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            **self.meta,
+            "wall": getattr(self, 'wall', time.perf_counter() - self._start),
+            "cpu": getattr(self, 'cpu', time.process_time() - self._cpu_start),
+            "peak_rss": peak_rss(),
+            "stages": self.stages(),
+            "assets": self.assets(),
+            "events": sorted(self.events, key=lambda event: event["start"]),
+        }
+
+    def write(self, path=REPORT_FILE):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def dump_profile(self, path):
+        """写出合并后的 cProfile 数据（pstats 格式）；没有采样时返回 False"""
+        if self.stats is None:
+            return False
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.stats.dump_stats(path)
+        return True
+
+    def print_summary(self, top=5):
+        stages = self.stages()
+        if not stages:
+            return
+        report = self.report()
+        print("\n⏱️  阶段耗时（自身墙钟 / CPU）:")
+        for name, entry in sorted(stages.items(), key=lambda item: -item[1]["self_wall"]):
+            size = f"  {entry['bytes'] / 1024:8.1f}KB" if entry["bytes"] else ""
+            print(f"  {name:<12} ×{entry['count']:<4} {entry['self_wall'] * 1000:9.1f}ms  "
+                  f"CPU {entry['self_cpu'] * 1000:9.1f}ms{size}")
+        slowest = sorted(self.assets().items(), key=lambda item: -item[1]["wall"])[:top]
+        if slowest:
+            print(f"  最慢的 {len(slowest)} 个资源:")
+            for asset, entry in slowest:
+                print(f"    {asset}: {entry['wall'] * 1000:.1f}ms")
+        rss = f"，峰值 RSS {report['peak_rss'] / 1024 / 1024:.0f}MB" if report["peak_rss"] else ""
+        print(f"  总计 {report['wall']:.2f}s 墙钟，{report['cpu']:.2f}s CPU{rss}")
+
+
+@contextlib.contextmanager
+def stage(name, asset=None):
+    """在当前激活的 Profiler 中记录一个阶段；未激活时只返回一个空字典"""
+    if _active is None:
+        yield {}
+        return
+    with _active.stage(name, asset) as event:
+        yield event
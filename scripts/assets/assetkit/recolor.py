@@ -0,0 +1,48 @@
+"""
+整图重新着色
+
+把任意 RGBA 图片的所有可见像素替换为同一目标颜色，保留原始透明度通道。
+通过 Pillow 的通道查找表（point LUT）一次处理整块缓冲区，不逐像素遍历。
+"""
+
+from PIL import Image, ImageColor
+
+from assetkit.memory import DEFAULT_STRIP_BYTES, strips
+
+# 常用目标颜色
+WHITE = (255, 255, 255)
+
+
+def parse_color(color):
+    """把 '#RRGGBB' / 颜色名 / RGB(A) 元组统一解析为 RGB 元组"""
+    if isinstance(color, str):
+        color = ImageColor.getrgb(color)
+    return tuple(int(c) for c in color[:3])
+
+
+def recolor(img, color=WHITE):
+    """
+    将图片重新着色为单一颜色，保留透明度
+
+    与原逐像素实现完全一致：alpha > 0 的像素变为 (color, alpha)，
+    完全透明的像素为 (0, 0, 0, 0)。
+    """
+    rgba = img if img.mode == 'RGBA' else img.convert('RGBA')
+    alpha = rgba.getchannel('A')
+
+    # 每个颜色通道都由 alpha 经查找表直接得到：0 -> 0，其余 -> 目标值
+    bands = [alpha.point([0] + [value] * 255) for value in parse_color(color)]
+    return Image.merge('RGBA', (*bands, alpha))
+
+
+def recolor_strips(img, color=WHITE, budget=DEFAULT_STRIP_BYTES):
+    """
+    逐条着色（用于超大原图），结果与 recolor() 完全一致
+
+    源图保持原始模式（如调色板 PNG 每像素 1 字节），每个条带单独转换为 RGBA 后着色，
+    中间缓冲区只有条带大小；budget 为每个条带的字节预算。
+    """
+    out = Image.new('RGBA', img.size)
+    for y0, y1 in strips(img.size, 'RGBA', budget):
+        out.paste(recolor(img.crop((0, y0, img.width, y1)), color), (0, y0))
+    return out
@@ -0,0 +1,134 @@
+"""
+金字塔缩放链
+
+图标脚本需要从同一张母版得到十几个尺寸。逐个从母版做 Lanczos 会重复处理
+整张大图，且有重复尺寸。这里先对目标尺寸去重，再建立 512→256→128→… 的
+金字塔层级，每个层级和其余尺寸都从不小于目标 min_ratio 倍的最小已有层级缩放，
+每个结果只计算一次并复用。
+"""
+
+from PIL import Image
+
+from assetkit.memory import DEFAULT_STRIP_BYTES, convert_strips, image_bytes, source_rows
+from assetkit.metrics import image_diff
+
+LANCZOS = Image.Resampling.LANCZOS
+
+# 相对于直接从母版 Lanczos 缩放的默认容差（平均通道差，0-255）
+DEFAULT_TOLERANCE = 2.5
+
+
+def _as_size(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+def plan_resizes(master_size, sizes, min_ratio=4.0):
+    """
+    生成缩放计划
+
+    返回按执行顺序排列的 [(目标尺寸, 来源尺寸), ...]：先是逐级减半的金字塔层级，
+    再是其余目标尺寸。来源尺寸等于 master_size 表示直接从母版缩放。
+    """
+    master_size = _as_size(master_size)
+    targets = sorted({_as_size(s) for s in sizes} - {master_size}, reverse=True)
+    if not targets:
+        return []
+
+    smallest = min(min(t) for t in targets)
+
+    # 金字塔层级：只要还能整除并且下一级仍然用得上，就继续减半
+    levels = [master_size]
+    while True:
+        w, h = levels[-1]
+        if w % 2 or h % 2 or min(w, h) // 2 < smallest:
+            break
+        levels.append((w // 2, h // 2))
+
+    def source_for(target, available):
+        # 选择满足比例要求的最小层级；逐级 2 倍缩放会累积误差，默认要求 4 倍余量
+        candidates = [lv for lv in available
+                      if lv[0] >= target[0] * min_ratio and lv[1] >= target[1] * min_ratio]
+        return min(candidates) if candidates else master_size
+
+    steps = [(level, source_for(level, levels[:i])) for i, level in enumerate(levels) if i]
+
+    for target in targets:
+        if target not in levels:
+            steps.append((target, source_for(target, levels)))
+
+    return steps
+
+
+class Resizer:
+    """按缩放计划生成并缓存各尺寸图片"""
+
+    def __init__(self, master, sizes, min_ratio=4.0, use_reduce=False):
+        """
+        use_reduce=True 时金字塔减半使用 Image.reduce(2)（盒式滤波，更快但更软），
+        默认仍用 Lanczos 以保证和直接缩放的结果视觉一致。
+        """
+        self.master = master
+        self.use_reduce = use_reduce
+        self.plan = plan_resizes(master.size, sizes, min_ratio)
+        self.images = {master.size: master}
+        self._pending = dict(self.plan)
+
+    def get(self, size):
+        """获取指定尺寸的图片（按需执行计划中依赖的步骤）"""
+        size = _as_size(size)
+        if size in self.images:
+            return self.images[size]
+
+        source_size = self._pending.get(size, self.master.size)
+        source = self.get(source_size)
+
+        if self.use_reduce and source_size == (size[0] * 2, size[1] * 2):
+            image = source.reduce(2)
+        else:
+            image = source.resize(size, LANCZOS)
+
+        self.images[size] = image
+        return image
+
+
+def resize_strips(img, size, mode='RGBA', budget=DEFAULT_STRIP_BYTES):
+    """
+    按输出条带逐段 Lanczos 缩放（用于超大原图）
+
+    每段只裁出滤波需要的源图行并在该段内转换模式，整图的 RGBA 副本不会出现在内存中。
+    结果与 img.convert(mode).resize(size) 几乎一致（条带边界处浮点误差，最大差 ≤ 2）。
+    """
+    size = _as_size(size)
+    if size == img.size:
+        return convert_strips(img, mode, budget)
+    scale = img.height / size[1]
+    out = Image.new(mode, size)
+    # 每个输出行大约读取 scale 个源图行，按源图转换后的大小计算每段输出行数
+    rows = max(1, int(budget / (max(scale, 1.0) * image_bytes((img.width, 1), mode))))
+    for oy0 in range(0, size[1], rows):
+        oy1 = min(size[1], oy0 + rows)
+        y0, y1 = source_rows(oy0, oy1, scale, img.height)
+        part = img.crop((0, y0, img.width, y1))
+        if part.mode != mode:
+            part = part.convert(mode)
+        box = (0, oy0 * scale - y0, img.width, oy1 * scale - y0)
+        out.paste(part.resize((size[0], oy1 - oy0), LANCZOS, box=box), (0, oy0))
+    return out
+
+
+def check_resizer(resizer, tolerance=DEFAULT_TOLERANCE):
+    """
+    质量检查：将计划中每个尺寸与直接从母版 Lanczos 缩放的结果比较
+
+    返回 {尺寸: 差异}；任一尺寸平均差超过容差时抛出 ValueError。
+    """
+    report = {}
+    for size, _ in resizer.plan:
+        direct = resizer.master.resize(size, LANCZOS)
+        report[size] = image_diff(resizer.get(size), direct)
+
+    failed = {size: diff for size, diff in report.items() if diff['mean'] > tolerance}
+    if failed:
+        details = ', '.join(f"{w}x{h}: {d['mean']:.2f}" for (w, h), d in failed.items())
+        raise ValueError(f"缩放链超出容差 {tolerance}: {details}")
+    return report
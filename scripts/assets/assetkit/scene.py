@@ -0,0 +1,270 @@
+"""
+场景图：用相对坐标描述图标，按任意尺寸直接绘制
+
+图标由若干图层组成，每个图层是一组图形（矩形、圆角矩形、椭圆、多边形、文字）。
+坐标、半径、线宽和字号都以画布边长为 1 归一化保存；为了方便对照设计稿，
+构造时可以用设计稿像素给出，再用 unit（如 512）换算。颜色写品牌色名称（如 "primary"），
+绘制时从调色板解析，也可以直接写 RGB(A) 元组或 "#RRGGBB"。
+
+绘制时同一图层的图形共用一个 ImageDraw 依次画在同一张画布上（与原脚本的绘制语义一致：
+半透明填充会替换而不是混合下层像素）。同一尺寸第二次绘制起，每画完一个图层就把画布快照缓存起来，
+键为（尺寸、前 N 个图层用到的颜色）：再次绘制时直接从最长的已缓存前缀继续，
+只修改后面图层的颜色（主题、watch 模式）时前面的图层也不用重画。
+一次性构建中每个尺寸只画一次，快照（1024px 一张约 3ms）不会被用到，所以第一次绘制不做快照。
+
+render(size, palette, supersample=N) 在 N 倍画布上绘制图形后用 Image.reduce 缩小（见 assetkit/supersample.py），
+图形边缘得到抗锯齿。几何量先按输出尺寸换算（含取整），再放大到 N 倍画布，只有边缘的覆盖率不同。
+最上面只含文字的图层在缩小之后按输出分辨率绘制：FreeType 本身已做抗锯齿，放大绘制反而丢掉字形微调。
+
+同一尺寸换一套颜色再次绘制（多个主题、watch 模式改色）时，文字之下的图形图层不再重画：
+第一次换色时按颜色槽把几何栅格化为覆盖率（assetkit/coverage.py），之后每套颜色只在输出分辨率上着色，
+结果与直接绘制逐像素一致。一次性构建中每个尺寸只画一次，直接绘制更便宜，所以第一次绘制不生成覆盖率。
+
+场景对象可在线程间共享。
+"""
+
+from PIL import Image, ImageColor, ImageDraw
+from collections import OrderedDict
+import functools
+import hashlib
+import inspect
+import json
+import threading
+
+from assetkit.coverage import MAX_SLOTS, Coverage
+from assetkit.fonts import get_font
+from assetkit.memory import MB, image_bytes
+from assetkit.profiling import stage
+from assetkit.supersample import check_factor, reduce, scale_box, scale_points
+
+# 每个场景缓存的图层快照总字节数上限（1024px 的 RGBA 快照约 4MB，4 倍超采样的 512px 约 16MB）
+CACHE_BYTES = 256 * MB
+
+# 长度换算为像素后向下取整时的容差，避免 0.0125 * 400 = 4.999… 这类浮点误差
+EPSILON = 1e-9
+
+# 图形栅格化代码所在的文件：修改其中任何一个都会改变绘制结果，计入构建缓存和 OG 底图缓存的指纹
+RASTER_MODULES = [__file__, inspect.getfile(Coverage), inspect.getfile(reduce)]
+
+
+class Shape:
+    """
+    场景中的一个图形
+
+    kind: rect / rounded / ellipse / polygon / text
+    xy: 矩形类为 (x0, y0, x1, y1)，多边形为 [(x, y), ...]；文字见 Text
+    fill / outline: 颜色名称、RGB(A) 元组或颜色字符串
+    radius / width: 圆角半径、描边宽度（相对长度）；min_width 为描边的最小像素宽度（按输出像素计）
+    """
+
+    def __init__(self, kind, xy, fill=None, outline=None, width=0, min_width=0, radius=0):
+        self.kind = kind
+        self.xy = xy
+        self.fill = fill
+        self.outline = outline
+        self.width = width
+        self.min_width = min_width
+        self.radius = radius
+
+    def scaled(self, factor):
+        """所有长度乘以 factor 的副本（设计稿像素 → 归一化坐标）"""
+        if self.kind == 'polygon':
+            xy = [(x * factor, y * factor) for x, y in self.xy]
+        else:
+            xy = tuple(v * factor for v in self.xy)
+        return Shape(self.kind, xy, self.fill, self.outline, self.width * factor, self.min_width,
+                     self.radius * factor)
+
+    def colors(self):
+        return [color for color in (self.fill, self.outline) if color is not None]
+
+    def spec(self):
+        return [self.kind, self.xy, self.fill, self.outline, self.width, self.min_width, self.radius]
+
+    def draw(self, draw, size, colors, factor=1):
+        """按输出尺寸 size 换算后绘制到 factor 倍的画布上"""
+        fill = colors.get(self.fill, self.fill)
+        outline = colors.get(self.outline, self.outline)
+        if self.kind == 'polygon':
+            draw.polygon(scale_points([(x * size, y * size) for x, y in self.xy], factor), fill=fill)
+            return
+        box = scale_box([v * size for v in self.xy], factor)
+        if self.kind == 'rect':
+            draw.rectangle(box, fill=fill)
+        elif self.kind == 'rounded':
+            draw.rounded_rectangle(box, radius=_floor(self.radius * size) * factor, fill=fill)
+        elif self.kind == 'ellipse':
+            width = max(self.min_width, _floor(self.width * size)) if outline is not None else 0
+            draw.ellipse(box, fill=fill, outline=outline, width=width * factor)
+        else:
+            raise ValueError(f"未知的图形类型: {self.kind}")
+
+
+class Text(Shape):
+    """
+    文字：x / y 为左上角坐标，写 'center' 时按文字边界框在该方向居中（取整到像素）；
+    shift 为居中后再加的偏移，min_shift 为偏移的最小像素值（按输出像素计，用于阴影）；
+    font_size 为相对字号（换算后向下取整为像素）。
+    """
+
+    def __init__(self, text, font_size, x, y, fill, shift=(0, 0), min_shift=0):
+        super().__init__('text', (), fill)
+        self.text = text
+        self.font_size = font_size
+        self.x = x
+        self.y = y
+        self.shift = shift
+        self.min_shift = min_shift
+
+    def scaled(self, factor):
+        scale = lambda v: v if v == 'center' else v * factor  # noqa: E731
+        return Text(self.text, self.font_size * factor, scale(self.x), scale(self.y), self.fill,
+                    (self.shift[0] * factor, self.shift[1] * factor), self.min_shift)
+
+    def spec(self):
+        return ['text', self.text, self.font_size, self.x, self.y, self.fill, self.shift, self.min_shift]
+
+    def draw(self, draw, size, colors, factor=1):
+        font_size = _floor(self.font_size * size)
+        width, height = _text_size(self.text, get_font(font_size))
+        x = (size - width) // 2 if self.x == 'center' else self.x * size
+        y = (size - height) // 2 if self.y == 'center' else self.y * size
+        dx, dy = (self._shift(v, size) for v in self.shift)
+        draw.text(((x + dx) * factor, (y + dy) * factor), self.text, fill=colors.get(self.fill, self.fill),
+                  font=get_font(font_size * factor))
+
+    def _shift(self, value, size):
+        return max(self.min_shift, _floor(value * size)) if value else 0
+
+
+def _floor(value):
+    return int(value + EPSILON)
+
+
+@functools.lru_cache(maxsize=256)
+def _text_size(text, font):
+    """文字边界框的宽高（阴影和正文共用同一次测量；字体对象由 get_font 缓存，可作为键）"""
+    left, top, right, bottom = font.getbbox(text)
+    return right - left, bottom - top
+
+
+def resolve_colors(names, palette):
+    """颜色名称 → RGB(A) 元组；不在调色板中的值原样交给 Pillow"""
+    colors = {}
+    for name in names:
+        if isinstance(name, str) and name in palette:
+            value = palette[name]
+            colors[name] = ImageColor.getrgb(value) if isinstance(value, str) else tuple(value)
+    return colors
+
+
+class Scene:
+    """按图层组织的图形列表；render(size, palette) 按尺寸直接绘制"""
+
+    def __init__(self, layers, unit=1):
+        """layers: [(图层名, [Shape, ...]), ...]，从下到上；unit 为坐标所用的设计稿边长"""
+        self.layers = [(name, [shape.scaled(1 / unit) for shape in shapes]) for name, shapes in layers]
+        payload = json.dumps([[name, [shape.spec() for shape in shapes]] for name, shapes in self.layers],
+                             ensure_ascii=False, default=str)
+        self.key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        self._names = {color for _, shapes in self.layers for shape in shapes for color in shape.colors()}
+        # 从这个图层起只有文字，超采样时在缩小之后绘制
+        self._text_from = len(self.layers)
+        while self._text_from and all(isinstance(shape, Text) for shape in self.layers[self._text_from - 1][1]):
+            self._text_from -= 1
+        # 文字之下的图形图层可以由覆盖率着色：每种颜色一个槽（文字与图形交错时不支持）
+        self._slots = {}
+        for _, shapes in self.layers[:self._text_from]:
+            for shape in shapes:
+                for color in shape.colors():
+                    self._slots.setdefault(color, len(self._slots) + 1)
+        shapes_only = not any(isinstance(shape, Text)
+                              for _, shapes in self.layers[:self._text_from] for shape in shapes)
+        self._painted = self._text_from if shapes_only and len(self._slots) <= MAX_SLOTS else 0
+        self._coverages = {}
+        self._coverage_locks = {}
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def _prefix_keys(self, scale, colors):
+        """每个图层前缀的缓存键：(尺寸, 超采样倍数) + 前缀内用到的颜色"""
+        keys, used = [], {}
+        for name, shapes in self.layers:
+            for shape in shapes:
+                for color in shape.colors():
+                    used[str(color)] = colors.get(color, color)
+            keys.append((scale, tuple(sorted(used.items()))))
+        return keys
+
+    def render(self, size, palette=None, supersample=1):
+        """绘制 size × size 的 RGBA 图片；supersample > 1 时在 N 倍画布上绘制后缩小（抗锯齿）"""
+        factor = check_factor(supersample)
+        colors = resolve_colors(self._names, palette or {})
+        keys = self._prefix_keys((size, factor), colors)
+
+        start, canvas = 0, None
+        with self._lock:
+            snapshot = (size, factor) in self._seen
+            self._seen.add((size, factor))
+            for i in range(len(keys), 0, -1):
+                cached = self._cache.get((i, keys[i - 1]))
+                if cached is not None:
+                    self._cache.move_to_end((i, keys[i - 1]))
+                    start, canvas = i, cached.copy()
+                    break
+        if snapshot and start < self._painted:
+            # 同一尺寸换色再次绘制：图形图层由覆盖率着色（已是输出尺寸），只画后面的文字
+            canvas = self._coverage(size, factor).paint([colors.get(color, color) for color in self._slots])
+            start = self._painted
+            self._store((start, keys[start - 1]), canvas.copy())
+        elif canvas is None:
+            canvas = Image.new('RGBA', (size * factor, size * factor), (0, 0, 0, 0))
+
+        # 快照的分辨率：文字图层之前为 N 倍画布，之后为输出尺寸
+        draw = ImageDraw.Draw(canvas)
+        for i in range(start, len(self.layers)):
+            if i == self._text_from and canvas.width != size:
+                canvas = reduce(canvas, factor)
+                draw = ImageDraw.Draw(canvas)
+            scale = factor if canvas.width != size else 1
+            for shape in self.layers[i][1]:
+                shape.draw(draw, size, colors, scale)
+            if snapshot:
+                self._store((i + 1, keys[i]), canvas.copy())
+        return reduce(canvas, factor) if canvas.width != size else canvas
+
+    def _coverage(self, size, factor):
+        """图形图层的覆盖率（每个尺寸、倍数只栅格化一次，并发调用时其余线程等待）"""
+        with self._lock:
+            lock = self._coverage_locks.setdefault((size, factor), threading.Lock())
+        with lock:
+            coverage = self._coverages.get((size, factor))
+            if coverage is None:
+                with stage('coverage') as event:
+                    event["factor"] = factor
+                    labels = Image.new('L', (size * factor, size * factor), 0)
+                    draw = ImageDraw.Draw(labels)
+                    for _, shapes in self.layers[:self._painted]:
+                        for shape in shapes:
+                            shape.draw(draw, size, self._slots, factor)
+                    coverage = self._coverages[(size, factor)] = Coverage(labels, factor)
+        return coverage
+
+    def _store(self, key, image):
+        with self._lock:
+            if key in self._cache:
+                self._cache_bytes -= image_bytes(self._cache.pop(key).size)
+            self._cache[key] = image
+            self._cache_bytes += image_bytes(image.size)
+            while self._cache_bytes > CACHE_BYTES:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= image_bytes(evicted.size)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+            self._seen.clear()
+            self._coverages.clear()
@@ -0,0 +1,53 @@
+"""
+批量图片输入
+
+缩略图生成、内容仓库导入等批处理脚本共用的输入格式：
+  目录   — 递归查找图片，key 为去掉后缀的相对路径
+  .jsonl — 每行 {"key"?, "path", "source"?}，key 缺省时取文件名
+  .txt   — 每行一个图片路径
+清单中的相对路径相对于清单文件所在目录。
+"""
+
+import json
+import os
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.avif')
+
+
+def iter_records(source):
+    """逐条产出 {"key", "path", "source"}，不一次性列出整个目录"""
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(SOURCE_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    key = os.path.splitext(os.path.relpath(path, source))[0].replace(os.sep, '/')
+                    yield {"key": key, "path": path, "source": path}
+        return
+
+    base = os.path.dirname(source)
+    with open(source, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if source.endswith('.jsonl'):
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{source}:{line_no} 不是合法的 JSON: {e}")
+            else:
+                record = {"path": line}
+            path = os.path.join(base, record["path"])
+            yield {
+                "key": record.get("key") or os.path.splitext(os.path.basename(path))[0],
+                "path": path,
+                "source": record.get("source") or path,
+            }
+
+
+def iter_sources(source):
+    """逐个产出 (key, 路径)"""
+    for record in iter_records(source):
+        yield record["key"], record["path"]
@@ -0,0 +1,97 @@
+"""
+超采样抗锯齿
+
+ImageDraw 的 ellipse / rounded_rectangle / polygon 不做抗锯齿，只有文字经过 FreeType 平滑。
+这里按 N 倍分辨率绘制同一组图形，再用 Image.reduce(N) 一次缩小：每个输出像素是 N×N 个
+子像素的平均值，即边缘覆盖率。RGBA 图片由 Pillow 在预乘 alpha 下平均，透明像素的 RGB
+不会渗到边缘。N=1 时不做任何额外工作，结果与直接绘制逐像素一致。
+
+代价随 N² 增长：N 倍画布占用 (w·N)·(h·N)·4 字节，RGBA 缩小时还要一份同样大小的预乘副本，
+绘制时间也大致按面积增加。每个资源的倍数在 asset-spec.json 的 render 节点中用
+"kwargs": {"supersample": N} 单独设置，用 benchmark-supersample.py 选出满足质量阈值的最小倍数。
+"""
+
+from PIL import Image
+
+from assetkit.memory import image_bytes
+from assetkit.profiling import stage
+
+# 超采样倍数上限（8 倍时 1200×630 的画布约 190MB）
+MAX_FACTOR = 8
+
+
+def check_factor(factor):
+    if not isinstance(factor, int) or isinstance(factor, bool) or not 1 <= factor <= MAX_FACTOR:
+        raise ValueError(f"超采样倍数必须是 1-{MAX_FACTOR} 的整数: {factor!r}")
+    return factor
+
+
+def buffer_bytes(size, factor, mode='RGBA'):
+    """N 倍画布及缩小时的预乘副本占用的字节数"""
+    if factor == 1:
+        return 0
+    w, h = size
+    canvas = image_bytes((w * factor, h * factor), mode)
+    return canvas * 2 if mode in ('RGBA', 'LA') else canvas
+
+
+def new_canvas(mode, size, color, factor):
+    """N 倍分辨率的画布"""
+    w, h = size
+    return Image.new(mode, (w * factor, h * factor), color)
+
+
+def scale_box(box, factor):
+    """
+    输出像素坐标的 [x0, y0, x1, y1] → N 倍画布坐标
+
+    ImageDraw 的矩形、椭圆包含 x1、y1 所在的像素，这里让 N 倍画布上的图形覆盖同样的输出像素区域
+    （x1 → (x1 + 1)·N - 1），否则图形会随 N 变化多出 1/N 个像素，不同倍数的结果收敛不到一起。
+    """
+    x0, y0, x1, y1 = box
+    return [x0 * factor, y0 * factor, (x1 + 1) * factor - 1, (y1 + 1) * factor - 1]
+
+
+def scale_points(points, factor):
+    """多边形顶点：按像素中心对齐换算"""
+    offset = (factor - 1) / 2
+    return [(x * factor + offset, y * factor + offset) for x, y in points]
+
+
+def reduce(img, factor):
+    """N 倍画布缩小为最终尺寸（N×N 子像素取平均）"""
+    if factor == 1:
+        return img
+    with stage('supersample') as event:
+        event["factor"] = factor
+        event["buffer"] = buffer_bytes((img.width // factor, img.height // factor), factor, img.mode)
+        return img.reduce(factor)
+
+
+class ScaledDraw:
+    """
+    ImageDraw 包装：命令式绘制代码在 N 倍画布上仍按最终尺寸的坐标调用
+
+    坐标按 scale_box / scale_points 换算，半径和线宽乘以 N。
+    """
+
+    def __init__(self, draw, factor):
+        self.draw = draw
+        self.factor = factor
+
+    def rectangle(self, xy, **kwargs):
+        self.draw.rectangle(scale_box(xy, self.factor), **self._scaled(kwargs))
+
+    def rounded_rectangle(self, xy, radius=0, **kwargs):
+        self.draw.rounded_rectangle(scale_box(xy, self.factor), radius=radius * self.factor, **self._scaled(kwargs))
+
+    def ellipse(self, xy, **kwargs):
+        self.draw.ellipse(scale_box(xy, self.factor), **self._scaled(kwargs))
+
+    def polygon(self, xy, **kwargs):
+        self.draw.polygon(scale_points(xy, self.factor), **self._scaled(kwargs))
+
+    def _scaled(self, kwargs):
+        if kwargs.get('width'):
+            kwargs = {**kwargs, 'width': kwargs['width'] * self.factor}
+        return kwargs
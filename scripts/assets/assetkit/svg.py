@@ -0,0 +1,149 @@
+"""
+SVG 矢量渲染后端
+
+public/logo/logo-rungame.svg 直接按每个目标尺寸光栅化，而不是先画 512/1024 的位图
+再 Lanczos 缩到 16px：小尺寸边缘更锐利，大尺寸也不需要先画一张更大的母版。
+
+后端按顺序选择第一个可用的（都是可选依赖）：
+  cairosvg      pip3 install cairosvg（需要系统 Cairo 库）
+  resvg         pip3 install resvg-py（自带渲染器，无系统依赖）
+  rsvg-convert  librsvg 命令行工具（brew install librsvg / apt install librsvg2-bin）
+
+单色版本（如白色 Logo）通过替换 SVG 中的填充色得到，而不是对 PNG 逐像素着色；
+同一份 SVG、后端和尺寸的渲染结果缓存在 .asset-cache/svg/ 下。
+"""
+
+from PIL import Image
+import functools
+import hashlib
+import importlib.util
+import io
+import os
+import re
+import shutil
+import subprocess
+
+from assetkit.parallel import run_pool
+
+BACKENDS = ("cairosvg", "resvg", "rsvg-convert")
+
+CACHE_DIR = '.asset-cache/svg'
+
+# 需要替换为目标颜色的绘制属性（属性形式和 CSS 声明形式都处理）
+PAINT_PROPERTIES = ("fill", "stroke", "stop-color")
+
+_PAINT_ATTR = re.compile(r'\b(%s)="(?!none")[^"]*"' % "|".join(PAINT_PROPERTIES))
+_PAINT_CSS = re.compile(r'\b(%s)\s*:\s*(?!none\b)[^;}"]+' % "|".join(PAINT_PROPERTIES))
+_FILTER_ATTR = re.compile(r'\sfilter="[^"]*"')
+_FILTER_CSS = re.compile(r'\bfilter\s*:\s*[^;}"]+;?')
+
+
+def _backend_available(name):
+    if name == "cairosvg":
+        return importlib.util.find_spec("cairosvg") is not None
+    if name == "resvg":
+        return importlib.util.find_spec("resvg_py") is not None
+    if name == "rsvg-convert":
+        return shutil.which("rsvg-convert") is not None
+    raise ValueError(f"未知的 SVG 后端: {name}")
+
+
+def available_backends():
+    return [name for name in BACKENDS if _backend_available(name)]
+
+
+def default_backend():
+    """第一个可用的后端；都不可用时返回 None"""
+    backends = available_backends()
+    return backends[0] if backends else None
+
+
+def _render_png(svg, size, backend):
+    w, h = size
+    if backend == "cairosvg":
+        import cairosvg
+        return cairosvg.svg2png(bytestring=svg.encode('utf-8'), output_width=w, output_height=h)
+    if backend == "resvg":
+        import resvg_py
+        return resvg_py.svg_to_bytes(svg_string=svg, width=w, height=h)
+    if backend == "rsvg-convert":
+        result = subprocess.run(
+            ["rsvg-convert", "--width", str(w), "--height", str(h), "--format", "png"],
+            input=svg.encode('utf-8'), capture_output=True, check=True,
+        )
+        return result.stdout
+    raise ValueError(f"未知的 SVG 后端: {backend}")
+
+
+def _as_size(size):
+    return (size, size) if isinstance(size, int) else tuple(size)
+
+
+@functools.lru_cache(maxsize=None)
+def read_svg(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def substitute_fill(svg, color, drop_filters=True):
+    """
+    把所有非 none 的 fill / stroke / 渐变色标替换为同一颜色，得到单色 SVG
+
+    透明度（opacity、stop-opacity）保持不变。drop_filters=True 时去掉滤镜引用
+    （如投影：单色版本放在深色背景上，投影只会变成一圈光晕），
+    与手工制作的 logo-rungame-white.svg 一致。
+    """
+    svg = _PAINT_ATTR.sub(lambda m: f'{m.group(1)}="{color}"', svg)
+    svg = _PAINT_CSS.sub(lambda m: f'{m.group(1)}: {color}', svg)
+    if drop_filters:
+        svg = _FILTER_ATTR.sub('', svg)
+        svg = _FILTER_CSS.sub('', svg)
+    return svg
+
+
+def cache_path(svg, size, backend, cache_dir=CACHE_DIR):
+    digest = hashlib.sha256(f"{backend}\n{svg}".encode('utf-8')).hexdigest()[:16]
+    w, h = _as_size(size)
+    return os.path.join(cache_dir, f"{digest}-{w}x{h}.png")
+
+
+def rasterize(svg, size, backend=None, cache_dir=CACHE_DIR):
+    """
+    把 SVG 文本按指定尺寸渲染为 RGBA 图片
+
+    cache_dir 为 None 时不读写磁盘缓存。没有可用后端时抛出 RuntimeError。
+    """
+    backend = backend or default_backend()
+    if backend is None:
+        raise RuntimeError("没有可用的 SVG 渲染后端，请安装 cairosvg、resvg-py 或 rsvg-convert")
+    size = _as_size(size)
+
+    path = cache_path(svg, size, backend, cache_dir) if cache_dir else None
+    if path and os.path.exists(path):
+        with Image.open(path) as cached:
+            return cached.convert('RGBA')
+
+    img = Image.open(io.BytesIO(_render_png(svg, size, backend))).convert('RGBA')
+    if img.size != size:
+        raise RuntimeError(f"{backend} 输出尺寸 {img.size} 与请求的 {size} 不一致")
+
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        img.save(tmp_path, 'PNG')
+        os.replace(tmp_path, path)
+    return img
+
+
+def _rasterize_task(task):
+    svg, size, backend, cache_dir = task
+    img = rasterize(svg, size, backend, cache_dir)
+    return img.size, img.tobytes()
+
+
+def rasterize_sizes(svg, sizes, backend=None, workers=None, cache_dir=CACHE_DIR):
+    """并行渲染多个尺寸，返回 {尺寸: 图片}"""
+    backend = backend or default_backend()
+    sizes = [_as_size(size) for size in dict.fromkeys(sizes)]
+    results = run_pool(_rasterize_task, [(svg, size, backend, cache_dir) for size in sizes], workers=workers)
+    return {size: Image.frombytes('RGBA', size, data) for size, data in results}
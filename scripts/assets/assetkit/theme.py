@@ -0,0 +1,176 @@
+"""
+品牌主题：调色板只解析一次，派生色按规则生成
+
+themes.json 定义品牌默认配色和若干变体（深色模式、节日、地区等）。主题可以用 extends
+继承另一个主题，只覆盖部分颜色；颜色写 "#RRGGBB"，或写被继承主题中的颜色名（含派生色），
+如深色模式的 "secondary": "secondary-shadow"。加载时全部解析为 RGB 元组，
+绘制代码直接使用，不再在每次绘制时转换十六进制颜色。
+
+每个基础色 X 自动派生：
+  X-shadow  向黑色混合 SHADOW（阴影、按下态）
+  X-tint    向白色混合 TINT（高光、浅色底）
+  on-X      放在 X 上对比度最高的前景色（白或黑，按 WCAG 相对亮度计算）。
+            generate-white-logo.py 用整图改成白色的办法得到深色背景上的版本，
+            这里给出的是对任意背景都成立的高对比度颜色
+
+批量生成多个主题的资源见 assetkit/pipeline.py 的 build(themes=...)：每个主题的输出写到
+public/themes/<主题名>/ 下，与默认输出的相对路径相同。
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+from assetkit.loader import ASSETS_DIR
+
+THEMES_FILE = os.path.join(ASSETS_DIR, 'themes.json')
+
+# 默认主题：输出写到规格中的原始路径
+DEFAULT_THEME = 'brand'
+
+# 其他主题的输出目录（其下按主题名分目录，保留相对 public/ 的路径）
+THEMES_DIR = 'public/themes'
+
+# 派生色的混合比例
+SHADOW = 0.3
+TINT = 0.3
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+def parse_hex(value):
+    """'#RRGGBB' → RGB 元组"""
+    digits = value.lstrip('#')
+    if len(digits) != 6:
+        raise ValueError(f"颜色必须是 #RRGGBB: {value!r}")
+    return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def mix(color, target, amount):
+    return tuple(round(c + (t - c) * amount) for c, t in zip(color, target))
+
+
+def luminance(color):
+    """WCAG 相对亮度"""
+    channels = [c / 255 for c in color]
+    linear = [c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4 for c in channels]
+    return 0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2]
+
+
+def contrast(a, b):
+    """WCAG 对比度（1-21）"""
+    high, low = sorted((luminance(a), luminance(b)), reverse=True)
+    return (high + 0.05) / (low + 0.05)
+
+
+def derive(colors):
+    """基础色 → 基础色 + 派生色"""
+    derived = dict(colors)
+    for name, color in colors.items():
+        derived[f"{name}-shadow"] = mix(color, BLACK, SHADOW)
+        derived[f"{name}-tint"] = mix(color, WHITE, TINT)
+        derived[f"on-{name}"] = max((WHITE, BLACK), key=lambda fg: contrast(fg, color))
+    return derived
+
+
+class Theme:
+    """解析好的主题：colors 为 {颜色名: RGB 元组}（含派生色），key 为颜色取值的指纹"""
+
+    def __init__(self, name, base, description=''):
+        self.name = name
+        self.description = description
+        self.base = dict(base)
+        self.colors = derive(self.base)
+        payload = json.dumps([name, sorted(self.colors.items())])
+        self.key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def __repr__(self):
+        # 出现在 OG 合成器的图层指纹中（functools.partial 的参数），需要随颜色变化
+        return f"Theme({self.name!r}, {self.key[:16]})"
+
+    def hex(self, name):
+        return '#{:02X}{:02X}{:02X}'.format(*self.colors[name])
+
+    def output_path(self, path):
+        """默认主题的输出路径 → 本主题的输出路径"""
+        if self.name == DEFAULT_THEME:
+            return path
+        relative = os.path.relpath(path, 'public')
+        if relative.startswith('..'):
+            relative = path
+        return os.path.join(THEMES_DIR, self.name, relative)
+
+
+def parse_themes(data):
+    """themes.json 的内容 → {主题名: Theme}"""
+    entries = data['themes']
+    if DEFAULT_THEME not in entries:
+        raise ValueError(f"themes.json 缺少默认主题 {DEFAULT_THEME}")
+    themes = {}
+
+    def resolve(name, stack):
+        if name in themes:
+            return themes[name]
+        if name not in entries:
+            raise ValueError(f"主题不存在: {name}")
+        if name in stack:
+            raise ValueError(f"主题继承成环: {' → '.join(stack + [name])}")
+        entry = entries[name]
+        parent = resolve(entry['extends'], stack + [name]) if 'extends' in entry else None
+        base = dict(parent.base) if parent else {}
+        for color, value in entry.get('colors', {}).items():
+            if value.startswith('#'):
+                base[color] = parse_hex(value)
+            elif parent and value in parent.colors:
+                base[color] = parent.colors[value]
+            else:
+                raise ValueError(f"主题 {name} 的颜色 {color}: 不是 #RRGGBB，也不是被继承主题中的颜色名: {value!r}")
+        themes[name] = Theme(name, base, entry.get('description', ''))
+        return themes[name]
+
+    for name in entries:
+        resolve(name, [])
+    return themes
+
+
+@functools.cache
+def load_themes(path=THEMES_FILE):
+    """读取并解析全部主题（每个进程只解析一次；watch 模式在文件修改后清空缓存）"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_themes(json.load(f))
+
+
+def get_theme(theme=None):
+    """主题名、Theme 或 None（默认主题）→ Theme"""
+    if isinstance(theme, Theme):
+        return theme
+    themes = load_themes()
+    name = theme or DEFAULT_THEME
+    if name not in themes:
+        raise ValueError(f"主题不存在: {name}（可选: {', '.join(themes)}）")
+    return themes[name]
+
+
+def theme_names(names):
+    """--themes 参数 → 主题名列表；'all' 表示全部主题"""
+    themes = load_themes()
+    if 'all' in names:
+        return list(themes)
+    for name in names:
+        get_theme(name)
+    return list(dict.fromkeys(names))
+
+
+def theme_color(value):
+    """'主题名:颜色名' 或默认主题的颜色名 → '#RRGGBB'；其他值（'#FFFFFF'、'white' 等）原样返回"""
+    if not isinstance(value, str) or value.startswith('#'):
+        return value
+    name, _, color = value.rpartition(':')
+    theme = get_theme(name or None)
+    if color in theme.colors:
+        return theme.hex(color)
+    if name:
+        raise ValueError(f"主题 {theme.name} 没有颜色 {color}")
+    return value
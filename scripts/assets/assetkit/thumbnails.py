@@ -0,0 +1,198 @@
+"""
+游戏缩略图派生图
+
+Game.thumbnail 只保存一张原图（lib/gamepix-image-upload.ts 上传时去掉了 w= 参数），
+这里离线为每张原图生成固定宽度阶梯的响应式版本（WebP / PNG），
+并计算 BlurHash 或内联 LQIP 占位符，页面无需再运行时缩放。
+
+输出结构：<输出目录>/<key>/<宽度>.webp，清单条目见 process()。
+"""
+
+from PIL import Image, ExifTags
+import base64
+import io
+import os
+
+from assetkit import blurhash
+from assetkit.memory import apply_memory_limit, convert_strips, draft_for, strip_budget
+from assetkit.resize import Resizer, resize_strips
+
+# 响应式宽度阶梯（覆盖 GameGallery 等处 33vw~100vw 的常见视口）
+WIDTHS = (160, 320, 480, 640, 960)
+
+# 格式名 → (Pillow 格式, 编码参数, 文件后缀)；缩略图多为照片，WebP 用有损编码
+THUMB_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}, ".webp"),
+    "png": ("PNG", {"compress_level": 6}, ".png"),
+}
+
+PLACEHOLDERS = ("blurhash", "lqip")
+
+# LQIP：16px 宽的低质量 WebP，以 data URI 内联到页面
+LQIP_WIDTH = 16
+LQIP_QUALITY = 30
+
+# EXIF 方向 → 转正所需的变换（与 ImageOps.exif_transpose 一致）
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+# worker 进程内的配置
+_options = None
+
+
+def ladder(width, widths=WIDTHS):
+    """不放大：只保留不超过原图宽度的档位；原图比最小档还窄时输出原宽"""
+    return [w for w in widths if w <= width] or [width]
+
+
+def scaled_size(size, width):
+    w, h = size
+    return (width, max(1, round(h * width / w)))
+
+
+def check_key(key):
+    """
+    key 会成为输出目录下的相对路径：只允许以 / 分隔的普通路径段，
+    拒绝绝对路径、空段和 . / .. 段，清单中的 key 无法把文件写到 --output-dir 之外
+    """
+    if not isinstance(key, str) or not key:
+        raise ValueError(f"key 不能为空: {key!r}")
+    parts = key.split('/')
+    if (key.startswith('/') or os.path.isabs(key) or os.path.splitdrive(key)[0] or '\\' in key or '\0' in key
+            or any(part in ('', '.', '..') for part in parts)):
+        raise ValueError(f"key 必须是输出目录下的相对路径（不含 . / .. 段）: {key!r}")
+    return key
+
+
+def thumb_path(output_dir, key, width, fmt):
+    return os.path.join(output_dir, key, f"{width}{THUMB_FORMATS[fmt][2]}")
+
+
+def load_source(path, max_width=None, budget=None):
+    """
+    读取原图，返回 (图片, 原图显示尺寸)
+
+    宽于 max_width 的原图先缩到 max_width：JPEG 以 draft 缩小比例解码，
+    其余按条带缩放，整图的 RGBA 副本不会出现在内存中。缩小后再按 EXIF 方向转正。
+    带透明度的保留 RGBA，其余转为 RGB。
+    """
+    with Image.open(path) as src:
+        orientation = src.getexif().get(ExifTags.Base.Orientation, 1)
+        rotated = orientation in (5, 6, 7, 8)
+        size = (src.height, src.width) if rotated else src.size
+        has_alpha = src.mode in ('RGBA', 'LA', 'PA') or 'transparency' in src.info
+        mode = 'RGBA' if has_alpha else 'RGB'
+        budget = budget or strip_budget()
+
+        if max_width and size[0] > max_width:
+            target = scaled_size(size, max_width)
+            if rotated:
+                target = target[::-1]
+            img = resize_strips(draft_for(src, target), target, mode, budget)
+        else:
+            img = convert_strips(src, mode, budget)
+        # 模式相同时 convert_strips 直接返回 src，离开 with 之前先解码，否则文件关闭后无法再读取
+        img.load()
+
+    if orientation in ORIENTATION_TRANSPOSE:
+        img = img.transpose(ORIENTATION_TRANSPOSE[orientation])
+    return img, size
+
+
+def lqip(img):
+    """低质量内联占位图（data URI）"""
+    tiny = img.resize(scaled_size(img.size, LQIP_WIDTH), Image.Resampling.BILINEAR)
+    buffer = io.BytesIO()
+    tiny.save(buffer, 'WEBP', quality=LQIP_QUALITY)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def placeholder(img, kind):
+    if kind == "blurhash":
+        return blurhash.encode(img)
+    if kind == "lqip":
+        return lqip(img)
+    raise ValueError(f"未知的占位符类型: {kind}")
+
+
+def init_worker(output_dir, widths=WIDTHS, formats=("webp",), placeholder_kind="blurhash", memory_limit=None):
+    global _options
+    _options = {
+        "output_dir": output_dir,
+        "widths": tuple(widths),
+        "formats": tuple(formats),
+        "placeholder": placeholder_kind,
+        "strip_budget": strip_budget(memory_limit),
+    }
+    apply_memory_limit(memory_limit)
+
+
+def _is_fresh(source, entry):
+    """上次的清单条目与当前配置一致，且全部输出都比原图新"""
+    if not entry or entry.get("placeholder", {}).get("type") != _options["placeholder"]:
+        return False
+    widths = ladder(entry["width"], _options["widths"])
+    if [variant["width"] for variant in entry["variants"]] != widths:
+        return False
+    source_mtime = os.stat(source).st_mtime_ns
+    for width in widths:
+        for fmt in _options["formats"]:
+            path = thumb_path(_options["output_dir"], entry["key"], width, fmt)
+            if not os.path.exists(path) or os.stat(path).st_mtime_ns < source_mtime:
+                return False
+    return True
+
+
+def process(task):
+    """
+    生成一张原图的全部派生图，返回 (清单条目, 是否新生成)
+
+    task 为 (key, 原图路径, 上次的清单条目或 None)；输出仍然有效时直接返回上次的条目。
+    出错时返回 ({"key", "source", "error"}, False)，不中断整批任务。
+    """
+    key, source, previous = task
+    try:
+        check_key(key)
+        if _is_fresh(source, previous):
+            return previous, False
+
+        img, source_size = load_source(source, max(_options["widths"]), _options["strip_budget"])
+        widths = ladder(source_size[0], _options["widths"])
+        sizes = [scaled_size(source_size, width) for width in widths]
+        resizer = Resizer(img, sizes)
+
+        os.makedirs(os.path.join(_options["output_dir"], key), exist_ok=True)
+        variants = []
+        for width, size in zip(widths, sizes):
+            thumb = resizer.get(size)
+            files = {}
+            for fmt in _options["formats"]:
+                pil_format, params, _ = THUMB_FORMATS[fmt]
+                path = thumb_path(_options["output_dir"], key, width, fmt)
+                thumb.save(path, pil_format, **params)
+                files[fmt] = {
+                    "path": os.path.relpath(path, _options["output_dir"]).replace(os.sep, '/'),
+                    "bytes": os.path.getsize(path),
+                }
+            variants.append({"width": width, "height": size[1], "files": files})
+
+        return {
+            "key": key,
+            "source": source,
+            "width": source_size[0],
+            "height": source_size[1],
+            "placeholder": {"type": _options["placeholder"], "value": placeholder(img, _options["placeholder"])},
+            "variants": variants,
+        }, True
+    except MemoryError:
+        return {"key": key, "source": source, "error": "超出 worker 内存上限"}, False
+    except Exception as e:
+        # 任何单张图片的失败（损坏文件、解码器断言等）都只记入该条目
+        return {"key": key, "source": source, "error": str(e) or type(e).__name__}, False
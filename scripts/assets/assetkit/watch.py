@@ -0,0 +1,238 @@
+"""
+watch 模式：常驻进程，修改规格或绘制脚本后只重新生成受影响的资源
+
+每次单独运行生成脚本都要付出 Python 启动、导入 Pillow、加载字体和全部重绘的成本。
+watch 模式在同一个进程里反复调用 assetkit/pipeline.py 的 build()，保留：
+
+  - 已加载的字体（assetkit/fonts.py 的 lru_cache）和 OG 静态底图（assetkit/og_compose.py）
+  - 上一轮各节点的图片，按“内容指纹”复用
+  - 上一轮写出每个输出时的内容指纹
+
+内容指纹与增量缓存的指纹相同，只是 render 节点不按整个脚本文件计算，而是按绘制函数
+及其在脚本内引用的函数、常量（如 OG_SIZE）和所用主题的配色计算。修改 OG 文案时
+只有 OG 图片的指纹变化，图标的指纹不变，直接跳过，不会因为脚本文件变了而全部重绘重编码。
+修改 themes.json 时重新解析主题，只有配色变化的主题重绘；场景图同一尺寸的几何已经栅格化过，
+换色时只重新着色（assetkit/coverage.py）。
+
+监视用轮询 mtime 实现（不需要额外依赖），被修改的脚本重新加载；脚本出错时打印错误并继续监视。
+AVIF / WebP 变体编码比 PNG 慢得多（1200×630 的 AVIF 约 0.7s），watch 期间只写 PNG，
+退出时再完整构建一次补齐变体。
+"""
+
+import inspect
+import os
+import time
+import traceback
+import types
+
+from assetkit.loader import ASSETS_DIR, load_script, reload_script
+from assetkit.pipeline import (IMAGE_OPS, OUTPUT_OPS, SPEC_FILE, AssetGraph, ancestors, build, load_spec,
+                               select, theme_key, topological_order)
+from assetkit.scene import Scene
+from assetkit.theme import THEMES_FILE, load_themes
+
+# 轮询间隔（秒）
+POLL_INTERVAL = 0.1
+
+# 作为常量计入指纹的全局变量类型
+CONSTANT_TYPES = (str, int, float, bool, tuple, list, dict, type(None))
+
+
+def _referenced_names(fn):
+    """函数（含嵌套函数、lambda）字节码中引用的全部名称"""
+    names, codes = set(), [fn.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+    return names
+
+
+def render_digest(module, fn):
+    """
+    绘制函数的内容指纹输入：自身及其在脚本内（传递）引用的函数源码 + 常量取值 + 场景图指纹
+
+    只跟踪脚本模块自身定义的名称；assetkit 等导入的模块在 watch 期间不会重新加载。
+    """
+    namespace = vars(module)
+    parts, seen, stack = [], set(), [fn]
+    while stack:
+        func = inspect.unwrap(stack.pop())
+        parts.append(inspect.getsource(func))
+        for name in sorted(_referenced_names(func)):
+            if name in seen or name not in namespace:
+                continue
+            seen.add(name)
+            value = namespace[name]
+            target = inspect.unwrap(value) if callable(value) else value
+            if inspect.isfunction(target) and target.__module__ == module.__name__:
+                stack.append(target)
+            elif isinstance(value, Scene):
+                parts.append([name, value.key])
+            elif isinstance(value, CONSTANT_TYPES):
+                parts.append([name, value])
+    return parts
+
+
+class WarmState:
+    """跨次构建保留的内存状态"""
+
+    def __init__(self):
+        self.images = {}    # 内容指纹 → 图片
+        self.written = {}   # 输出路径 → 写出时的内容指纹
+
+    def graph(self, nodes, cache, encoder, variants):
+        return WarmGraph(nodes, cache, encoder, variants, self)
+
+
+class WarmGraph(AssetGraph):
+    """复用 WarmState 中图片和写出记录的调度图"""
+
+    def __init__(self, nodes, cache, encoder, variants, state):
+        super().__init__(nodes, cache, encoder, variants)
+        self.state = state
+        self._content_keys = {}
+        self._produced = {}
+
+    def content_key(self, name):
+        """节点的内容指纹：render 节点按绘制函数及其引用计算，其余同 key()"""
+        if name not in self._content_keys:
+            node = self.nodes[name]
+            upstream = [self.content_key(dep) for dep in node.deps]
+            if node.op == 'render':
+                module = load_script(node.params['script'])
+                parts = [render_digest(module, getattr(module, node.params['function'])), self.fonts,
+                         self.raster, theme_key(node.params)]
+            else:
+                parts = self._key_parts(node)
+            self._content_keys[name] = self.cache.key(node.op, node.params, upstream, *parts)
+        return self._content_keys[name]
+
+    def _unchanged(self, name):
+        """输出的内容与上一轮写出的相同，且文件（和变体）仍在"""
+        node = self.nodes[name]
+        if self.state.written.get(node.output) != self.content_key(name) or not os.path.exists(node.output):
+            return False
+        return node.op != 'encode' or self.variants is None or self.variants.is_fresh(node.output)
+
+    def plan(self, targets):
+        # 在主线程中算好全部指纹（需要加载脚本），执行时只查表
+        for name in self.nodes:
+            self.content_key(name)
+
+        _, skipped = super().plan(targets)
+        stale = []
+        for name in targets:
+            node = self.nodes[name]
+            if name in skipped:
+                self.state.written[node.output] = self.content_key(name)
+            elif self._unchanged(name):
+                # 脚本中与该输出无关的部分被修改：文件内容不变；变体完整时同时更新增量缓存的指纹
+                if self.variants or node.op != 'encode':
+                    self.cache.record(node.output, self.key(name))
+            else:
+                stale.append(name)
+
+        # 上游节点的图片已在内存中时不再向上展开
+        needed, stack = set(), list(stale)
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            needed.add(name)
+            if self.content_key(name) not in self.state.images:
+                stack.extend(self.nodes[name].deps)
+        order = [name for name in topological_order(self.nodes) if name in needed]
+        return order, [name for name in targets if name not in stale]
+
+    def _execute(self, name, results):
+        node = self.nodes[name]
+        key = self.content_key(name)
+        if node.op in OUTPUT_OPS:
+            super()._execute(name, results)
+            self.state.written[node.output] = key
+            return None
+        image = self.state.images.get(key)
+        if image is None:
+            image = super()._execute(name, results)
+        self._produced[key] = image
+        return image
+
+    def run(self, order, workers=None, keep=()):
+        try:
+            return super().run(order, workers, keep)
+        finally:
+            # 只保留当前规格和脚本下仍然有效的图片，内存占用不超过一轮完整构建
+            current = {self.content_key(name) for name, node in self.nodes.items() if node.op in IMAGE_OPS}
+            images = {**self.state.images, **self._produced}
+            self.state.images = {key: img for key, img in images.items() if key in current}
+
+
+def watched_files(nodes, spec_path=SPEC_FILE, only=None):
+    """{路径: 脚本名或 None}：规格文件、主题文件，以及所选输出上游的 render 脚本、load / svg 读取的文件"""
+    files = {spec_path: None, THEMES_FILE: None}
+    for name in ancestors(nodes, select(nodes, only)):
+        node = nodes[name]
+        if node.op == 'render':
+            script = node.params['script']
+            files[os.path.join(ASSETS_DIR, f"{script}.py")] = script
+        for key in ('path', 'fallback'):
+            if node.op in ('load', 'svg') and node.params.get(key):
+                files[node.params[key]] = None
+    return files
+
+
+def _stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def watch(spec_path=SPEC_FILE, only=None, workers=None, interval=POLL_INTERVAL, themes=None):
+    """先构建一次，然后轮询文件变化并增量重建；Ctrl+C 时补齐 WebP / AVIF 变体后退出"""
+    state = WarmState()
+
+    def rebuild():
+        start = time.perf_counter()
+        try:
+            build(spec_path, only, workers=workers, report=None, state=state, verbose=False, variants=False,
+                  themes=themes)
+        except Exception:
+            print(f"❌ 构建失败:\n{traceback.format_exc(limit=-3)}")
+        print(f"⏱️  {time.perf_counter() - start:.2f}s")
+
+    rebuild()
+    files = watched_files(load_spec(spec_path), spec_path, only)
+    stamps = {path: _stamp(path) for path in files}
+    print(f"\n👀 监视 {len(files)} 个文件（Ctrl+C 退出）")
+
+    try:
+        while True:
+            time.sleep(interval)
+            changed = [path for path in files if _stamp(path) != stamps[path]]
+            if not changed:
+                continue
+            print(f"\n✏️  已修改: {', '.join(os.path.relpath(path) for path in changed)}")
+            try:
+                for path in changed:
+                    if files[path]:
+                        reload_script(files[path])
+                if THEMES_FILE in changed:
+                    load_themes.cache_clear()
+            except Exception:
+                print(f"❌ 脚本加载失败:\n{traceback.format_exc(limit=-1)}")
+            else:
+                rebuild()
+
+            # 规格可能增删了节点，重新收集监视的文件
+            try:
+                files = watched_files(load_spec(spec_path), spec_path, only)
+            except (OSError, ValueError) as e:
+                print(f"❌ 规格无效: {e}")
+            stamps = {path: _stamp(path) for path in files}
+    except KeyboardInterrupt:
+        print("\n🗜️  补齐 WebP / AVIF 变体...")
+        build(spec_path, only, workers=workers, report=None, verbose=False, themes=themes)
+        print("👋 已停止监视")
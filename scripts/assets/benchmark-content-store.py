@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+内容寻址仓库导入与查询基准
+
+生成 N 张合成小图（默认 50k，其中一部分为字节完全相同的重复图）写入临时目录，
+测量批量导入、重复导入、单条 / 批量“是否已有”查询和按来源查询的耗时。
+用法: python3 scripts/assets/benchmark-content-store.py [--count 50000] [--duplicates 0.1]
+"""
+
+from PIL import Image
+import argparse
+import io
+import os
+import random
+import tempfile
+import time
+
+from assetkit.content_store import ContentStore, describe_record, sha256_bytes
+from assetkit.parallel import stream_pool, default_workers
+
+
+def synthetic_image(index, fmt):
+    """每个序号生成一张内容不同的 64×48 小图"""
+    img = Image.new('RGB', (64, 48), ((index * 37) % 256, (index * 91) % 256, (index * 13) % 256))
+    pixels = img.load()
+    for bit in range(24):
+        if index >> bit & 1:
+            pixels[bit % 8 * 8, bit // 8 * 16] = (255, 255, 255)
+    buffer = io.BytesIO()
+    img.save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def write_images(directory, count, duplicates):
+    """写出合成图片，返回 [(记录, 字节哈希)]"""
+    rng = random.Random(0)
+    records = []
+    for i in range(count):
+        shard = os.path.join(directory, f"{i // 1000:03d}")
+        if i % 1000 == 0:
+            os.makedirs(shard, exist_ok=True)
+        source = rng.randrange(i) if i and rng.random() < duplicates else i
+        data = synthetic_image(source, 'PNG' if source % 2 else 'JPEG')
+        path = os.path.join(shard, f"{i}.img")
+        with open(path, 'wb') as f:
+            f.write(data)
+        records.append(({"path": path, "source": f"https://img.gamepix.com/bench/{i}"}, sha256_bytes(data)))
+    return records
+
+
+def import_all(store, records, workers):
+    added = 0
+    for info in stream_pool(describe_record, (record for record, _ in records), workers=workers):
+        if "error" in info:
+            continue
+        _, created = store.put_file(info["file"], source=info["source"], info=info)
+        added += created
+    store.db.commit()
+    return added
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='内容寻址仓库基准')
+    parser.add_argument('--count', type=int, default=50000, help='合成图片数量')
+    parser.add_argument('--duplicates', type=float, default=0.1, help='重复图片比例')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='导入时的并行进程数')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"🧪 生成 {args.count} 张合成图片...")
+        records, elapsed = timed(lambda: write_images(os.path.join(tmp, 'src'), args.count, args.duplicates))
+        digests = [digest for _, digest in records]
+        unique = len(set(digests))
+        print(f"  {elapsed:.1f}s，其中不重复 {unique} 张")
+
+        store = ContentStore(os.path.join(tmp, 'store'))
+
+        added, elapsed = timed(lambda: import_all(store, records, args.workers))
+        print(f"\n📥 首次导入: {elapsed:7.2f}s  {args.count / elapsed:8.0f} 张/s  新增 {added}")
+        if added != unique:
+            print(f"❌ 新增数量 {added} 与不重复图片数 {unique} 不一致")
+            exit(1)
+
+        added, elapsed = timed(lambda: import_all(store, records, args.workers))
+        print(f"📥 重复导入: {elapsed:7.2f}s  {args.count / elapsed:8.0f} 张/s  新增 {added}")
+
+        store.close()
+        store = ContentStore(os.path.join(tmp, 'store'))
+
+        misses = [sha256_bytes(f"miss-{i}".encode()) for i in range(len(digests))]
+        hits, elapsed = timed(lambda: sum(store.has(digest) for digest in digests))
+        print(f"\n🔍 has() 命中:   {elapsed / len(digests) * 1e6:6.1f}µs/次  ({hits}/{len(digests)})")
+        found, elapsed = timed(lambda: sum(store.has(digest) for digest in misses))
+        print(f"🔍 has() 未命中: {elapsed / len(misses) * 1e6:6.1f}µs/次  ({found}/{len(misses)})")
+        missing, elapsed = timed(lambda: store.missing(digests + misses))
+        print(f"🔍 missing() 批量: {elapsed / (2 * len(digests)) * 1e6:4.1f}µs/条  (缺少 {len(missing)})")
+        sources, elapsed = timed(lambda: sum(store.lookup_source(record["source"]) is not None
+                                             for record, _ in records))
+        print(f"🔍 lookup_source(): {elapsed / len(records) * 1e6:4.1f}µs/次  ({sources}/{len(records)})")
+
+        stats = store.stats()
+        store.close()
+        print(f"\n📦 对象 {stats['objects']}（{stats['bytes'] / 1024 / 1024:.1f}MB），来源 {stats['sources']}")
+
+        if hits != len(digests) or found or len(missing) != len(misses):
+            print("❌ 查询结果不正确")
+            exit(1)
+
+
+if __name__ == '__main__':
+    main()
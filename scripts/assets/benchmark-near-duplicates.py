@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+近似重复分组基准
+
+生成 N 个随机 64 位哈希，并植入若干组翻转少量位得到的“近似副本”，
+对比 assetkit.phash 的多索引汉明搜索与两两比较：在抽样规模上校验两者结果一致，
+再测量全量 N（默认 100k）的分组耗时。
+用法: python3 scripts/assets/benchmark-near-duplicates.py [--count 100000] [--check 5000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from assetkit.phash import DHASH_THRESHOLD, PHASH_THRESHOLD, group_near_duplicates, popcount
+
+
+def synthetic_hashes(count, clusters, rng):
+    """随机哈希 + 每组 2~5 张、各自翻转 0~4 位的近似副本"""
+    dh = rng.integers(0, 2 ** 63, size=count, dtype=np.uint64) * np.uint64(2) + rng.integers(0, 2, size=count, dtype=np.uint64)
+    ph = rng.integers(0, 2 ** 63, size=count, dtype=np.uint64) * np.uint64(2)
+    members = rng.choice(count, size=min(count, clusters * 5), replace=False)
+    i = 0
+    while i + 5 <= len(members) and clusters:
+        group = members[i:i + rng.integers(2, 6)]
+        for j in group[1:]:
+            flips_d = rng.choice(64, size=rng.integers(0, 5), replace=False)
+            flips_p = rng.choice(64, size=rng.integers(0, 5), replace=False)
+            dh[j] = dh[group[0]] ^ np.uint64(sum(1 << int(bit) for bit in flips_d))
+            ph[j] = ph[group[0]] ^ np.uint64(sum(1 << int(bit) for bit in flips_p))
+        i += len(group)
+        clusters -= 1
+    return dh, ph
+
+
+def brute_force_groups(dh, ph, dhash_threshold, phash_threshold):
+    """O(n²) 两两比较 + 并查集"""
+    n = len(dh)
+    parent = list(range(n))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i in range(n - 1):
+        close = ((popcount(dh[i] ^ dh[i + 1:]) <= dhash_threshold)
+                 & (popcount(ph[i] ^ ph[i + 1:]) <= phash_threshold))
+        for j in np.flatnonzero(close) + i + 1:
+            parent[find(i)] = find(int(j))
+
+    groups = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def normalized(groups):
+    return sorted(sorted(g) for g in groups)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='近似重复分组基准')
+    parser.add_argument('--count', type=int, default=100000, help='全量哈希数量')
+    parser.add_argument('--check', type=int, default=5000, help='与两两比较校验的抽样规模')
+    parser.add_argument('--dhash-threshold', type=int, default=DHASH_THRESHOLD)
+    parser.add_argument('--phash-threshold', type=int, default=PHASH_THRESHOLD)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    thresholds = (args.dhash_threshold, args.phash_threshold)
+
+    dh, ph = synthetic_hashes(args.check, args.check // 20, rng)
+    start = time.perf_counter()
+    expected = brute_force_groups(dh, ph, *thresholds)
+    brute_time = time.perf_counter() - start
+    start = time.perf_counter()
+    groups = group_near_duplicates(dh, ph, *thresholds)
+    index_time = time.perf_counter() - start
+
+    print(f"🔍 校验 n={args.check}")
+    print(f"  两两比较:     {brute_time * 1000:8.1f}ms  {len(expected)} 组")
+    print(f"  多索引搜索:   {index_time * 1000:8.1f}ms  {len(groups)} 组")
+    if normalized(groups) != normalized(expected):
+        print("❌ 分组结果与两两比较不一致")
+        exit(1)
+    print("  ✓ 结果一致")
+
+    dh, ph = synthetic_hashes(args.count, args.count // 20, rng)
+    start = time.perf_counter()
+    groups = group_near_duplicates(dh, ph, *thresholds)
+    elapsed = time.perf_counter() - start
+    estimate = brute_time * (args.count / args.check) ** 2
+    print(f"\n📊 全量 n={args.count}")
+    print(f"  多索引搜索:   {elapsed:8.2f}s  {len(groups)} 组")
+    print(f"  两两比较估算: {estimate:8.0f}s")
+
+
+if __name__ == '__main__':
+    main()
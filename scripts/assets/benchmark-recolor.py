@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Logo 着色性能对比
+
+对比原 generate-white-logo.py 的逐像素循环与 assetkit.recolor 的整图实现，
+并校验两者输出逐像素一致。
+用法: python3 scripts/assets/benchmark-recolor.py [--sizes 128 512 1024]
+"""
+
+from PIL import Image
+import argparse
+import time
+
+from assetkit.recolor import recolor, WHITE
+
+INPUT_FILE = 'public/logo/logo-rungame-1024.png'
+
+
+def legacy_white_logo(img):
+    """原实现：逐像素遍历（仅用于对比）"""
+    width, height = img.size
+    pixels = img.load()
+    white_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    white_pixels = white_img.load()
+    for y in range(height):
+        for x in range(width):
+            r, g, b, a = pixels[x, y]
+            if a > 0:
+                white_pixels[x, y] = (255, 255, 255, a)
+            else:
+                white_pixels[x, y] = (0, 0, 0, 0)
+    return white_img
+
+
+def best_of(fn, img, repeat):
+    """多次运行取最短耗时"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(img)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Logo 着色性能对比')
+    parser.add_argument('--input', default=INPUT_FILE, help='输入 PNG 路径')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[128, 256, 512, 1024])
+    parser.add_argument('--repeat', type=int, default=3, help='每项重复次数')
+    args = parser.parse_args()
+
+    master = Image.open(args.input).convert('RGBA')
+
+    print(f"{'尺寸':>8} {'逐像素':>12} {'整图':>12} {'加速比':>10}  一致")
+    print('-' * 54)
+    for size in args.sizes:
+        img = master.resize((size, size), Image.Resampling.LANCZOS)
+        legacy_time, legacy = best_of(legacy_white_logo, img, 1)
+        fast_time, fast = best_of(lambda im: recolor(im, WHITE), img, args.repeat)
+        same = legacy.tobytes() == fast.tobytes()
+        print(f"{size:>8} {legacy_time * 1000:>10.1f}ms {fast_time * 1000:>10.2f}ms "
+              f"{legacy_time / fast_time:>9.0f}x  {'✓' if same else '✗'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Favicon 缩放链性能与质量对比
+
+对比原 main() 中 12 次独立的“母版 → 目标尺寸” Lanczos 缩放与 assetkit.resize
+的去重金字塔缩放链，并检查每个尺寸与直接缩放结果的差异是否在容差内。
+用法: python3 scripts/assets/benchmark-resize.py [--reduce] [--repeat 5]
+"""
+
+from PIL import Image
+import argparse
+import time
+
+from assetkit.loader import load_script
+from assetkit.resize import Resizer, check_resizer, DEFAULT_TOLERANCE
+
+# 与 generate-icons*.py main() 中一致：7 个 favicon + 4 个 ICO + Apple Touch Icon
+FAVICON_SIZES = [16, 32, 48, 64, 128, 256, 512]
+ICO_SIZES = [16, 32, 48, 64]
+REQUESTS = FAVICON_SIZES + ICO_SIZES + [180]
+
+
+def legacy_resizes(master):
+    """原实现：每个输出都从母版直接缩放"""
+    return [master.resize((size, size), Image.Resampling.LANCZOS) for size in REQUESTS]
+
+
+def chain_resizes(master, use_reduce):
+    """缩放链：重复尺寸只计算一次，小尺寸从更大的金字塔层级得到"""
+    resizer = Resizer(master, REQUESTS, use_reduce=use_reduce)
+    return [resizer.get(size) for size in REQUESTS]
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Favicon 缩放链对比')
+    parser.add_argument('--reduce', action='store_true', help='金字塔减半使用 Image.reduce(2)')
+    parser.add_argument('--repeat', type=int, default=5, help='每项重复次数')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='平均通道差容差')
+    args = parser.parse_args()
+
+    gamepad = load_script('generate-icons-gamepad')
+    classic = load_script('generate-icons')
+    masters = {
+        'gamepad favicon': gamepad.create_gamepad_favicon(512),
+        'classic favicon': classic.create_favicon(512),
+    }
+
+    failed = False
+    for name, master in masters.items():
+        legacy_time = best_of(lambda: legacy_resizes(master), args.repeat)
+        chain_time = best_of(lambda: chain_resizes(master, args.reduce), args.repeat)
+
+        print(f"\n🖼️  {name}")
+        print(f"  逐个缩放: {legacy_time * 1000:8.1f}ms CPU ({len(REQUESTS)} 次)")
+        print(f"  缩放链:   {chain_time * 1000:8.1f}ms CPU "
+              f"({len(Resizer(master, REQUESTS).plan)} 步)  {legacy_time / chain_time:.1f}x")
+
+        resizer = Resizer(master, REQUESTS, use_reduce=args.reduce)
+        try:
+            report = check_resizer(resizer, args.tolerance)
+        except ValueError as e:
+            print(f"  ❌ {e}")
+            failed = True
+            continue
+        for (w, h), diff in sorted(report.items()):
+            print(f"    {w:>4}×{h:<4} 平均差 {diff['mean']:.2f}  最大差 {diff['max']}")
+        print(f"  ✓ 所有尺寸均在容差 {args.tolerance} 内")
+
+    if failed:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
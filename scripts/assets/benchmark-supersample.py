@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+超采样倍数选择：每个倍数的时间、内存代价与画质
+
+对 asset-spec.json 中的 render 节点（--only 筛选所选输出上游的节点），按每个候选倍数冷渲染
+（场景图层缓存和 OG 底图缓存均不使用），输出：
+  耗时    整个绘制函数的耗时（重复 --repeat 次取最快）
+  内存    最大的超采样缓冲区（N 倍画布 + 预乘副本，由 supersample 阶段记录）
+  画质    与 --reference 倍数的渲染结果比较（assetkit/golden.py 的 compare）。黄金图像的默认阈值
+          用于发现回归，任何两种倍数之间的边缘覆盖率差异都会超出；这里的默认阈值按抗锯齿的
+          量化误差放宽：单通道差超过 32（1/8 满幅）的像素不超过 0.1%，SSIM 不低于 0.999
+最后列出每个资源满足阈值的最小倍数，与规格中当前的倍数对照。选定后写入规格节点的
+"kwargs": {"supersample": N}，再用 verify-golden.py --update 更新黄金图像。
+
+用法:
+  python3 scripts/assets/benchmark-supersample.py
+  python3 scripts/assets/benchmark-supersample.py --only 'gamepad/*' --factors 1 2 4 --reference 8
+"""
+
+import argparse
+import time
+
+from assetkit.fonts import bundled_only
+from assetkit.golden import TOLERANCE, compare
+from assetkit.loader import load_script
+from assetkit.og_compose import caching_disabled
+from assetkit.pipeline import SPEC_FILE, ancestors, load_spec, select, topological_order
+from assetkit.profiling import Profiler
+from assetkit.scene import Scene
+from assetkit.supersample import MAX_FACTOR, check_factor
+
+FACTORS = [1, 2, 3, 4, 6]
+
+# 与参照倍数比较时的默认画质阈值（键同 assetkit/golden.py 的 TOLERANCE）
+QUALITY = {**TOLERANCE, "channel": 32, "outliers": 0.001, "ssim": 0.999}
+
+
+def render_nodes(nodes, only=None):
+    """所选输出上游的 render 节点（拓扑序）"""
+    names = ancestors(nodes, select(nodes, only))
+    return [name for name in topological_order(nodes) if name in names and nodes[name].op == 'render']
+
+
+def cold_render(node, factor):
+    """不使用任何图层缓存渲染一次，返回 (图片, 耗时, 最大超采样缓冲区字节数)"""
+    params = node.params
+    module = load_script(params['script'])
+    for value in vars(module).values():
+        if isinstance(value, Scene):
+            value.clear_cache()
+    fn = getattr(module, params['function'])
+    kwargs = {**params.get('kwargs', {}), 'supersample': factor}
+
+    with Profiler() as profiler, caching_disabled():
+        start = time.perf_counter()
+        img = fn(*params.get('args', []), **kwargs)
+        elapsed = time.perf_counter() - start
+    buffers = [event.get("buffer", 0) for event in profiler.events if event["stage"] == 'supersample']
+    return img, elapsed, max(buffers, default=0)
+
+
+def measure(node, factor, repeat):
+    best, img, buffer = float('inf'), None, 0
+    for _ in range(repeat):
+        img, elapsed, buffer = cold_render(node, factor)
+        best = min(best, elapsed)
+    return img, best, buffer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='超采样倍数的时间、内存与画质对比')
+    parser.add_argument('--spec', default=SPEC_FILE, help='资源规格 JSON 路径')
+    parser.add_argument('--only', nargs='+', metavar='PATTERN', help='只测所选输出上游的 render 节点（支持通配符）')
+    parser.add_argument('--factors', type=int, nargs='+', default=FACTORS, help='候选倍数')
+    parser.add_argument('--reference', type=int, default=MAX_FACTOR, help='作为画质参照的倍数')
+    parser.add_argument('--repeat', type=int, default=3, help='每项重复次数（取最快一次）')
+    parser.add_argument('--channel', type=float, default=QUALITY["channel"], help='单通道容差（0-255）')
+    parser.add_argument('--outliers', type=float, default=QUALITY["outliers"], help='超过通道容差的像素比例上限')
+    parser.add_argument('--mean', type=float, default=QUALITY["mean"], help='通道平均差上限')
+    parser.add_argument('--ssim', type=float, default=QUALITY["ssim"], help='SSIM 下限')
+    args = parser.parse_args()
+
+    try:
+        factors = sorted({check_factor(factor) for factor in args.factors})
+        check_factor(args.reference)
+        nodes = load_spec(args.spec)
+        names = render_nodes(nodes, args.only)
+    except ValueError as e:
+        print(f"❌ 错误: {e}")
+        exit(1)
+    if not names:
+        print("❌ 错误: 没有匹配的 render 节点")
+        exit(1)
+
+    tolerance = {"channel": args.channel, "outliers": args.outliers, "mean": args.mean, "ssim": args.ssim}
+    chosen = {}
+    with bundled_only():
+        for name in names:
+            node = nodes[name]
+            current = node.params.get('kwargs', {}).get('supersample', 1)
+            reference, reference_time, _ = measure(node, args.reference, 1)
+            print(f"\n🎨 {name}  {reference.width}×{reference.height}（规格中 ×{current}，"
+                  f"参照 ×{args.reference} {reference_time * 1000:.0f}ms）")
+            print(f"  {'倍数':>4}  {'耗时':>9}  {'缓冲区':>8}  {'最大差':>5}  {'离群':>7}  {'SSIM':>6}")
+            for factor in factors:
+                img, elapsed, buffer = measure(node, factor, args.repeat)
+                result = compare(reference, img, tolerance)
+                mark = '✓' if result["ok"] else '✗'
+                print(f"  {'×' + str(factor):>5}  {elapsed * 1000:7.1f}ms  {buffer / 1024 / 1024:6.1f}MB"
+                      f"  {max(result['max'].values()):5.0f}  {result['outliers']:7.3%}  {result['ssim']:.4f}  {mark}")
+                if result["ok"] and name not in chosen:
+                    chosen[name] = factor
+
+    print("\n📋 满足阈值的最小倍数:")
+    for name in names:
+        current = nodes[name].params.get('kwargs', {}).get('supersample', 1)
+        factor = chosen.get(name)
+        if factor is None:
+            print(f"  ⚠️  {name}: 候选倍数都不满足阈值（规格中 ×{current}）")
+        else:
+            note = '' if factor == current else f"（规格中 ×{current}）"
+            print(f"  • {name}: ×{factor}{note}")
+
+
+if __name__ == '__main__':
+    main()
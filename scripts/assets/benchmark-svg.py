@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+矢量渲染与位图缩放链对比
+
+对比 Logo 各尺寸的两种生成方式：
+  缩放链    读取 1024 位图母版，经 assetkit.resize 的金字塔逐级 Lanczos 缩小
+  矢量渲染  logo-rungame.svg 按每个尺寸直接光栅化（串行 / 进程池并行，均不使用磁盘缓存）
+
+输出墙钟时间，以及每个尺寸 Alpha 通道的拉普拉斯方差（边缘锐度，越大越锐利）。
+用法: PYTHONPATH=... python3 scripts/assets/benchmark-svg.py [--backend resvg] [--repeat 3]
+"""
+
+from PIL import Image, ImageFilter
+import argparse
+import numpy as np
+import time
+
+from assetkit.logo_variants import LOGO_SIZES
+from assetkit.parallel import default_workers
+from assetkit.resize import Resizer
+from assetkit.svg import available_backends, rasterize, rasterize_sizes, read_svg
+
+SVG_FILE = 'public/logo/logo-rungame.svg'
+PNG_FILE = 'public/logo/logo-rungame-1024.png'
+
+_LAPLACIAN = ImageFilter.Kernel((3, 3), [0, 1, 0, 1, -4, 1, 0, 1, 0], scale=1, offset=128)
+
+
+def sharpness(img):
+    """Alpha 通道拉普拉斯响应的方差"""
+    response = np.asarray(img.getchannel('A').filter(_LAPLACIAN), dtype=np.float64)
+    return float(response.var())
+
+
+def resize_chain(sizes):
+    master = Image.open(PNG_FILE).convert('RGBA')
+    resizer = Resizer(master, sizes)
+    return {size: resizer.get(size) for size in sizes}
+
+
+def svg_serial(svg, sizes, backend):
+    return {size: rasterize(svg, size, backend, cache_dir=None) for size in sizes}
+
+
+def svg_parallel(svg, sizes, backend, workers):
+    results = rasterize_sizes(svg, sizes, backend, workers=workers, cache_dir=None)
+    return {size: results[(size, size)] for size in sizes}
+
+
+def best_of(fn, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='矢量渲染与位图缩放链对比')
+    parser.add_argument('--backend', choices=available_backends(), help='SVG 渲染后端（默认第一个可用的）')
+    parser.add_argument('--sizes', type=int, nargs='+', default=LOGO_SIZES, help='对比的尺寸')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行渲染的进程数')
+    parser.add_argument('--repeat', type=int, default=3, help='每项重复次数（取最快一次）')
+    args = parser.parse_args()
+
+    backends = [args.backend] if args.backend else available_backends()
+    if not backends:
+        print("❌ 错误: 没有可用的 SVG 渲染后端，请安装 cairosvg、resvg-py 或 rsvg-convert")
+        exit(1)
+
+    svg = read_svg(SVG_FILE)
+    chain_time, chain = best_of(lambda: resize_chain(args.sizes), args.repeat)
+    print(f"📐 {len(args.sizes)} 个尺寸: {', '.join(map(str, args.sizes))}")
+    print(f"  缩放链（{PNG_FILE}）: {chain_time * 1000:8.1f}ms")
+
+    rendered = {}
+    for backend in backends:
+        serial_time, rendered[backend] = best_of(lambda: svg_serial(svg, args.sizes, backend), args.repeat)
+        parallel_time, _ = best_of(lambda: svg_parallel(svg, args.sizes, backend, args.workers), args.repeat)
+        print(f"  {backend} 串行:      {serial_time * 1000:8.1f}ms  ({chain_time / serial_time:.2f}x)")
+        print(f"  {backend} 并行 ×{args.workers}:  {parallel_time * 1000:8.1f}ms  ({chain_time / parallel_time:.2f}x)")
+
+    print("\n🔍 边缘锐度（Alpha 拉普拉斯方差）")
+    print(f"  {'尺寸':>6}  {'缩放链':>10}" + "".join(f"  {backend:>14}" for backend in backends))
+    for size in args.sizes:
+        base = sharpness(chain[size])
+        row = f"  {size:>6}  {base:10.1f}"
+        for backend in backends:
+            value = sharpness(rendered[backend][size])
+            row += f"  {value:8.1f} {value / base if base else 0:4.2f}x"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+按 asset-spec.json 生成全部图标、OG 图片和 Logo 单色版本
+
+规格中每个资源是一个节点（render → resize → recolor → encode），依赖显式声明；
+共享的中间结果只计算一次，相互独立的分支并发执行，未变化的输出直接跳过。
+每次运行按阶段记录耗时、CPU、峰值 RSS 和输出字节数（assetkit/profiling.py）。
+--watch 常驻运行，修改规格或绘制脚本后只重新生成受影响的资源（assetkit/watch.py）。
+--themes 在同一次构建中生成多个主题（themes.json）的版本，其他主题写到 public/themes/<主题名>/。
+字体默认只用随仓库提供的 DejaVu Sans Bold，各平台输出一致；--font 可改用系统字体（assetkit/fonts.py）。
+实现见 assetkit/pipeline.py。
+
+用法:
+  python3 scripts/assets/build-assets.py                         # 全部资源
+  python3 scripts/assets/build-assets.py --only public/favicon.ico
+  python3 scripts/assets/build-assets.py --only 'gamepad/*'       # 节点名或输出路径，支持通配符
+  python3 scripts/assets/build-assets.py --list
+  python3 scripts/assets/build-assets.py --force --profile .asset-cache/build.prof
+  python3 scripts/assets/build-assets.py --watch --only 'gamepad/*'
+  python3 scripts/assets/build-assets.py --themes all              # 默认主题 + 全部主题变体
+  python3 scripts/assets/build-assets.py --only 'gamepad/*' --themes dark halloween
+  python3 scripts/assets/build-assets.py --font sans=/System/Library/Fonts/Helvetica.ttc
+"""
+
+import argparse
+import time
+
+from assetkit.fonts import add_font, font_option
+from assetkit.pipeline import SPEC_FILE, ancestors, build, load_spec, select, topological_order, with_themes
+from assetkit.profiling import REPORT_FILE
+from assetkit.theme import theme_names
+from assetkit.watch import watch
+
+
+def list_nodes(spec_path, only, themes=None):
+    nodes = load_spec(spec_path)
+    targets = select(nodes, only)
+    if themes:
+        nodes, targets = with_themes(nodes, targets, themes)
+    needed = ancestors(nodes, targets)
+    for name in topological_order(nodes):
+        node = nodes[name]
+        if node.op == 'encode' or name not in needed:
+            continue
+        deps = f" ← {', '.join(node.deps)}" if node.deps else ""
+        print(f"  {name} [{node.op}]{deps}")
+        # 输出：ico 节点自身，或由该节点展开的 encode 节点
+        for target in targets:
+            if target == name or (nodes[target].op == 'encode' and nodes[target].deps == [name]):
+                print(f"      → {nodes[target].output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='按资源规格生成图标 / OG 图片 / Logo')
+    parser.add_argument('--spec', default=SPEC_FILE, help='资源规格 JSON 路径')
+    parser.add_argument('--only', nargs='+', metavar='PATTERN', help='只生成匹配的节点或输出（支持通配符）')
+    parser.add_argument('--themes', nargs='+', metavar='THEME',
+                        help='生成这些主题的版本（themes.json 中的主题名，all 为全部主题）')
+    parser.add_argument('--force', action='store_true', help='忽略增量缓存，强制重新生成')
+    parser.add_argument('--font', action='append', default=[], metavar='FAMILY=PATH',
+                        help='改用指定的字体文件（可重复），如 sans=/System/Library/Fonts/Helvetica.ttc')
+    parser.add_argument('--workers', type=int, help='并发线程数（默认 CPU 核数）')
+    parser.add_argument('--list', action='store_true', help='列出节点和输出，不生成')
+    parser.add_argument('--watch', action='store_true', help='常驻运行，文件修改后增量重建')
+    parser.add_argument('--report', default=REPORT_FILE, help=f'JSON 性能报告路径（默认 {REPORT_FILE}，传空字符串不写出）')
+    parser.add_argument('--profile', metavar='PATH', help='同时收集 cProfile 数据并写到 PATH（.prof）')
+    args = parser.parse_args()
+
+    try:
+        for value in args.font:
+            add_font(*font_option(value))
+        themes = theme_names(args.themes) if args.themes else None
+        if args.list:
+            list_nodes(args.spec, args.only, themes)
+            return
+        if args.watch:
+            watch(args.spec, args.only, args.workers, themes=themes)
+            return
+        print("🎨 按资源规格生成..." if not themes else f"🎨 按资源规格生成（主题: {', '.join(themes)}）...")
+        start = time.perf_counter()
+        ok = build(args.spec, args.only, args.force, args.workers, args.report or None, args.profile,
+                   themes=themes)
+    except ValueError as e:
+        print(f"❌ 错误: {e}")
+        exit(1)
+
+    print(f"\n⏱️  耗时 {time.perf_counter() - start:.2f}s")
+    if not ok:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+本地内容寻址图片仓库（SHA-256 分片目录 + SQLite 索引）
+
+  import <目录或清单>   批量导入原图（清单格式见 assetkit/sources.py）
+  has <哈希|文件|来源>  查询是否已有，已有时输出索引信息
+  stats                 仓库统计
+
+哈希计算和文件头解析在进程池中执行，索引写入集中在主进程。
+需要安装: pip3 install pillow
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+from assetkit.content_store import STORE_DIR, ContentStore, describe_record, sha256_file
+from assetkit.parallel import stream_pool, default_workers
+from assetkit.sources import iter_records
+
+
+def cmd_import(store, args):
+    if not os.path.exists(args.input):
+        print(f"❌ 错误: 输入不存在: {args.input}")
+        exit(1)
+
+    print(f"📥 导入 {args.input} → {store.root}")
+    start = time.perf_counter()
+    added = existing = 0
+    invalid = []
+    failed = []
+
+    for info in stream_pool(describe_record, iter_records(args.input), workers=args.workers):
+        if "error" in info:
+            failed.append((info["file"], info["error"]))
+            continue
+        if info["format"] is None:
+            invalid.append(info["file"])
+            continue
+        try:
+            _, created = store.put_file(info["file"], source=info["source"], info=info)
+        except OSError as e:
+            # 读取与复制之间文件被删除或变为不可读：记录后继续导入其余文件
+            failed.append((info["file"], str(e)))
+            continue
+        if created:
+            added += 1
+        else:
+            existing += 1
+        if (added + existing) % 5000 == 0:
+            print(f"  … 已处理 {added + existing} 张")
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ 完成！新增 {added} 张，已存在 {existing} 张，耗时 {elapsed:.2f}s")
+    for path in invalid:
+        print(f"❌ 无法识别的图片，已跳过: {path}")
+    for path, error in failed:
+        print(f"❌ {path}: {error}")
+    if invalid or failed:
+        exit(1)
+
+
+def cmd_has(store, args):
+    query = args.query
+    if re.fullmatch(r'[0-9a-f]{64}', query):
+        digest = query
+    elif os.path.isfile(query):
+        digest = sha256_file(query)
+    else:
+        digest = store.lookup_source(query)
+
+    entry = store.get(digest) if digest else None
+    if entry is None:
+        print(f"✗ 仓库中没有: {query}")
+        exit(1)
+    print(json.dumps(entry, indent=2, ensure_ascii=False))
+
+
+def cmd_stats(store, args):
+    stats = store.stats()
+    print(f"📦 {store.root}")
+    print(f"  对象: {stats['objects']}（{stats['bytes'] / 1024 / 1024:.1f}MB）")
+    print(f"  派生图: {stats['variants']}")
+    print(f"  来源: {stats['sources']}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='本地内容寻址图片仓库')
+    parser.add_argument('--store', default=STORE_DIR, help='仓库目录')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    importer = commands.add_parser('import', help='批量导入原图')
+    importer.add_argument('input', help='原图目录，或 .jsonl / .txt 清单')
+    importer.add_argument('--workers', type=int, default=default_workers(), help='并行进程数')
+    importer.set_defaults(handler=cmd_import)
+
+    has = commands.add_parser('has', help='查询是否已有')
+    has.add_argument('query', help='SHA-256 哈希、本地文件或来源 URL')
+    has.set_defaults(handler=cmd_has)
+
+    stats = commands.add_parser('stats', help='仓库统计')
+    stats.set_defaults(handler=cmd_stats)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with ContentStore(args.store) as store:
+        args.handler(store, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+查找近似重复的游戏图片并输出合并计划
+
+输入为图片目录 / 清单（格式见 assetkit/sources.py）或本地内容仓库（--store）。
+每张图计算 dHash + pHash（进程池分批计算），用多索引汉明搜索分组，
+每组保留分辨率最高（其次文件最大）的一张，其余列为待合并项。
+合并计划打印到终端，并可用 --output 写成 JSON。
+需要安装: pip3 install pillow numpy
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from assetkit.content_store import ContentStore
+from assetkit.parallel import chunks, stream_pool, default_workers
+from assetkit.phash import DHASH_THRESHOLD, PHASH_THRESHOLD, group_near_duplicates, hash_files, popcount
+from assetkit.sources import iter_sources
+
+# 每个进程池任务处理的图片数
+BATCH_SIZE = 256
+
+
+def iter_paths(args):
+    if args.store:
+        with ContentStore(args.store) as store:
+            for _, path in store.objects():
+                yield path
+    else:
+        for _, path in iter_sources(args.input):
+            yield path
+
+
+def merge_plan(images, groups):
+    """每组选出保留项：分辨率最高，其次文件最大，再其次路径最短"""
+    plan = []
+    for group in groups:
+        members = [images[i] for i in group]
+        keep = max(members, key=lambda m: (m["width"] * m["height"], m["bytes"], -len(m["path"])))
+        plan.append({
+            "keep": keep["path"],
+            "merge": [
+                {
+                    "path": m["path"],
+                    "width": m["width"],
+                    "height": m["height"],
+                    "dhash_distance": int(popcount(m["dhash"] ^ keep["dhash"])),
+                    "phash_distance": int(popcount(m["phash"] ^ keep["phash"])),
+                }
+                for m in members if m is not keep
+            ],
+        })
+    plan.sort(key=lambda entry: entry["keep"])
+    return plan
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='查找近似重复的图片')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='图片目录，或 .jsonl / .txt 清单')
+    source.add_argument('--store', help='本地内容仓库目录')
+    parser.add_argument('--dhash-threshold', type=int, default=DHASH_THRESHOLD, help='dHash 最大汉明距离')
+    parser.add_argument('--phash-threshold', type=int, default=PHASH_THRESHOLD, help='pHash 最大汉明距离')
+    parser.add_argument('--output', help='合并计划 JSON 输出路径')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行进程数')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("🔎 查找近似重复图片...")
+    print("=" * 60)
+
+    if args.input and not os.path.exists(args.input):
+        print(f"❌ 错误: 输入不存在: {args.input}")
+        exit(1)
+
+    start = time.perf_counter()
+    images, failed = [], []
+    for batch in stream_pool(hash_files, chunks(iter_paths(args), BATCH_SIZE), workers=args.workers):
+        for result in batch:
+            if len(result) == 2:
+                failed.append(result)
+                continue
+            path, width, height, dhash, phash = result
+            images.append({"path": path, "width": width, "height": height,
+                           "bytes": os.path.getsize(path), "dhash": np.uint64(dhash), "phash": np.uint64(phash)})
+        print(f"  … 已计算 {len(images) + len(failed)} 张")
+    hash_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    groups = group_near_duplicates(
+        np.array([m["dhash"] for m in images], dtype=np.uint64),
+        np.array([m["phash"] for m in images], dtype=np.uint64),
+        args.dhash_threshold, args.phash_threshold,
+    )
+    group_time = time.perf_counter() - start
+    plan = merge_plan(images, groups)
+
+    print(f"\n📋 合并计划（{len(plan)} 组）:")
+    for entry in plan:
+        print(f"  保留 {entry['keep']}")
+        for item in entry["merge"]:
+            print(f"    ← {item['path']} ({item['width']}×{item['height']}, "
+                  f"dHash {item['dhash_distance']}, pHash {item['phash_distance']})")
+
+    redundant = sum(len(entry["merge"]) for entry in plan)
+    print("\n" + "=" * 60)
+    print(f"✅ {len(images)} 张图片，{len(plan)} 组近似重复，可合并 {redundant} 张")
+    print(f"   哈希计算 {hash_time:.2f}s，分组 {group_time:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"groups": plan}, f, indent=2, ensure_ascii=False)
+        print(f"📋 合并计划: {args.output}")
+
+    for path, error in failed:
+        print(f"⚠️  无法读取，已跳过: {path} ({error})")
+
+
+if __name__ == '__main__':
+    main()
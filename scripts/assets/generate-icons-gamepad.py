@@ -5,347 +5,196 @@
 需要安装: pip3 install pillow
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
-import math
-
-# 配置
-OUTPUT_DIR = "public/assets/icons"
-BRAND_COLORS = {
-    "primary": "#FF6B35",      # 橙红色 - 充满活力
-    "secondary": "#004E89",    # 深蓝色 - 专业稳重
-    "accent": "#F7B801",       # 金黄色 - 高亮强调
-    "light": "#FFFFFF",        # 白色
-    "dark": "#1A1A2E",         # 深色背景
-}
-
-def hex_to_rgb(hex_color):
-    """将十六进制颜色转换为 RGB 元组"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-def create_gamepad_favicon(size=512):
-    """创建游戏手柄融合设计的 favicon"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+from PIL import Image, ImageDraw
+import argparse
+import functools
 
-    # 背景 - 圆角矩形
-    padding = size // 16
-    bg_rect = [padding, padding, size - padding, size - padding]
-    radius = size // 6
-    draw.rounded_rectangle(bg_rect, radius=radius, fill=hex_to_rgb(BRAND_COLORS["primary"]))
-
-    # === 游戏手柄元素设计 ===
-    center_x = size // 2
-    center_y = size // 2
-
-    # 1. 绘制游戏手柄轮廓（简化版）
-    # 手柄主体
-    gamepad_width = size * 0.7
-    gamepad_height = size * 0.45
-    gamepad_x = center_x - gamepad_width / 2
-    gamepad_y = center_y - gamepad_height / 2 + size * 0.15
-
-    # 手柄背景（半透明白色）
-    draw.rounded_rectangle(
-        [gamepad_x, gamepad_y, gamepad_x + gamepad_width, gamepad_y + gamepad_height],
-        radius=size // 12,
-        fill=(255, 255, 255, 40)
-    )
+from assetkit.fonts import get_font, font_files
+from assetkit.og_compose import OGComposer
+from assetkit.pipeline import build
+from assetkit.scene import Scene, Shape, Text
+from assetkit.supersample import ScaledDraw, new_canvas, reduce
+from assetkit.theme import get_theme
+from assetkit.watch import watch
 
-    # 2. 左侧 - 方向键（D-Pad）设计融入 "R" 字母
-    dpad_x = gamepad_x + gamepad_width * 0.2
-    dpad_y = gamepad_y + gamepad_height * 0.35
-    dpad_size = size // 6
-
-    # 绘制十字方向键
-    # 横向
-    draw.rectangle(
-        [dpad_x, dpad_y + dpad_size // 3,
-         dpad_x + dpad_size, dpad_y + 2 * dpad_size // 3],
-        fill=hex_to_rgb(BRAND_COLORS["accent"])
-    )
-    # 纵向
-    draw.rectangle(
-        [dpad_x + dpad_size // 3, dpad_y,
-         dpad_x + 2 * dpad_size // 3, dpad_y + dpad_size],
-        fill=hex_to_rgb(BRAND_COLORS["accent"])
-    )
+# 配色见 themes.json（品牌色 primary / secondary / accent / light / dark 及派生色），
+# 各绘制函数的 theme 参数为主题名，默认为品牌主题
 
-    # 3. 右侧 - 按钮组设计融入 "G" 字母
-    button_base_x = gamepad_x + gamepad_width * 0.68
-    button_base_y = gamepad_y + gamepad_height * 0.35
-    button_radius = size // 20
-
-    # ABXY 按钮布局
-    button_positions = [
-        (button_base_x + button_radius, button_base_y),                    # 上 (Y)
-        (button_base_x + 2 * button_radius, button_base_y + button_radius), # 右 (B)
-        (button_base_x + button_radius, button_base_y + 2 * button_radius), # 下 (A)
-        (button_base_x, button_base_y + button_radius),                     # 左 (X)
-    ]
-
-    button_colors = [
-        hex_to_rgb(BRAND_COLORS["accent"]),   # Y - 金色
-        hex_to_rgb(BRAND_COLORS["light"]),    # B - 白色
-        hex_to_rgb(BRAND_COLORS["accent"]),   # A - 金色
-        hex_to_rgb(BRAND_COLORS["light"]),    # X - 白色
-    ]
-
-    for pos, color in zip(button_positions, button_colors):
-        draw.ellipse(
-            [pos[0], pos[1], pos[0] + button_radius * 1.5, pos[1] + button_radius * 1.5],
-            fill=color,
-            outline=hex_to_rgb(BRAND_COLORS["dark"]),
-            width=max(1, size // 200)
-        )
-
-    # 4. 绘制 "RG" 文字（大而醒目）
-    try:
-        font_size = int(size * 0.35)
-        font_paths = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/SFNSDisplay.ttf",
-            "/Library/Fonts/Arial Bold.ttf",
-            "/Library/Fonts/Arial.ttf",
-        ]
-
-        font = None
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    font = ImageFont.truetype(path, font_size)
-                    break
-                except Exception as e:
-                    continue
-
-        if not font:
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
-
-    # 文字位置（上方居中）
-    text = "RG"
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-
-    text_x = (size - text_width) // 2
-    text_y = size * 0.2  # 放在上方
-
-    # 绘制文字阴影
-    shadow_offset = max(2, size // 80)
-    draw.text(
-        (text_x + shadow_offset, text_y + shadow_offset),
-        text,
-        fill=hex_to_rgb(BRAND_COLORS["dark"]),
-        font=font
-    )
+# OG 社交媒体图片尺寸
+OG_SIZE = (1200, 630)
 
-    # 绘制主文字
-    draw.text((text_x, text_y), text, fill=hex_to_rgb(BRAND_COLORS["light"]), font=font)
+# 图标在 512×512 的设计稿上定义（坐标为设计稿像素），由场景图按任意尺寸直接绘制
+DESIGN_SIZE = 512
 
-    return img
+# 手柄主体：宽 0.7、高 0.45，水平居中，比画布中心下移 0.15
+GAMEPAD_BODY = (76.8, 217.6, 435.2, 448.0)
 
-def create_gamepad_og_image():
-    """创建游戏手柄主题的 OG 社交媒体图片 (1200x630)"""
-    width, height = 1200, 630
-    img = Image.new('RGB', (width, height), hex_to_rgb(BRAND_COLORS["dark"]))
-    draw = ImageDraw.Draw(img)
+# 方向键：位于手柄左侧 20% / 上方 35% 处，边长 85，横竖两条各占三分之一
+DPAD_X, DPAD_Y, DPAD_SIZE, DPAD_BAR = 148.48, 298.24, 85, 28
+
+# ABXY 按钮：半径 25，左上角位于手柄 68% / 35% 处，直径 1.5 倍半径
+BUTTON_BASE_X, BUTTON_BASE_Y, BUTTON_RADIUS = 320.512, 298.24, 25
+
+
+def _button(x, y, color):
+    d = BUTTON_RADIUS * 1.5
+    return Shape('ellipse', (x, y, x + d, y + d), fill=color, outline="dark", width=DESIGN_SIZE / 200, min_width=1)
+
+
+GAMEPAD_FAVICON = Scene([
+    # 背景 - 圆角矩形
+    ("background", [
+        Shape('rounded', (32, 32, 480, 480), fill="primary", radius=DESIGN_SIZE / 6),
+    ]),
+    # 手柄轮廓（半透明白色）+ 左侧十字方向键 + 右侧 ABXY 按钮
+    ("gamepad", [
+        Shape('rounded', GAMEPAD_BODY, fill=(255, 255, 255, 40), radius=DESIGN_SIZE / 12),
+        Shape('rect', (DPAD_X, DPAD_Y + DPAD_BAR, DPAD_X + DPAD_SIZE, DPAD_Y + 2 * DPAD_BAR), fill="accent"),
+        Shape('rect', (DPAD_X + DPAD_BAR, DPAD_Y, DPAD_X + 2 * DPAD_BAR, DPAD_Y + DPAD_SIZE), fill="accent"),
+        _button(BUTTON_BASE_X + BUTTON_RADIUS, BUTTON_BASE_Y, "accent"),                      # 上 (Y)
+        _button(BUTTON_BASE_X + 2 * BUTTON_RADIUS, BUTTON_BASE_Y + BUTTON_RADIUS, "light"),   # 右 (B)
+        _button(BUTTON_BASE_X + BUTTON_RADIUS, BUTTON_BASE_Y + 2 * BUTTON_RADIUS, "accent"),  # 下 (A)
+        _button(BUTTON_BASE_X, BUTTON_BASE_Y + BUTTON_RADIUS, "light"),                       # 左 (X)
+    ]),
+    # "RG" 文字（水平居中，放在上方）及阴影
+    ("text", [
+        Text("RG", DESIGN_SIZE * 0.35, 'center', DESIGN_SIZE * 0.2, "dark",
+             shift=(DESIGN_SIZE / 80, DESIGN_SIZE / 80), min_shift=2),
+        Text("RG", DESIGN_SIZE * 0.35, 'center', DESIGN_SIZE * 0.2, "light"),
+    ]),
+], unit=DESIGN_SIZE)
+
+# PWA 应用图标：纯色圆角背景 + 居中的白色手柄（宽 0.6、高 0.35）
+APP_PAD = (102.4, 166.4, 409.6, 345.6)
+APP_DPAD_X, APP_DPAD_Y, APP_DPAD_SIZE, APP_DPAD_BAR = 179.2, 224.0, 64, 21
+APP_BUTTON_X, APP_BUTTON_Y, APP_BUTTON_R = 317.44, 256.0, 20
+
+
+def _app_button(x, y):
+    return Shape('ellipse', (x - APP_BUTTON_R, y - APP_BUTTON_R, x + APP_BUTTON_R, y + APP_BUTTON_R), fill="accent")
+
+
+SIMPLE_APP_ICON = Scene([
+    ("background", [
+        Shape('rounded', (0, 0, DESIGN_SIZE, DESIGN_SIZE), fill="primary", radius=DESIGN_SIZE / 6),
+    ]),
+    ("gamepad", [
+        Shape('rounded', APP_PAD, fill="light", radius=DESIGN_SIZE / 15),
+        Shape('rect', (APP_DPAD_X, APP_DPAD_Y + APP_DPAD_BAR, APP_DPAD_X + APP_DPAD_SIZE, APP_DPAD_Y + 2 * APP_DPAD_BAR),
+              fill="primary"),
+        Shape('rect', (APP_DPAD_X + APP_DPAD_BAR, APP_DPAD_Y, APP_DPAD_X + 2 * APP_DPAD_BAR, APP_DPAD_Y + APP_DPAD_SIZE),
+              fill="primary"),
+        _app_button(APP_BUTTON_X, APP_BUTTON_Y - 2 * APP_BUTTON_R),
+        _app_button(APP_BUTTON_X + 2 * APP_BUTTON_R, APP_BUTTON_Y),
+        _app_button(APP_BUTTON_X, APP_BUTTON_Y + 2 * APP_BUTTON_R),
+        _app_button(APP_BUTTON_X - 2 * APP_BUTTON_R, APP_BUTTON_Y),
+    ]),
+], unit=DESIGN_SIZE)
+
+
+def create_gamepad_favicon(size=512, supersample=1, theme=None):
+    """创建游戏手柄融合设计的 favicon（任意尺寸直接绘制）"""
+    return GAMEPAD_FAVICON.render(size, get_theme(theme).colors, supersample)
+
+def draw_og_background(theme=None):
+    """OG 静态图层：深色背景"""
+    return Image.new('RGBA', OG_SIZE, get_theme(theme).colors["dark"] + (255,))
+
+def draw_og_circle(supersample=1, theme=None):
+    """OG 静态图层：右侧装饰圆"""
+    width, height = OG_SIZE
+    img = new_canvas('RGBA', OG_SIZE, (0, 0, 0, 0), supersample)
+    draw = ScaledDraw(ImageDraw.Draw(img), supersample)
 
-    # 背景装饰 - 渐变圆形
     circle_size = 900
     circle_x = width - circle_size // 2 + 100
     circle_y = height // 2 - circle_size // 2
     draw.ellipse(
         [circle_x, circle_y, circle_x + circle_size, circle_y + circle_size],
-        fill=hex_to_rgb(BRAND_COLORS["secondary"])
+        fill=get_theme(theme).colors["secondary"]
     )
+    return reduce(img, supersample)
+
+def draw_og_badge(supersample=1, theme=None):
+    """OG 静态图层：右侧大型游戏手柄图标"""
+    width, height = OG_SIZE
+    img = Image.new('RGBA', OG_SIZE, (0, 0, 0, 0))
+    gamepad_icon = create_gamepad_favicon(400, supersample, theme)
+    img.paste(gamepad_icon, (width - 450, height // 2 - 200))
+    return img
+
+@functools.cache
+def og_composer(supersample=1, theme=None):
+    """OG 图片合成器：静态图层只绘制一次并缓存到磁盘（每个超采样倍数、每个主题一份）"""
+    theme = get_theme(theme)
+    return OGComposer(
+        OG_SIZE,
+        [("background", functools.partial(draw_og_background, theme)),
+         ("circle", functools.partial(draw_og_circle, supersample, theme)),
+         ("badge", functools.partial(draw_og_badge, supersample, theme))],
+        key_parts=[theme.key, GAMEPAD_FAVICON.key, font_files()],
+    )
+
+def create_gamepad_og_image(supersample=1, theme=None):
+    """创建游戏手柄主题的 OG 社交媒体图片 (1200x630)；图形按 supersample 倍超采样"""
+    # 静态底图（背景、装饰圆、手柄徽标）来自缓存，这里只绘制文字
+    theme = get_theme(theme)
+    colors = theme.colors
+    img = og_composer(supersample, theme).canvas()
+    draw = ImageDraw.Draw(img)
 
     # 左侧内容区域
     content_x = 80
 
-    try:
-        font_paths = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/SFNSDisplay.ttf",
-            "/Library/Fonts/Arial.ttf",
-        ]
-
-        title_font = None
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    title_font = ImageFont.truetype(path, 100)
-                    subtitle_font = ImageFont.truetype(path, 40)
-                    small_font = ImageFont.truetype(path, 32)
-                    break
-                except:
-                    continue
-
-        if not title_font:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_font = get_font(100)
+    subtitle_font = get_font(40)
+    small_font = get_font(32)
 
     # 标题 - RunGame
-    draw.text((content_x, 150), "RunGame", fill=hex_to_rgb(BRAND_COLORS["primary"]), font=title_font)
+    draw.text((content_x, 150), "RunGame", fill=colors["primary"], font=title_font)
 
     # 副标题
-    draw.text((content_x, 280), "Free Online Games", fill=hex_to_rgb(BRAND_COLORS["light"]), font=subtitle_font)
+    draw.text((content_x, 280), "Free Online Games", fill=colors["light"], font=subtitle_font)
 
     # 特性说明
     features_y = 360
-    draw.text((content_x, features_y), "🎮 Thousands of games", fill=hex_to_rgb(BRAND_COLORS["accent"]), font=small_font)
-    draw.text((content_x, features_y + 50), "⚡ Play instantly", fill=hex_to_rgb(BRAND_COLORS["light"]), font=small_font)
-    draw.text((content_x, features_y + 100), "📱 No downloads needed", fill=hex_to_rgb(BRAND_COLORS["light"]), font=small_font)
-
-    # 右侧 - 大型游戏手柄图标
-    gamepad_icon = create_gamepad_favicon(400)
-    gamepad_x = width - 450
-    gamepad_y = height // 2 - 200
-    img.paste(gamepad_icon, (gamepad_x, gamepad_y), gamepad_icon)
+    draw.text((content_x, features_y), "🎮 Thousands of games", fill=colors["accent"], font=small_font)
+    draw.text((content_x, features_y + 50), "⚡ Play instantly", fill=colors["light"], font=small_font)
+    draw.text((content_x, features_y + 100), "📱 No downloads needed", fill=colors["light"], font=small_font)
 
     return img
 
-def create_simple_app_icon():
+def create_simple_app_icon(size=512, supersample=1, theme=None):
     """创建简洁的应用图标（用于 PWA）"""
-    size = 512
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # 背景 - 纯色圆角矩形
-    draw.rounded_rectangle(
-        [0, 0, size, size],
-        radius=size // 6,
-        fill=hex_to_rgb(BRAND_COLORS["primary"])
-    )
-
-    # 中心 - 简化的游戏手柄图标
-    center = size // 2
-
-    # 绘制游戏手柄主体
-    pad_width = size * 0.6
-    pad_height = size * 0.35
-    pad_x = center - pad_width / 2
-    pad_y = center - pad_height / 2
-
-    draw.rounded_rectangle(
-        [pad_x, pad_y, pad_x + pad_width, pad_y + pad_height],
-        radius=size // 15,
-        fill=hex_to_rgb(BRAND_COLORS["light"])
-    )
+    return SIMPLE_APP_ICON.render(size, get_theme(theme).colors, supersample)
 
-    # 左侧方向键
-    dpad_size = size // 8
-    dpad_x = pad_x + pad_width * 0.25
-    dpad_y = pad_y + pad_height / 2 - dpad_size / 2
-
-    # 横
-    draw.rectangle(
-        [dpad_x, dpad_y + dpad_size // 3,
-         dpad_x + dpad_size, dpad_y + 2 * dpad_size // 3],
-        fill=hex_to_rgb(BRAND_COLORS["primary"])
-    )
-    # 竖
-    draw.rectangle(
-        [dpad_x + dpad_size // 3, dpad_y,
-         dpad_x + 2 * dpad_size // 3, dpad_y + dpad_size],
-        fill=hex_to_rgb(BRAND_COLORS["primary"])
-    )
-
-    # 右侧按钮
-    button_r = size // 25
-    button_x = pad_x + pad_width * 0.7
-    button_y = pad_y + pad_height / 2
-
-    buttons = [
-        (button_x, button_y - button_r * 2),
-        (button_x + button_r * 2, button_y),
-        (button_x, button_y + button_r * 2),
-        (button_x - button_r * 2, button_y),
-    ]
-
-    for bx, by in buttons:
-        draw.ellipse(
-            [bx - button_r, by - button_r, bx + button_r, by + button_r],
-            fill=hex_to_rgb(BRAND_COLORS["accent"])
-        )
+def main():
+    """生成所有图标（输出路径和尺寸见 asset-spec.json 中的 gamepad/* 节点）"""
+    parser = argparse.ArgumentParser(description='生成游戏手柄融合设计图标')
+    parser.add_argument('--force', action='store_true', help='忽略增量缓存，全部重新生成')
+    parser.add_argument('--watch', action='store_true', help='常驻运行，修改本脚本或规格后只重新生成受影响的图标')
+    args = parser.parse_args()
 
-    return img
+    if args.watch:
+        watch(only=['gamepad/*'])
+        return
 
-def main():
-    """生成所有图标"""
     print("🎮 开始生成 RunGame 游戏手柄融合设计图标...")
     print("=" * 60)
 
-    # 确保输出目录存在
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    # 1. 生成主 favicon（多种尺寸）
-    print("\n📱 生成 Favicon（游戏手柄融合设计）...")
-    base_icon = create_gamepad_favicon(512)
-
-    favicon_sizes = [16, 32, 48, 64, 128, 256, 512]
-    for size in favicon_sizes:
-        resized = base_icon.resize((size, size), Image.Resampling.LANCZOS)
-        filename = f"{OUTPUT_DIR}/favicon-{size}x{size}.png"
-        resized.save(filename, 'PNG', optimize=True)
-        print(f"  ✓ {filename}")
-
-    # 生成 .ico 文件（包含多个尺寸）
-    print("\n🖼️  生成 favicon.ico...")
-    ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64)]
-    ico_images = [base_icon.resize(size, Image.Resampling.LANCZOS) for size in ico_sizes]
-
-    # 保存到 public 根目录
-    ico_path = "public/favicon.ico"
-    ico_images[0].save(ico_path, format='ICO', sizes=ico_sizes)
-    print(f"  ✓ {ico_path}")
-
-    # 2. 生成 Apple Touch Icon
-    print("\n🍎 生成 Apple Touch Icon...")
-    apple_icon = base_icon.resize((180, 180), Image.Resampling.LANCZOS)
-    apple_path = f"{OUTPUT_DIR}/apple-touch-icon.png"
-    apple_icon.save(apple_path, 'PNG', optimize=True)
-    print(f"  ✓ {apple_path}")
-
-    # 3. 生成 Web App Manifest Icons（简洁版）
-    print("\n📲 生成 PWA App Icons...")
-    app_icon_base = create_simple_app_icon()
-
-    manifest_sizes = [192, 512]
-    for size in manifest_sizes:
-        resized = app_icon_base.resize((size, size), Image.Resampling.LANCZOS)
-        filename = f"{OUTPUT_DIR}/icon-{size}x{size}.png"
-        resized.save(filename, 'PNG', optimize=True)
-        print(f"  ✓ {filename}")
-
-    # 4. 生成 Open Graph 社交媒体图片
-    print("\n🌐 生成 Open Graph 图片...")
-    og_image = create_gamepad_og_image()
-
-    og_path = "public/og-image.png"
-    og_image.save(og_path, 'PNG', optimize=True)
-    print(f"  ✓ {og_path}")
-
-    twitter_path = "public/twitter-image.png"
-    og_image.save(twitter_path, 'PNG', optimize=True)
-    print(f"  ✓ {twitter_path}")
+    # 与 build-assets.py 共用同一份规格和调度：共享母版、并发执行、未变化的输出跳过
+    if not build(only=['gamepad/*'], force=args.force):
+        exit(1)
 
     print("\n" + "=" * 60)
     print("✅ 所有游戏手柄融合设计图标生成完成！")
     print("\n📋 生成的文件清单:")
-    print("  • favicon.ico - 多尺寸合一 (16, 32, 48, 64)")
-    print("  • favicon-*.png - 从 16x16 到 512x512")
-    print("  • apple-touch-icon.png - 180x180")
-    print("  • icon-*.png - PWA 应用图标 (192, 512)")
-    print("  • og-image.png - 社交媒体分享 (1200x630)")
-    print("  • twitter-image.png - Twitter 卡片 (1200x630)")
+    print("  • public/favicon.ico - 多尺寸合一 (16, 32, 48, 64)")
+    print("  • public/assets/icons/favicon-*.png - 从 16x16 到 512x512")
+    print("  • public/assets/icons/apple-touch-icon.png - 180x180")
+    print("  • public/assets/icons/icon-*.png - PWA 应用图标 (192, 512)")
+    print("  • public/og-image.png - 社交媒体分享 (1200x630)")
+    print("  • public/twitter-image.png - Twitter 卡片 (1200x630)")
 
     print("\n🎨 设计特点:")
     print("  ✓ 游戏手柄元素融入品牌设计")
@@ -4,152 +4,83 @@
 需要安装: pip install pillow
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
-
-# 配置
-OUTPUT_DIR = "public"
-BRAND_COLORS = {
-    "primary": "#FF6B35",      # 橙红色 - 充满活力
-    "secondary": "#004E89",    # 深蓝色 - 专业稳重
-    "accent": "#F7B801",       # 金黄色 - 高亮强调
-    "light": "#FFFFFF",        # 白色
-    "dark": "#1A1A2E",         # 深色背景
-}
+from PIL import ImageDraw
+import argparse
+
+from assetkit.fonts import get_font
+from assetkit.pipeline import build
+from assetkit.scene import Scene, Shape, Text
+from assetkit.supersample import ScaledDraw, new_canvas, reduce
+from assetkit.theme import get_theme
+from assetkit.watch import watch
+
+# 配色见 themes.json，各绘制函数的 theme 参数为主题名，默认为品牌主题
 
 def create_rounded_rectangle(draw, xy, radius, fill):
     """绘制圆角矩形"""
     x1, y1, x2, y2 = xy
     draw.rounded_rectangle(xy, radius=radius, fill=fill)
 
-def create_favicon(size=512):
-    """创建主图标 - 游戏手柄风格的 RG 标识"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # 背景 - 渐变效果的圆角矩形
-    padding = size // 16
-    bg_rect = [padding, padding, size - padding, size - padding]
-    radius = size // 8
-
-    # 主背景色
-    draw.rounded_rectangle(bg_rect, radius=radius, fill=BRAND_COLORS["primary"])
-
-    # 添加装饰性图形 - 游戏手柄按钮风格
-    button_size = size // 8
-    button_margin = size // 4
-
-    # 左上角按钮组 (ABXY风格)
-    positions = [
-        (button_margin, button_margin + button_size),  # 上
-        (button_margin + button_size, button_margin),  # 右
-        (button_margin, button_margin),                # 左上
-    ]
-
-    for x, y in positions:
-        draw.ellipse([x, y, x + button_size//1.5, y + button_size//1.5],
-                     fill=BRAND_COLORS["accent"],
-                     outline=BRAND_COLORS["light"],
-                     width=size//100)
-
-    # 绘制 "RG" 文字
-    try:
-        # 尝试使用系统字体
-        font_size = size // 2
-        # macOS 常见字体
-        font_paths = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/SFNSDisplay.ttf",
-            "/Library/Fonts/Arial.ttf",
-        ]
-        font = None
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    font = ImageFont.truetype(path, font_size)
-                    break
-                except:
-                    continue
-
-        if not font:
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
-
-    # 文字位置居中
-    text = "RG"
-
-    # 使用 textbbox 获取文字边界
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-
-    x = (size - text_width) // 2
-    y = (size - text_height) // 2 + size // 10  # 稍微向下偏移
-
-    # 绘制文字阴影
-    shadow_offset = size // 50
-    draw.text((x + shadow_offset, y + shadow_offset), text,
-              fill=BRAND_COLORS["dark"], font=font)
-
-    # 绘制主文字
-    draw.text((x, y), text, fill=BRAND_COLORS["light"], font=font)
-
-    return img
-
-def create_og_image():
-    """创建 Open Graph 社交媒体分享图片 (1200x630)"""
+# 图标在 512×512 的设计稿上定义（坐标为设计稿像素），由场景图按任意尺寸直接绘制
+DESIGN_SIZE = 512
+
+# 左上角 ABXY 风格按钮组：左上角位于 (128, 128) 起的网格上，直径 42（按钮边长 64 的三分之二）
+BUTTON_SIZE, BUTTON_DIAMETER = 64, 42
+
+
+def _button(x, y):
+    return Shape('ellipse', (x, y, x + BUTTON_DIAMETER, y + BUTTON_DIAMETER), fill="accent", outline="light",
+                 width=DESIGN_SIZE / 100)
+
+
+FAVICON = Scene([
+    # 背景 - 圆角矩形
+    ("background", [
+        Shape('rounded', (32, 32, 480, 480), fill="primary", radius=DESIGN_SIZE / 8),
+    ]),
+    # 装饰性图形 - 游戏手柄按钮风格
+    ("buttons", [
+        _button(2 * BUTTON_SIZE, 3 * BUTTON_SIZE),  # 上
+        _button(3 * BUTTON_SIZE, 2 * BUTTON_SIZE),  # 右
+        _button(2 * BUTTON_SIZE, 2 * BUTTON_SIZE),  # 左上
+    ]),
+    # "RG" 文字居中、稍微向下偏移，及阴影
+    ("text", [
+        Text("RG", DESIGN_SIZE / 2, 'center', 'center', "dark",
+             shift=(DESIGN_SIZE / 50, DESIGN_SIZE / 10 + DESIGN_SIZE / 50)),
+        Text("RG", DESIGN_SIZE / 2, 'center', 'center', "light", shift=(0, DESIGN_SIZE / 10)),
+    ]),
+], unit=DESIGN_SIZE)
+
+# 应用图标：圆角背景 + 中心白色圆形 + 播放三角形
+APP_ICON = Scene([
+    ("background", [
+        Shape('rounded', (0, 0, DESIGN_SIZE, DESIGN_SIZE), fill="primary", radius=DESIGN_SIZE / 8),
+    ]),
+    ("play", [
+        Shape('ellipse', (86, 86, 426, 426), fill="light"),
+        Shape('polygon', [(218, 200), (218, 312), (330, 256)], fill="primary"),
+    ]),
+], unit=DESIGN_SIZE)
+
+
+def create_favicon(size=512, supersample=1, theme=None):
+    """创建主图标 - 游戏手柄风格的 RG 标识（任意尺寸直接绘制）"""
+    return FAVICON.render(size, get_theme(theme).colors, supersample)
+
+def create_og_image(supersample=1, theme=None):
+    """创建 Open Graph 社交媒体分享图片 (1200x630)；图形按 supersample 倍超采样，文字直接绘制"""
+    colors = get_theme(theme).colors
     width, height = 1200, 630
-    img = Image.new('RGB', (width, height), BRAND_COLORS["dark"])
-    draw = ImageDraw.Draw(img)
+    img = new_canvas('RGB', (width, height), colors["dark"], supersample)
+    draw = ScaledDraw(ImageDraw.Draw(img), supersample)
 
     # 背景装饰 - 大圆形
     circle_size = 800
     circle_x = width - circle_size // 2
     circle_y = height // 2 - circle_size // 2
     draw.ellipse([circle_x, circle_y, circle_x + circle_size, circle_y + circle_size],
-                 fill=BRAND_COLORS["secondary"], outline=None)
-
-    # 左侧区域 - 主要内容
-    content_x = 80
-
-    # 绘制标题
-    try:
-        title_font = None
-        font_paths = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/SFNSDisplay.ttf",
-            "/Library/Fonts/Arial.ttf",
-        ]
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    title_font = ImageFont.truetype(path, 100)
-                    subtitle_font = ImageFont.truetype(path, 40)
-                    break
-                except:
-                    continue
-
-        if not title_font:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-
-    # 标题
-    draw.text((content_x, 180), "RunGame",
-              fill=BRAND_COLORS["primary"], font=title_font)
-
-    # 副标题
-    draw.text((content_x, 310), "Free Online Games",
-              fill=BRAND_COLORS["light"], font=subtitle_font)
-
-    # 描述文字
-    draw.text((content_x, 380), "Play thousands of games instantly",
-              fill=BRAND_COLORS["accent"], font=subtitle_font)
-    draw.text((content_x, 430), "No downloads • No registration",
-              fill=BRAND_COLORS["light"], font=subtitle_font)
+                 fill=colors["secondary"], outline=None)
 
     # 添加游戏图标装饰
     icon_size = 200
@@ -166,7 +97,7 @@ def create_og_image():
         [controller_x, controller_y,
          controller_x + controller_width, controller_y + controller_height],
         radius=40,
-        fill=BRAND_COLORS["primary"]
+        fill=colors["primary"]
     )
 
     # 十字方向键
@@ -175,10 +106,10 @@ def create_og_image():
     dpad_size = 35
     draw.rectangle([dpad_x + dpad_size//3, dpad_y,
                    dpad_x + 2*dpad_size//3, dpad_y + dpad_size],
-                  fill=BRAND_COLORS["dark"])
+                  fill=colors["dark"])
     draw.rectangle([dpad_x, dpad_y + dpad_size//3,
                    dpad_x + dpad_size, dpad_y + 2*dpad_size//3],
-                  fill=BRAND_COLORS["dark"])
+                  fill=colors["dark"])
 
     # 按钮组
     button_x = controller_x + controller_width - 70
@@ -191,113 +122,69 @@ def create_og_image():
         (button_x + 2*button_r, button_y + 2*button_r), # 下
     ]
 
-    colors = [BRAND_COLORS["accent"], BRAND_COLORS["light"],
-              BRAND_COLORS["accent"], BRAND_COLORS["light"]]
+    button_colors = [colors["accent"], colors["light"],
+                     colors["accent"], colors["light"]]
 
-    for (bx, by), color in zip(button_positions, colors):
+    for (bx, by), color in zip(button_positions, button_colors):
         draw.ellipse([bx, by, bx + 2*button_r, by + 2*button_r],
-                     fill=color, outline=BRAND_COLORS["dark"], width=2)
-
-    return img
+                     fill=color, outline=colors["dark"], width=2)
 
-def create_app_icon():
-    """创建应用图标 - 更简洁的版本"""
-    size = 512
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = reduce(img, supersample)
     draw = ImageDraw.Draw(img)
 
-    # 简单的渐变背景
-    padding = 0
-    draw.rounded_rectangle(
-        [padding, padding, size - padding, size - padding],
-        radius=size // 8,
-        fill=BRAND_COLORS["primary"]
-    )
+    # 左侧区域 - 主要内容
+    content_x = 80
 
-    # 中心圆形
-    center = size // 2
-    circle_radius = size // 3
-    draw.ellipse(
-        [center - circle_radius, center - circle_radius,
-         center + circle_radius, center + circle_radius],
-        fill=BRAND_COLORS["light"]
-    )
+    # 绘制标题
+    title_font = get_font(100)
+    subtitle_font = get_font(40)
 
-    # 播放三角形
-    triangle_size = circle_radius // 1.5
-    triangle_offset = triangle_size // 6
-    triangle = [
-        (center - triangle_size//2 + triangle_offset, center - triangle_size//2),
-        (center - triangle_size//2 + triangle_offset, center + triangle_size//2),
-        (center + triangle_size//2 + triangle_offset, center),
-    ]
-    draw.polygon(triangle, fill=BRAND_COLORS["primary"])
+    # 标题
+    draw.text((content_x, 180), "RunGame",
+              fill=colors["primary"], font=title_font)
+
+    # 副标题
+    draw.text((content_x, 310), "Free Online Games",
+              fill=colors["light"], font=subtitle_font)
+
+    # 描述文字
+    draw.text((content_x, 380), "Play thousands of games instantly",
+              fill=colors["accent"], font=subtitle_font)
+    draw.text((content_x, 430), "No downloads • No registration",
+              fill=colors["light"], font=subtitle_font)
 
     return img
 
+def create_app_icon(size=512, supersample=1, theme=None):
+    """创建应用图标 - 更简洁的版本"""
+    return APP_ICON.render(size, get_theme(theme).colors, supersample)
+
 def main():
-    """生成所有图标"""
+    """生成所有图标（输出路径和尺寸见 asset-spec.json 中的 classic/* 节点）"""
+    parser = argparse.ArgumentParser(description='生成 RunGame 图标')
+    parser.add_argument('--force', action='store_true', help='忽略增量缓存，全部重新生成')
+    parser.add_argument('--watch', action='store_true', help='常驻运行，修改本脚本或规格后只重新生成受影响的图标')
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(only=['classic/*'])
+        return
+
     print("🎮 开始生成 RunGame 图标...")
 
-    # 确保输出目录存在
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    # 1. 生成主 favicon (多种尺寸)
-    print("\n📱 生成 Favicon...")
-    base_icon = create_favicon(512)
-
-    favicon_sizes = [16, 32, 48, 64, 128, 256, 512]
-    for size in favicon_sizes:
-        resized = base_icon.resize((size, size), Image.Resampling.LANCZOS)
-        filename = f"{OUTPUT_DIR}/favicon-{size}x{size}.png"
-        resized.save(filename, 'PNG')
-        print(f"  ✓ {filename}")
-
-    # 生成 .ico 文件 (包含多个尺寸)
-    ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64)]
-    ico_images = [base_icon.resize(size, Image.Resampling.LANCZOS) for size in ico_sizes]
-    ico_images[0].save(
-        f"{OUTPUT_DIR}/favicon.ico",
-        format='ICO',
-        sizes=ico_sizes
-    )
-    print(f"  ✓ {OUTPUT_DIR}/favicon.ico")
-
-    # 2. 生成 Apple Touch Icon
-    print("\n🍎 生成 Apple Touch Icon...")
-    apple_icon = base_icon.resize((180, 180), Image.Resampling.LANCZOS)
-    apple_icon.save(f"{OUTPUT_DIR}/apple-touch-icon.png", 'PNG')
-    print(f"  ✓ {OUTPUT_DIR}/apple-touch-icon.png")
-
-    # 3. 生成 Web App Manifest Icons
-    print("\n📲 生成 Web App Manifest Icons...")
-    manifest_sizes = [192, 512]
-    app_icon_base = create_app_icon()
-
-    for size in manifest_sizes:
-        resized = app_icon_base.resize((size, size), Image.Resampling.LANCZOS)
-        filename = f"{OUTPUT_DIR}/icon-{size}x{size}.png"
-        resized.save(filename, 'PNG')
-        print(f"  ✓ {filename}")
-
-    # 4. 生成 Open Graph 图片
-    print("\n🌐 生成 Open Graph 社交媒体图片...")
-    og_image = create_og_image()
-    og_image.save(f"{OUTPUT_DIR}/og-image.png", 'PNG')
-    print(f"  ✓ {OUTPUT_DIR}/og-image.png")
-
-    # 生成 Twitter Card 图片 (与 OG 相同)
-    og_image.save(f"{OUTPUT_DIR}/twitter-image.png", 'PNG')
-    print(f"  ✓ {OUTPUT_DIR}/twitter-image.png")
+    # 与 build-assets.py 共用同一份规格和调度；favicon.ico 和 OG 图片归游戏手柄设计所有，
+    # 这里的版本写到 public/assets/icons/classic/，不再互相覆盖
+    if not build(only=['classic/*'], force=args.force):
+        exit(1)
 
     print("\n✅ 所有图标生成完成！")
     print("\n📋 生成的文件列表:")
-    print("  • favicon.ico (16, 32, 48, 64)")
     print("  • favicon-*.png (16x16 到 512x512)")
     print("  • apple-touch-icon.png (180x180)")
     print("  • icon-*.png (192x192, 512x512)")
-    print("  • og-image.png (1200x630)")
-    print("  • twitter-image.png (1200x630)")
+    print("  • assets/icons/classic/favicon.ico (16, 32, 48, 64)")
+    print("  • assets/icons/classic/og-image.png (1200x630)")
+    print("  • assets/icons/classic/twitter-image.png (1200x630)")
 
     print("\n💡 下一步:")
     print("  1. 检查生成的图标")
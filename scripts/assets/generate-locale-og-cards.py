@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+为每种语言的站点页面生成 OG 卡片
+
+读取 i18n/messages/ 下的消息目录，为每种语言 × 每种页面类型（首页、全部游戏、分类、标签、
+搜索、关于等，见 assetkit/locale_cards.py 的 PAGES）渲染 1200×630 卡片，按语言选择字体
+（中日韩、从右向左书写的语言），文件名包含内容哈希，并写出 manifest.json（"语言/页面" → 文件路径）。
+每种语言作为一个任务交给进程池，新增一种语言只多一批约 10 张卡片。
+
+系统上没有某种文字的字体时（如 Linux 上没装 Noto CJK），该语言报错跳过，可用 --font 指定字体文件:
+  python3 scripts/assets/generate-locale-og-cards.py --font cjk=/path/to/NotoSansCJK-Bold.ttc
+需要安装: pip3 install pillow
+"""
+
+import argparse
+import json
+import os
+import time
+
+from assetkit.fonts import add_font, font_files, font_option
+from assetkit.loader import load_script
+from assetkit.locale_cards import MESSAGES_DIR, PAGES, Typesetter, card_text, init_worker, load_catalogs, render_locale
+from assetkit.parallel import stream_pool, default_workers
+
+OUTPUT_DIR = 'public/og/locales'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='生成多语言 OG 卡片')
+    parser.add_argument('--messages-dir', default=MESSAGES_DIR, help='消息目录（每种语言一个 JSON）')
+    parser.add_argument('--locales', nargs='+', metavar='LOCALE', help='只生成这些语言（默认全部）')
+    parser.add_argument('--pages', nargs='+', choices=list(PAGES), help='只生成这些页面类型（默认全部）')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='输出目录')
+    parser.add_argument('--font', action='append', default=[], metavar='FAMILY=PATH',
+                        help='优先使用的字体文件（可重复），如 cjk=/path/to/NotoSansCJK-Bold.ttc')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行进程数')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("🌐 生成多语言 OG 卡片...")
+    print("=" * 60)
+
+    try:
+        fonts = [font_option(value) for value in args.font]
+        for family, path in fonts:
+            add_font(family, path)
+        catalogs = load_catalogs(args.messages_dir, args.locales)
+    except ValueError as e:
+        print(f"❌ 错误: {e}")
+        exit(1)
+
+    pages = args.pages or list(PAGES)
+    tasks, failed = [], []
+    for locale, catalog in catalogs.items():
+        try:
+            typesetter = Typesetter(locale)
+            texts = [(page, card_text(catalog, page)) for page in pages]
+        except ValueError as e:
+            print(f"❌ {locale}: {e}")
+            failed.append(locale)
+            continue
+        font = os.path.basename(font_files(typesetter.family)[0])
+        direction = '，从右向左' if typesetter.direction == 'rtl' else ''
+        print(f"  • {locale}: {len(texts)} 张（{typesetter.family} 字体 {font}{direction}）")
+        tasks.append((locale, texts))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    manifest_path = os.path.join(args.output_dir, 'manifest.json')
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    start = time.perf_counter()
+
+    # 先在主进程生成静态底图缓存，worker 启动时直接读取
+    load_script('generate-icons-gamepad').og_composer().static()
+
+    rendered = skipped = 0
+    over_budget = []
+    results = stream_pool(
+        render_locale, tasks, workers=min(args.workers, max(1, len(tasks))),
+        initializer=init_worker, initargs=(args.output_dir, fonts),
+    )
+    for batch in results:
+        for key, relative, created, ok in batch:
+            manifest[key] = relative
+            if not ok:
+                over_budget.append(relative)
+            if created:
+                rendered += 1
+            else:
+                skipped += 1
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    print(f"✅ 完成！{len(tasks)} 种语言，新生成 {rendered} 张，未变化跳过 {skipped} 张，耗时 {elapsed:.2f}s")
+    print(f"📋 清单: {manifest_path}")
+
+    for relative in over_budget:
+        print(f"❌ 超出体积预算: {relative}")
+    if failed:
+        print(f"❌ 未生成的语言: {', '.join(failed)}")
+    if over_budget or failed:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+生成 Logo 全部尺寸 × 配色变体
+
+默认从 logo-rungame.svg 按每个尺寸直接渲染（没有 SVG 渲染后端时读取一次
+logo-rungame-1024.png 母版再缩放），在进程池中并行生成
+尺寸 × 配色（color / white / dark / monochrome）的完整矩阵。
+需要安装: pip3 install pillow（SVG 母版另需 cairosvg、resvg-py 或 rsvg-convert 之一）
+"""
+
+import argparse
+import os
+import time
+
+from assetkit.formats import VariantWriter
+from assetkit.logo_variants import (
+    COLORWAYS, LOGO_SIZES, load_master, init_worker, init_svg_worker, render_variant, variant_filename,
+)
+from assetkit.memory import memory_limit_mb
+from assetkit.parallel import run_pool, default_workers
+from assetkit.pipeline import output_owners
+from assetkit.svg import default_backend, read_svg
+
+# 优先使用矢量母版；没有可用的 SVG 渲染后端时退回 1024 位图母版
+INPUT_FILE = 'public/logo/logo-rungame.svg'
+FALLBACK_INPUT_FILE = 'public/logo/logo-rungame-1024.png'
+OUTPUT_DIR = 'public/logo'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='生成 Logo 尺寸 × 配色变体')
+    parser.add_argument('--input', help=f'母版 SVG 或 PNG 路径（默认 {INPUT_FILE}）')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='输出目录')
+    parser.add_argument('--sizes', type=int, nargs='+', default=LOGO_SIZES)
+    parser.add_argument('--colorways', nargs='+', default=list(COLORWAYS), choices=list(COLORWAYS))
+    parser.add_argument('--memory-limit', type=int, help='每个 worker 的内存上限（MB），默认读取 ASSET_WORKER_MEMORY_MB')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行进程数')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("🎨 生成 Logo 变体...")
+    print("=" * 60)
+
+    backend = default_backend()
+    if args.input is None:
+        args.input = INPUT_FILE if backend else FALLBACK_INPUT_FILE
+        if not backend:
+            print("⚠️  没有可用的 SVG 渲染后端（cairosvg / resvg-py / rsvg-convert），使用位图母版缩放")
+
+    if not os.path.exists(args.input):
+        print(f"❌ 错误: 母版文件不存在: {args.input}")
+        exit(1)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    memory_limit = memory_limit_mb(args.memory_limit)
+
+    start = time.perf_counter()
+    if args.input.lower().endswith('.svg'):
+        if not backend:
+            print("❌ 错误: 渲染 SVG 需要安装 cairosvg、resvg-py 或 rsvg-convert")
+            exit(1)
+        print(f"📖 矢量母版: {args.input}（{backend}，每个尺寸直接渲染）")
+        initializer, initargs = init_svg_worker, (read_svg(args.input), backend, memory_limit)
+    else:
+        master = load_master(args.input, max(args.sizes))
+        print(f"📖 母版: {args.input} ({master.size[0]}×{master.size[1]})")
+        initializer, initargs = init_worker, (master.size, master.tobytes(), memory_limit)
+
+    tasks = [(colorway, size, args.output_dir)
+             for colorway in args.colorways for size in args.sizes]
+    master_path = None if args.input.lower().endswith('.svg') else os.path.abspath(args.input)
+    owners = output_owners()
+    for task in list(tasks):
+        path = os.path.join(args.output_dir, variant_filename(task[0], task[1]))
+        # 位图母版本身就是某个输出（默认的 logo-rungame-1024.png），不能用重新编码（调色板量化）的副本覆盖它
+        if os.path.abspath(path) == master_path:
+            print(f"  · {path}（母版本身，跳过）")
+            tasks.remove(task)
+            continue
+        # asset-spec.json 中已有节点写出的文件（如 logo-rungame-white-512.png）只由该节点生成
+        owner = owners.get(os.path.abspath(path))
+        if owner:
+            print(f"  · {path}（由 asset-spec.json 的 {owner} 节点生成，跳过）")
+            tasks.remove(task)
+    print(f"⚙️  {len(tasks)} 个输出，{args.workers} 个进程")
+
+    results = run_pool(
+        render_variant, tasks, workers=args.workers,
+        initializer=initializer, initargs=initargs,
+    )
+
+    total_bytes = baseline_bytes = 0
+    failed = []
+    # WebP / AVIF 变体已在 worker 中生成，这里只登记到清单
+    variants = VariantWriter(workers=1)
+    for path, size, baseline, ok, formats in results:
+        variants.record(path, formats)
+        total_bytes += size
+        baseline_bytes += baseline
+        print(f"  {'✓' if ok else '✗'} {path} ({size / 1024:.1f}KB)")
+        if not ok:
+            failed.append(path)
+
+    variants.finish()
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    print(f"✅ 完成！共 {len(results)} 个 PNG，{total_bytes / 1024:.1f}KB"
+          f"（节省 {(baseline_bytes - total_bytes) / 1024:.1f}KB），耗时 {elapsed:.2f}s")
+
+    if failed:
+        for path in failed:
+            print(f"❌ 超出体积预算: {path}")
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
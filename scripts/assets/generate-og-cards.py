@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+批量预渲染游戏 / 分类 / 标签的 OG 卡片
+
+从 JSONL 导出文件（scripts/utils/export-og-records.ts 生成）逐行读取记录，
+在进程池中渲染 1200×630 静态卡片，文件名包含内容哈希，
+并写出 manifest.json（"类型/slug" → 文件路径）。
+需要安装: pip3 install pillow
+"""
+
+import argparse
+import json
+import os
+import time
+
+from assetkit.loader import load_script
+from assetkit.og_cards import init_worker, render_record
+from assetkit.parallel import stream_pool, default_workers
+
+INPUT_FILE = 'og-records.jsonl'
+OUTPUT_DIR = 'public/og'
+
+
+def read_records(path):
+    """逐行读取 JSONL，不一次性加载整个文件"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_no} 不是合法的 JSON: {e}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='批量生成 OG 卡片')
+    parser.add_argument('--input', default=INPUT_FILE, help='JSONL 导出文件')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='输出目录')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行进程数')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("🌐 批量生成 OG 卡片...")
+    print("=" * 60)
+
+    if not os.path.exists(args.input):
+        print(f"❌ 错误: 导出文件不存在: {args.input}")
+        print("   先运行: npx tsx scripts/utils/export-og-records.ts")
+        exit(1)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+
+    # 先在主进程生成静态底图缓存，worker 启动时直接读取
+    load_script('generate-icons-gamepad').og_composer().static()
+
+    manifest = {}
+    rendered = skipped = 0
+    over_budget = []
+
+    results = stream_pool(
+        render_record, read_records(args.input), workers=args.workers,
+        initializer=init_worker, initargs=(args.output_dir,),
+    )
+    for key, relative, created, ok in results:
+        manifest[key] = relative
+        if not ok:
+            over_budget.append(relative)
+        if created:
+            rendered += 1
+        else:
+            skipped += 1
+        if (rendered + skipped) % 500 == 0:
+            print(f"  … 已处理 {rendered + skipped} 条")
+
+    manifest_path = os.path.join(args.output_dir, 'manifest.json')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    print(f"✅ 完成！新生成 {rendered} 张，未变化跳过 {skipped} 张，耗时 {elapsed:.2f}s")
+    print(f"📋 清单: {manifest_path}")
+
+    if over_budget:
+        for relative in over_budget:
+            print(f"❌ 超出体积预算: {relative}")
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+批量生成游戏缩略图的响应式派生图
+
+输入为原图目录（递归查找图片）或清单文件：
+  .jsonl — 每行 {"key"?, "path"}，key 缺省时取文件名
+  .txt   — 每行一个图片路径
+每张原图按宽度阶梯输出 WebP（可选 PNG），并计算 BlurHash / LQIP 占位符。
+任务流式分发到进程池，同时在处理中的图片数量有上限，数万张也保持内存恒定。
+结果逐行写入 <输出目录>/thumbnails.jsonl；再次运行时未变化的原图直接跳过。
+指定 --store 时，新生成的原图及其派生图同时登记到本地内容仓库（见 content-store.py）。
+需要安装: pip3 install pillow numpy
+"""
+
+import argparse
+import json
+import os
+import time
+
+from assetkit.content_store import ContentStore
+from assetkit.memory import memory_limit_mb
+from assetkit.parallel import stream_pool, default_workers
+from assetkit.sources import iter_sources
+from assetkit.thumbnails import WIDTHS, THUMB_FORMATS, PLACEHOLDERS, init_worker, process
+
+OUTPUT_DIR = 'public/thumbnails'
+MANIFEST_NAME = 'thumbnails.jsonl'
+
+
+def load_manifest(path):
+    """读取上次的清单（key → 条目），用于跳过未变化的原图"""
+    entries = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if "error" not in entry:
+                        entries[entry["key"]] = entry
+    return entries
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='批量生成游戏缩略图派生图')
+    parser.add_argument('--input', required=True, help='原图目录，或 .jsonl / .txt 清单')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='输出目录')
+    parser.add_argument('--widths', default=','.join(map(str, WIDTHS)), help='宽度阶梯，逗号分隔')
+    parser.add_argument('--formats', default='webp', help=f"输出格式，逗号分隔（{', '.join(THUMB_FORMATS)}）")
+    parser.add_argument('--placeholder', choices=PLACEHOLDERS, default='blurhash', help='占位符类型')
+    parser.add_argument('--store', help='同时登记到内容仓库（目录）')
+    parser.add_argument('--memory-limit', type=int, help='每个 worker 的内存上限（MB），默认读取 ASSET_WORKER_MEMORY_MB')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='并行进程数')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    widths = sorted({int(w) for w in args.widths.split(',')})
+    formats = [f.strip() for f in args.formats.split(',')]
+    unknown = set(formats) - set(THUMB_FORMATS)
+    if unknown:
+        print(f"❌ 错误: 未知的输出格式: {', '.join(sorted(unknown))}")
+        exit(1)
+
+    print("🖼️  批量生成缩略图派生图...")
+    print("=" * 60)
+
+    if not os.path.exists(args.input):
+        print(f"❌ 错误: 输入不存在: {args.input}")
+        exit(1)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    manifest_path = os.path.join(args.output_dir, MANIFEST_NAME)
+    previous = load_manifest(manifest_path)
+    store = ContentStore(args.store) if args.store else None
+
+    start = time.perf_counter()
+    processed = skipped = 0
+    failed = []
+    total_bytes = 0
+
+    tasks = ((key, path, previous.get(key)) for key, path in iter_sources(args.input))
+    results = stream_pool(
+        process, tasks, workers=args.workers,
+        initializer=init_worker, initargs=(args.output_dir, widths, formats, args.placeholder, memory_limit_mb(args.memory_limit)),
+    )
+
+    # 先写临时文件，整批完成后再替换，避免中途中断留下不完整的清单
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        for entry, created in results:
+            out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if "error" in entry:
+                failed.append(entry)
+            elif created:
+                processed += 1
+                total_bytes += sum(item["bytes"] for variant in entry["variants"]
+                                   for item in variant["files"].values())
+                if store:
+                    digest, _ = store.put_file(entry["source"], source=entry["source"])
+                    for variant in entry["variants"]:
+                        for fmt, item in variant["files"].items():
+                            path = os.path.join(args.output_dir, item["path"])
+                            store.add_variant(digest, f"{variant['width']}.{fmt}", path, item["bytes"])
+            else:
+                skipped += 1
+            if (processed + skipped + len(failed)) % 500 == 0:
+                print(f"  … 已处理 {processed + skipped + len(failed)} 张")
+    os.replace(tmp_path, manifest_path)
+    if store:
+        store.close()
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 60)
+    print(f"✅ 完成！新生成 {processed} 张（{total_bytes / 1024 / 1024:.1f}MB），"
+          f"未变化跳过 {skipped} 张，耗时 {elapsed:.2f}s")
+    print(f"📋 清单: {manifest_path}")
+
+    if failed:
+        for entry in failed:
+            print(f"❌ {entry['source']}: {entry['error']}")
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,72 +2,156 @@
 """
 生成白色版本的 Logo
 
-将现有的彩色 logo PNG 转换为白色版本，用于在深色背景上显示。
-保留透明度通道，只修改 RGB 值为白色。
+将彩色 logo 转换为白色版本，用于在深色背景上显示。
+默认从矢量母版 logo-rungame.svg 替换填充色后按 --size 直接渲染（见 assetkit/svg.py）；
+没有可用的 SVG 渲染后端（cairosvg、resvg-py 或 rsvg-convert）或 --input 指定 PNG 时，
+回退为位图着色：由 alpha 通道经查找表整图向量化生成各颜色通道，超大原图按条带分块处理，
+保留透明度，只把可见像素的 RGB 改为目标颜色（见 assetkit/recolor.py）。
+可通过 --color 生成其他单色版本，颜色也可以写主题中的颜色名（见 assetkit/theme.py），
+如 --color on-secondary（放在品牌蓝上的高对比度颜色）或 --color dark:light。
+默认输出 logo-rungame-white-512.png 由 asset-spec.json 的 logo/white-512 节点负责，
+此时交给 build-assets.py 的构建流程生成；其他颜色或尺寸请用 --output 写到别的路径。
 """
 
-from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import os
 
+from assetkit.build_cache import BuildCache
+from assetkit.encode import PngEncoder, encode_png
+from assetkit.formats import FORMATS, VariantWriter
+from assetkit.logo_variants import render_monochrome
+from assetkit.memory import memory_limit_mb, open_image
+from assetkit.pipeline import build, load_spec, output_owners
+from assetkit.recolor import recolor, recolor_strips, parse_color, WHITE
+from assetkit.svg import default_backend, rasterize, substitute_fill
+from assetkit.theme import theme_color
+
 # 输入和输出文件路径
+SVG_INPUT_FILE = 'public/logo/logo-rungame.svg'
 INPUT_FILE = 'public/logo/logo-rungame-512.png'
 OUTPUT_FILE = 'public/logo/logo-rungame-white-512.png'
-
-def generate_white_logo():
-    """生成白色版本的 logo"""
-
-    # 检查输入文件是否存在
-    if not os.path.exists(INPUT_FILE):
-        print(f"❌ 错误: 输入文件不存在: {INPUT_FILE}")
+OUTPUT_SIZE = 512
+
+def default_input():
+    """有可用的 SVG 渲染后端时使用矢量母版，否则使用 512 位图"""
+    return SVG_INPUT_FILE if default_backend() else INPUT_FILE
+
+def build_spec_node(owner, input_file, output_file, color, size, force):
+    """
+    输出由 asset-spec.json 的节点负责时交给该节点生成（默认的 logo-rungame-white-512.png 即 logo/white-512），
+    同一文件只有一个生产者和一份缓存记录；参数与节点不一致时报错，其他单色版本请用 --output 写到别处
+    """
+    params = load_spec()[owner].params
+    sources = [os.path.abspath(path) for path in (params['path'], params.get('fallback')) if path]
+    if (input_file and os.path.abspath(input_file) not in sources) or parse_color(color) != parse_color(params['fill']) or size != params['size']:
+        print(f"❌ 错误: {output_file} 由 asset-spec.json 的 {owner} 节点生成（{params['fill']}，{params['size']}px），"
+              f"其他输入、颜色或尺寸请用 --output 指定其他路径")
         return False
+    print(f"📋 {output_file} 由 asset-spec.json 的 {owner} 节点生成")
+    return build(only=[owner], force=force, report=None)
 
-    print(f"📖 读取原始 logo: {INPUT_FILE}")
+def generate_white_logo(input_file=None, output_file=OUTPUT_FILE, color=WHITE, force=False, memory_limit=None,
+                        size=OUTPUT_SIZE):
+    """生成白色（或指定单色）版本的 logo"""
 
-    # 打开原始图片
-    img = Image.open(INPUT_FILE).convert('RGBA')
+    owner = output_owners().get(os.path.abspath(output_file))
+    if owner:
+        return build_spec_node(owner, input_file, output_file, color, size, force)
 
-    # 获取图片数据
-    width, height = img.size
-    pixels = img.load()
+    input_file = input_file or default_input()
+    vector = input_file.lower().endswith('.svg')
 
-    print(f"📐 图片尺寸: {width}×{height}")
-    print(f"🎨 转换颜色为白色...")
-
-    # 创建新图片
-    white_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    white_pixels = white_img.load()
+    # 检查输入文件是否存在
+    if not os.path.exists(input_file):
+        print(f"❌ 错误: 输入文件不存在: {input_file}")
+        return False
 
-    # 遍历每个像素
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
+    backend = default_backend() if vector else None
+    if vector and not backend:
+        print("❌ 错误: 渲染 SVG 需要安装 cairosvg、resvg-py 或 rsvg-convert")
+        return False
 
-            # 如果像素不是完全透明的，将其 RGB 改为白色，保留透明度
-            if a > 0:
-                white_pixels[x, y] = (255, 255, 255, a)
-            else:
-                white_pixels[x, y] = (0, 0, 0, 0)
+    # 增量缓存：输入图片、颜色和着色 / 渲染代码都未变化时跳过
+    cache = BuildCache(enabled=not force)
+    encoder = PngEncoder()
+    variants = VariantWriter()
+    if vector:
+        render_key = (render_monochrome, substitute_fill, rasterize, backend, size)
+    else:
+        render_key = (render_monochrome, recolor, recolor_strips)
+    key = cache.key(*render_key, cache.file_digest(input_file), parse_color(color), encode_png, encoder.options,
+                    FORMATS, variants.formats)
+    if cache.is_fresh(output_file, key) and variants.is_fresh(output_file):
+        print(f"· {output_file} 未变化，跳过")
+        return True
+
+    print(f"📖 读取原始 logo: {input_file}")
+    if vector:
+        # 矢量母版：替换填充色后按目标尺寸直接渲染，边缘不经过缩放
+        print(f"🎨 替换填充色为 {color}，使用 {backend} 渲染 {size}×{size}...")
+    else:
+        # 着色：保留透明度，可见像素统一改为目标颜色；超大原图按条带处理
+        width, height = open_image(input_file).size
+        print(f"📐 图片尺寸: {width}×{height}")
+        print(f"🎨 转换颜色为 {color}...")
+
+    try:
+        if memory_limit:
+            # 内存上限只设在一个单独的 worker 进程中，不影响主进程里 WebP / AVIF 编码线程池的线程
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                white_img = pool.submit(render_monochrome, input_file, color, size, backend, memory_limit).result()
+        else:
+            white_img = render_monochrome(input_file, color, size, backend)
+    except MemoryError:
+        print(f"❌ 错误: 超出内存上限 {memory_limit}MB")
+        return False
 
     # 保存白色版本
-    print(f"💾 保存白色 logo: {OUTPUT_FILE}")
-    white_img.save(OUTPUT_FILE, 'PNG', optimize=True)
+    print(f"💾 保存 logo: {output_file}")
+    if encoder.save(white_img, output_file):
+        cache.record(output_file, key)
+        cache.save()
+
+    # WebP / AVIF 变体
+    variants.submit(white_img, output_file)
+    variants.finish()
 
     # 获取文件大小
-    file_size = os.path.getsize(OUTPUT_FILE)
+    file_size = os.path.getsize(output_file)
     file_size_kb = file_size / 1024
 
-    print(f"✅ 成功生成白色 logo!")
+    print(f"✅ 成功生成单色 logo!")
     print(f"📦 文件大小: {file_size_kb:.1f}KB")
-    print(f"📂 文件位置: {OUTPUT_FILE}")
+    print(f"📂 文件位置: {output_file}")
 
-    return True
+    return encoder.report()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='生成单色版本 Logo')
+    parser.add_argument('--input', help=f'输入 SVG 或 PNG 路径（默认 {SVG_INPUT_FILE}，无 SVG 后端时 {INPUT_FILE}）')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='输出 PNG 路径')
+    parser.add_argument('--color', default='#FFFFFF', help='目标颜色，如 #FFFFFF、on-dark 或 dark:light（主题名:颜色名）')
+    parser.add_argument('--size', type=int, default=OUTPUT_SIZE, help=f'SVG 输入的渲染尺寸（默认 {OUTPUT_SIZE}）')
+    parser.add_argument('--force', action='store_true', help='忽略增量缓存，强制重新生成')
+    parser.add_argument('--memory-limit', type=int, help='内存上限（MB），默认读取 ASSET_WORKER_MEMORY_MB')
+    return parser.parse_args()
 
 if __name__ == '__main__':
+    args = parse_args()
+
     print("=" * 60)
     print("🎨 生成白色版本 Logo")
     print("=" * 60)
 
-    success = generate_white_logo()
+    try:
+        color = theme_color(args.color)
+    except ValueError as e:
+        print(f"❌ 错误: {e}")
+        exit(1)
+
+    success = generate_white_logo(args.input, args.output, color, args.force, memory_limit_mb(args.memory_limit),
+                                  args.size)
 
     if success:
         print("\n" + "=" * 60)
@@ -0,0 +1,153 @@
+"""
+图像生成基准测试的公共配置
+
+  - 把 scripts/assets 加入 sys.path，工作目录切到仓库根目录（脚本中的路径都相对于根目录）
+  - 字体固定为随仓库提供的 DejaVu Sans Bold，离线的 Linux runner 与 macOS 结果可比
+  - bench fixture：用 pytest-benchmark 计时，再与 baselines.json 中的基线比较，
+    中位数比基线慢超过容差即失败。没有安装 pytest-benchmark 时跳过计时用例，
+    黄金图像和行为测试照常运行（依赖见 tests/requirements.txt）
+
+基线随机器不同而不同，因此同时记录一次固定工作量的校准耗时，比较时按
+当前机器与基线机器的校准耗时之比缩放。更新基线:
+  python3 -m pytest scripts/assets/tests --update-baselines
+"""
+
+from PIL import Image
+import json
+import os
+import platform
+import sys
+import time
+
+import pytest
+
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.dirname(TESTS_DIR)
+REPO_ROOT = os.path.dirname(os.path.dirname(ASSETS_DIR))
+sys.path.insert(0, ASSETS_DIR)
+
+from assetkit import fonts  # noqa: E402
+
+BASELINES_FILE = os.path.join(TESTS_DIR, 'baselines.json')
+
+# 默认容差：中位数比（校准后的）基线慢 25% 以上视为回归
+DEFAULT_TOLERANCE = 0.25
+
+
+# pytest.ini 中 addopts 用到的 pytest-benchmark 选项
+BENCHMARK_OPTIONS = ['--benchmark-min-rounds', '--benchmark-max-time', '--benchmark-warmup',
+                     '--benchmark-warmup-iterations', '--benchmark-sort']
+
+
+def pytest_addoption(parser):
+    if pytest_benchmark is None:
+        # 插件不在时登记同名的占位选项，pytest.ini 中的默认参数仍能解析，计时用例由 bench 跳过
+        group = parser.getgroup('benchmark (pytest-benchmark 未安装)')
+        for option in BENCHMARK_OPTIONS:
+            group.addoption(option, help='需要 pytest-benchmark')
+    group = parser.getgroup('asset baselines')
+    group.addoption('--update-baselines', action='store_true', help='用本次结果重写 baselines.json')
+    group.addoption('--baseline-tolerance', type=float, default=None,
+                    help=f'允许的变慢比例（默认 {DEFAULT_TOLERANCE}，也可用 ASSET_BENCH_TOLERANCE）')
+
+
+def load_baselines(path=BASELINES_FILE):
+    if not os.path.exists(path):
+        return {"calibration": None, "benchmarks": {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def calibrate(rounds=7):
+    """固定工作量（Lanczos 缩放 + PNG 编码）的最短耗时，用于换算不同机器的基线"""
+    img = Image.radial_gradient('L').resize((1024, 1024)).convert('RGBA')
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        img.resize((333, 333), Image.Resampling.LANCZOS).save(os.devnull, 'PNG', optimize=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.fixture(scope='session', autouse=True)
+def bundled_font():
+    """所有绘制函数使用随仓库提供的字体"""
+    with fonts.bundled_only() as path:
+        yield path
+
+
+@pytest.fixture(scope='session', autouse=True)
+def repo_root():
+    previous = os.getcwd()
+    os.chdir(REPO_ROOT)
+    yield REPO_ROOT
+    os.chdir(previous)
+
+
+@pytest.fixture(scope='session')
+def baselines(request):
+    data = load_baselines()
+    data["current_calibration"] = calibrate()
+    request.config._asset_baselines = data
+    request.config._asset_results = {}
+    return data
+
+
+@pytest.fixture
+def bench(baselines, request):
+    """
+    bench(fn, *args, **kwargs)：计时并与基线比较，返回 fn 的结果
+
+    没有基线的用例只记录不比较；--benchmark-disable 时只执行一次，不比较；
+    没有安装 pytest-benchmark 时跳过用例。
+    """
+    if pytest_benchmark is None:
+        pytest.skip('需要 pytest-benchmark（pip3 install -r scripts/assets/tests/requirements.txt）')
+    benchmark = request.getfixturevalue('benchmark')
+    config = request.config
+    tolerance = config.getoption('--baseline-tolerance')
+    if tolerance is None:
+        tolerance = float(os.environ.get('ASSET_BENCH_TOLERANCE', DEFAULT_TOLERANCE))
+    name = request.node.nodeid.split('::', 1)[-1]
+
+    def run(fn, *args, **kwargs):
+        result = benchmark(fn, *args, **kwargs)
+        if benchmark.disabled or benchmark.stats is None:
+            return result
+        median = benchmark.stats.stats.median
+        config._asset_results[name] = median
+
+        baseline = baselines["benchmarks"].get(name)
+        if baseline is None or config.getoption('--update-baselines'):
+            return result
+        scale = baselines["current_calibration"] / baselines["calibration"] if baselines["calibration"] else 1.0
+        allowed = baseline * scale * (1 + tolerance)
+        if median > allowed:
+            pytest.fail(f"{name} 中位数 {median * 1000:.2f}ms 超过基线 {baseline * 1000:.2f}ms"
+                        f"（校准系数 {scale:.2f}，容差 {tolerance:.0%}，上限 {allowed * 1000:.2f}ms）")
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not config.getoption('--update-baselines') or not getattr(config, '_asset_results', None):
+        return
+    data = config._asset_baselines
+    benchmarks = dict(data["benchmarks"])
+    benchmarks.update(config._asset_results)
+    payload = {
+        "calibration": data["current_calibration"],
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "pillow": Image.__version__, "cpus": os.cpu_count()},
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    with open(BASELINES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+        f.write('\n')
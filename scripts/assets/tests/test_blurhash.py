@@ -0,0 +1,24 @@
+"""BlurHash：透明区域按黑色处理"""
+
+from PIL import Image
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from assetkit import blurhash  # noqa: E402
+
+
+def test_transparent_pixels_encode_as_black():
+    black = Image.new('RGB', (40, 20))
+    hidden_red = Image.new('RGBA', (40, 20), (255, 0, 0, 0))
+    assert blurhash.encode(hidden_red) == blurhash.encode(black)
+
+
+def test_partial_alpha_composites_onto_black():
+    img = Image.new('RGBA', (40, 20), (255, 255, 255, 0))
+    img.paste((0, 0, 255, 255), (0, 0, 20, 20))
+    expected = Image.new('RGB', (40, 20))
+    expected.paste((0, 0, 255), (0, 0, 20, 20))
+    assert blurhash.encode(img) == blurhash.encode(expected)
+    assert blurhash.encode(img) != blurhash.encode(img.convert('RGB'))
@@ -0,0 +1,98 @@
+"""内容寻址仓库：相同内容只存一份，索引与对象文件一致"""
+
+from PIL import Image
+import io
+import os
+import sys
+
+import pytest
+
+from assetkit.content_store import ContentStore, describe_record, sha256_bytes
+from assetkit.loader import load_script
+
+
+def png_bytes(color, size=(8, 4)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ContentStore(str(tmp_path / 'store')) as store:
+        yield store
+
+
+def test_put_deduplicates_by_content(store):
+    data = png_bytes('red')
+    digest, created = store.put(data, source='https://example.com/a.png')
+    assert (digest, created) == (sha256_bytes(data), True)
+    assert store.put(data, source='https://example.com/b.png') == (digest, False)
+
+    entry = store.get(digest)
+    assert (entry["width"], entry["height"], entry["format"], entry["ext"]) == (8, 4, 'PNG', '.png')
+    with open(entry["path"], 'rb') as f:
+        assert f.read() == data
+    assert entry["path"].endswith(os.path.join(digest[:2], digest[2:4], digest + '.png'))
+    assert store.stats() == {"objects": 1, "bytes": len(data), "variants": 0, "sources": 2}
+
+
+def test_lookup_and_missing(store, tmp_path):
+    red, blue = png_bytes('red'), png_bytes('blue')
+    path = tmp_path / 'blue.png'
+    path.write_bytes(blue)
+    red_digest, _ = store.put(red, source='red')
+    blue_digest, _ = store.put_file(str(path), source=str(path))
+
+    assert store.has(red_digest) and store.has(blue_digest)
+    assert store.lookup_source(str(path)) == blue_digest
+    assert store.lookup_source('unknown') is None
+    unknown = sha256_bytes(b'not stored')
+    assert store.missing([unknown, red_digest, blue_digest]) == [unknown]
+    assert sorted(digest for digest, _ in store.objects()) == sorted([red_digest, blue_digest])
+
+
+def test_variants_and_unrecognized_data(store):
+    digest, _ = store.put(b'not an image')
+    assert store.get(digest)["ext"] == '.bin'
+    store.add_variant(digest, '320.webp', 'public/thumbs/x-320.webp', 123)
+    assert store.get(digest)["variants"] == {"320.webp": {"path": 'public/thumbs/x-320.webp', "bytes": 123}}
+
+
+def test_index_persists_across_instances(tmp_path):
+    root = str(tmp_path / 'store')
+    data = png_bytes('green')
+    with ContentStore(root) as store:
+        digest, _ = store.put(data)
+    with ContentStore(root) as store:
+        assert store.has(digest)
+        assert store.put(data) == (digest, False)
+
+
+def test_describe_record_reports_unreadable_files(tmp_path):
+    missing = str(tmp_path / 'missing.png')
+    info = describe_record({"path": missing, "source": "https://example.com/missing.png"})
+    assert info["file"] == missing and info["source"] == "https://example.com/missing.png"
+    assert info["error"]
+
+
+def test_import_continues_past_bad_records(tmp_path, monkeypatch, capsys):
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'red.png').write_bytes(png_bytes('red'))
+    (src / 'blue.png').write_bytes(png_bytes('blue'))
+    (src / 'corrupt.png').write_bytes(b'not an image')
+    (src / 'unreadable.png').mkdir()     # 打开时报 IsADirectoryError
+    listing = tmp_path / 'list.txt'
+    listing.write_text('\n'.join(str(src / name) for name in ('red.png', 'unreadable.png', 'corrupt.png', 'blue.png')))
+
+    root = str(tmp_path / 'store')
+    monkeypatch.setattr(sys, 'argv', ['content-store.py', '--store', root, 'import', str(listing), '--workers', '1'])
+    with pytest.raises(SystemExit) as exit_info:
+        load_script('content-store').main()
+    assert exit_info.value.code == 1
+    out = capsys.readouterr().out
+    assert "新增 2 张" in out
+    assert str(src / 'unreadable.png') in out and str(src / 'corrupt.png') in out
+    with ContentStore(root) as store:
+        assert store.stats()["objects"] == 2
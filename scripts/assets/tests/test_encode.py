@@ -0,0 +1,66 @@
+"""PNG 编码各设置、WebP / AVIF 变体与 ICO / ICNS 打包的基准测试"""
+
+import pytest
+
+from assetkit.encode import DEFAULT_PALETTES, encode_png
+from assetkit.formats import FORMATS, available_formats, encode_variant
+from assetkit.icons import pack_icns, pack_ico
+from assetkit.loader import load_script
+
+gamepad = load_script('generate-icons-gamepad')
+
+# 有代表性的输出：小图标、大图标、OG 图片
+IMAGES = {
+    "favicon-32": lambda: gamepad.create_gamepad_favicon(512).resize((32, 32)),
+    "favicon-512": lambda: gamepad.create_gamepad_favicon(512),
+    "og-image": gamepad.create_gamepad_og_image,
+}
+
+# 与 asset-spec.json 中 favicon.ico 的条目一致；ICNS 取全部受支持的尺寸
+ICO_SIZES = [16, 32, 48, 64]
+ICNS_SIZES = [16, 32, 64, 128, 256, 512]
+
+# encode_png 的设置：只做全彩 optimize=True / 默认调色板序列 / 单一调色板
+PNG_SETTINGS = {
+    "truecolor": {"palettes": ()},
+    "palettes": {"palettes": DEFAULT_PALETTES},
+    "palette-256": {"palettes": (256,)},
+    "palettes-no-baseline": {"palettes": DEFAULT_PALETTES, "baseline": False},
+}
+
+
+@pytest.fixture(scope='module', params=list(IMAGES))
+def image(request):
+    return request.param, IMAGES[request.param]()
+
+
+@pytest.mark.parametrize('setting', list(PNG_SETTINGS))
+def test_encode_png(bench, image, setting):
+    _, img = image
+    data, info = bench(encode_png, img, **PNG_SETTINGS[setting])
+    assert data.startswith(b'\x89PNG')
+
+
+@pytest.mark.parametrize('name', list(FORMATS))
+def test_encode_variant(bench, image, name):
+    if name not in available_formats():
+        pytest.skip(f"当前 Pillow 不支持 {name}")
+    _, img = image
+    data = bench(encode_variant, img, name)
+    assert data
+
+
+@pytest.fixture(scope='module')
+def favicons():
+    master = gamepad.create_gamepad_favicon(512)
+    return {size: master.resize((size, size)) for size in sorted(set(ICO_SIZES + ICNS_SIZES))}
+
+
+def test_pack_ico(bench, favicons):
+    data = bench(pack_ico, [favicons[size] for size in ICO_SIZES])
+    assert data[:4] == b'\x00\x00\x01\x00'
+
+
+def test_pack_icns(bench, favicons):
+    data = bench(pack_icns, [favicons[size] for size in ICNS_SIZES])
+    assert data[:4] == b'icns'
@@ -0,0 +1,35 @@
+"""渲染全部资源并与 tests/golden/ 下的黄金图像比对（不计时，只校验输出）"""
+
+import pytest
+
+from assetkit.golden import compare, golden_targets, verify
+from assetkit.pipeline import load_spec
+
+NAMES = golden_targets(load_spec())
+
+
+@pytest.fixture(scope='module')
+def results(tmp_path_factory):
+    heatmaps = tmp_path_factory.mktemp('golden-diff')
+    return {result["name"]: result for result in verify(heatmap_dir=str(heatmaps))}
+
+
+@pytest.mark.parametrize('name', NAMES)
+def test_golden(results, name):
+    result = results[name]
+    message = '；'.join(result["failures"])
+    if result.get("heatmap"):
+        message += f"（热力图: {result['heatmap']}）"
+    assert result["ok"], f"{name}: {message}"
+
+
+def test_compare_detects_change(results):
+    """度量本身的检查：改动一小块区域即不通过"""
+    from PIL import Image, ImageDraw
+
+    with Image.open(results["gamepad/og"]["golden"]) as img:
+        expected = img.convert('RGBA')
+    actual = expected.copy()
+    ImageDraw.Draw(actual).rectangle((100, 100, 120, 110), fill=(255, 0, 0, 255))
+    assert compare(expected, expected)["ok"]
+    assert not compare(expected, actual)["ok"]
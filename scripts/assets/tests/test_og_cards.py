@@ -0,0 +1,34 @@
+"""批量 OG 卡片：内容寻址跳过与体积预算"""
+
+import os
+
+import pytest
+
+from assetkit import og_cards
+from assetkit.encode import budget_for
+
+RECORD = {"type": "game", "slug": "space-runner", "title": "Space Runner", "category": "Arcade"}
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    # 目录名与 public/og 一致，匹配 ASSET_BUDGETS 中的 OG 卡片预算
+    output_dir = str(tmp_path / 'og')
+    og_cards.init_worker(output_dir)
+    return output_dir
+
+
+def test_render_then_skip(output_dir):
+    key, relative, created, ok = og_cards.render_record(RECORD)
+    assert (key, created, ok) == ("game/space-runner", True, True)
+    assert relative.startswith(os.path.join('game', 'space-runner-'))
+    assert og_cards.render_record(RECORD) == (key, relative, False, True)
+
+
+def test_skipped_card_still_checks_budget(output_dir):
+    _, relative, _, _ = og_cards.render_record(RECORD)
+    path = os.path.join(output_dir, relative)
+    # 已有文件超出预算（如预算收紧前生成的卡片）时，跳过也要报告
+    with open(path, 'wb') as f:
+        f.write(b'\0' * (budget_for(path) + 1))
+    assert og_cards.render_record(RECORD)[2:] == (False, False)
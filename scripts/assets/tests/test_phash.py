@@ -0,0 +1,108 @@
+"""近似重复搜索：多索引分段搜索与两两比较的结果一致，popcount 两种实现一致"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from assetkit.phash import (DHASH_THRESHOLD, PHASH_THRESHOLD, group_near_duplicates, near_duplicate_pairs,  # noqa: E402
+                            popcount)
+from assetkit.loader import load_script  # noqa: E402
+
+
+def flip_bits(values, rng, count):
+    """每个哈希随机翻转 count 位"""
+    flipped = values.copy()
+    for i in range(len(values)):
+        for bit in rng.choice(64, count, replace=False):
+            flipped[i] ^= np.uint64(1) << np.uint64(int(bit))
+    return flipped
+
+
+@pytest.fixture(scope='module')
+def hashes():
+    """随机哈希 + 在阈值内外翻转若干位的副本 + 完全相同的副本"""
+    rng = np.random.default_rng(7)
+    base_d = rng.integers(0, 2 ** 63, 300, dtype=np.uint64)
+    base_p = rng.integers(0, 2 ** 63, 300, dtype=np.uint64)
+    near = slice(0, 60)
+    far = slice(60, 90)
+    dhashes = np.concatenate([base_d, flip_bits(base_d[near], rng, DHASH_THRESHOLD),
+                              flip_bits(base_d[far], rng, DHASH_THRESHOLD + 3), base_d[:10]])
+    phashes = np.concatenate([base_p, flip_bits(base_p[near], rng, PHASH_THRESHOLD),
+                              base_p[far], base_p[:10]])
+    return dhashes, phashes
+
+
+def brute_force_pairs(dhashes, phashes):
+    pairs = set()
+    for i in range(len(dhashes)):
+        for j in range(i + 1, len(dhashes)):
+            if (bin(int(dhashes[i] ^ dhashes[j])).count('1') <= DHASH_THRESHOLD
+                    and bin(int(phashes[i] ^ phashes[j])).count('1') <= PHASH_THRESHOLD):
+                pairs.add((i, j))
+    return pairs
+
+
+def test_pairs_match_brute_force(hashes):
+    dhashes, phashes = hashes
+    inverse, a, b = near_duplicate_pairs(dhashes, phashes)
+    # a / b 是去重后哈希的下标，经 inverse 映射回原始下标
+    members = {}
+    for i, u in enumerate(inverse):
+        members.setdefault(int(u), []).append(i)
+    found = set()
+    for u, v in zip(a.tolist(), b.tolist()):
+        found |= {tuple(sorted((i, j))) for i in members[u] for j in members[v]}
+    for group in members.values():
+        found |= {(i, j) for i in group for j in group if i < j}
+    assert found == brute_force_pairs(dhashes, phashes)
+
+
+def test_groups_are_connected_components(hashes):
+    dhashes, phashes = hashes
+    groups = group_near_duplicates(dhashes, phashes)
+    pairs = brute_force_pairs(dhashes, phashes)
+
+    parent = list(range(len(dhashes)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        parent[find(i)] = find(j)
+    expected = {}
+    for i in range(len(dhashes)):
+        expected.setdefault(find(i), []).append(i)
+    expected = sorted(sorted(group) for group in expected.values() if len(group) > 1)
+    assert sorted(sorted(group) for group in groups) == expected
+    assert len(groups) >= 60
+
+
+@pytest.fixture(params=['bitwise_count', 'unpackbits'])
+def popcount_impl(request, monkeypatch):
+    """分别测试 np.bitwise_count 与 NumPy < 2.0 的回退实现"""
+    if request.param == 'unpackbits':
+        monkeypatch.delattr(np, 'bitwise_count', raising=False)
+    elif not hasattr(np, 'bitwise_count'):
+        pytest.skip('NumPy < 2.0 没有 bitwise_count')
+    return request.param
+
+
+def test_popcount_arrays_and_scalars(popcount_impl):
+    values = np.array([0, 1, 0xFF, 2 ** 64 - 1], dtype=np.uint64)
+    assert popcount(values).tolist() == [0, 1, 8, 64]
+    assert int(popcount(values[2] ^ values[1])) == 7
+    assert int(popcount(np.uint64(2 ** 63))) == 1
+    assert popcount(values.reshape(2, 2)).shape == (2, 2)
+
+
+def test_merge_plan_distances(popcount_impl):
+    plan = load_script('find-near-duplicates').merge_plan([
+        {"path": "a.png", "width": 100, "height": 100, "bytes": 10, "dhash": np.uint64(0b1011), "phash": np.uint64(1)},
+        {"path": "b.png", "width": 50, "height": 50, "bytes": 10, "dhash": np.uint64(0b0001), "phash": np.uint64(1)},
+    ], [[0, 1]])
+    assert plan == [{"keep": "a.png", "merge": [
+        {"path": "b.png", "width": 50, "height": 50, "dhash_distance": 2, "phash_distance": 0},
+    ]}]
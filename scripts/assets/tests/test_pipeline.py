@@ -0,0 +1,106 @@
+"""资源规格的解析、选择、主题展开和增量计划"""
+
+from PIL import Image
+import json
+import os
+
+import pytest
+
+from assetkit.build_cache import BuildCache
+from assetkit.encode import PngEncoder
+from assetkit.pipeline import (AssetGraph, load_spec, output_owners, parse_spec, select, topological_order,
+                               with_themes)
+from assetkit.theme import THEMES_DIR
+
+
+@pytest.fixture
+def spec(tmp_path):
+    """load → resize ×2 → encode；recolor → encode"""
+    source = tmp_path / 'master.png'
+    Image.new('RGBA', (64, 64), (255, 107, 53, 255)).save(source)
+    out = tmp_path / 'out'
+    return {"nodes": {
+        "master": {"op": "load", "path": str(source)},
+        "icon-{size}": {"op": "resize", "from": "master", "sizes": [16, 32], "output": f"{out}/icon-{{size}}.png"},
+        "white": {"op": "recolor", "from": "master", "color": "#FFFFFF", "output": f"{out}/white.png"},
+    }}
+
+
+def graph_for(nodes, tmp_path):
+    return AssetGraph(nodes, BuildCache(str(tmp_path / 'manifest.json')), PngEncoder(), None)
+
+
+def test_parse_expands_sizes_and_outputs(spec):
+    nodes = parse_spec(spec)
+    assert {name for name, node in nodes.items() if node.op == 'resize'} == {'icon-16', 'icon-32'}
+    encodes = [node for node in nodes.values() if node.op == 'encode']
+    assert sorted(os.path.basename(node.output) for node in encodes) == ['icon-16.png', 'icon-32.png', 'white.png']
+    order = topological_order(nodes)
+    assert all(order.index(dep) < order.index(name) for name in nodes for dep in nodes[name].deps)
+
+
+def test_output_owners(spec, tmp_path):
+    path = tmp_path / 'spec.json'
+    path.write_text(json.dumps(spec))
+    owners = output_owners(str(path))
+    assert owners[os.path.abspath(tmp_path / 'out' / 'icon-16.png')] == 'icon-16'
+    assert owners[os.path.abspath(tmp_path / 'out' / 'white.png')] == 'white'
+    # 仓库规格中白色 Logo 只有 logo/white-512 一个生产者
+    assert output_owners()[os.path.abspath('public/logo/logo-rungame-white-512.png')] == 'logo/white-512'
+
+
+def test_parse_rejects_conflicts_and_cycles(spec):
+    conflict = {"nodes": {**spec["nodes"], "again": {"op": "recolor", "from": "master", "color": "#000000",
+                                                      "output": spec["nodes"]["white"]["output"]}}}
+    with pytest.raises(ValueError, match="输出冲突"):
+        parse_spec(conflict)
+    cycle = {"nodes": {"a": {"op": "recolor", "from": "b", "color": "#000000"},
+                       "b": {"op": "recolor", "from": "a", "color": "#000000"}}}
+    with pytest.raises(ValueError, match="成环"):
+        parse_spec(cycle)
+
+
+def test_select_by_node_or_output(spec):
+    nodes = parse_spec(spec)
+    assert [nodes[name].output.endswith('white.png') for name in select(nodes, ['white'])] == [True]
+    assert len(select(nodes, ['master'])) == 3
+    assert len(select(nodes, ['*/icon-16.png'])) == 1
+    with pytest.raises(ValueError):
+        select(nodes, ['nothing-*'])
+
+
+def test_plan_skips_fresh_outputs(spec, tmp_path):
+    nodes = parse_spec(spec)
+    targets = select(nodes)
+    graph = graph_for(nodes, tmp_path)
+    order, skipped = graph.plan(targets)
+    assert skipped == [] and set(order) == set(nodes)
+
+    # 模拟一次完整构建：输出存在且指纹已记录
+    for name in targets:
+        os.makedirs(os.path.dirname(nodes[name].output), exist_ok=True)
+        Image.new('RGBA', (1, 1)).save(nodes[name].output)
+        graph.cache.record(nodes[name].output, graph.key(name))
+    graph.cache.save()
+
+    graph = graph_for(parse_spec(spec), tmp_path)
+    assert graph.plan(targets) == ([], targets)
+
+    # 只改 recolor 的参数：只有该分支需要重新执行
+    spec["nodes"]["white"]["color"] = "#000000"
+    nodes = parse_spec(spec)
+    order, skipped = graph_for(nodes, tmp_path).plan(targets)
+    assert order == ['master', 'white', spec["nodes"]["white"]["output"]]
+    assert len(skipped) == 2
+
+
+def test_with_themes_copies_render_branches():
+    nodes = load_spec()
+    targets = select(nodes, ['public/favicon.ico'])
+    themed, selected = with_themes(nodes, targets, ['brand', 'dark'])
+    assert selected[:len(targets)] == targets
+    assert [themed[name].output for name in selected[len(targets):]] == [os.path.join(THEMES_DIR, 'dark', 'favicon.ico')]
+    master = themed['themes/dark/gamepad/master']
+    assert master.params['kwargs']['theme'] == 'dark'
+    # 与主题无关的节点不复制
+    assert not any(name.startswith('themes/') and 'logo/' in name for name in themed)
@@ -0,0 +1,148 @@
+"""绘制函数与白色 Logo 转换的基准测试"""
+
+from PIL import Image
+import pytest
+
+from assetkit import locale_cards
+from assetkit.loader import load_script
+from assetkit.recolor import recolor, recolor_strips, WHITE
+from assetkit.svg import default_backend, rasterize, read_svg, substitute_fill
+from assetkit.theme import load_themes
+
+FAVICON_SIZES = [64, 180, 512, 1024]
+
+# 与 asset-spec.json 中游戏手柄母版的全部 resize 尺寸一致（对照 test_resize.py::test_resize_chain）
+ICON_SIZES = [16, 32, 48, 64, 128, 180, 256, 512]
+
+gamepad = load_script('generate-icons-gamepad')
+classic = load_script('generate-icons')
+
+
+def cold(scene, fn):
+    """每次调用前清空场景图的图层缓存，测的是一次性构建中真正付出的绘制成本"""
+    def run(*args):
+        scene.clear_cache()
+        return fn(*args)
+    return run
+
+
+@pytest.mark.parametrize('size', FAVICON_SIZES)
+def test_gamepad_favicon(bench, size):
+    img = bench(cold(gamepad.GAMEPAD_FAVICON, gamepad.create_gamepad_favicon), size)
+    assert img.size == (size, size)
+
+
+@pytest.mark.parametrize('size', FAVICON_SIZES)
+def test_classic_favicon(bench, size):
+    img = bench(cold(classic.FAVICON, classic.create_favicon), size)
+    assert img.size == (size, size)
+
+
+@pytest.mark.parametrize('factor', [2, 3, 4])
+def test_gamepad_favicon_supersampled(bench, factor):
+    # 超采样的代价：N 倍画布上绘制图形 + Image.reduce，文字仍按输出尺寸绘制
+    img = bench(cold(gamepad.GAMEPAD_FAVICON, gamepad.create_gamepad_favicon), 512, factor)
+    assert img.size == (512, 512)
+
+
+def test_gamepad_favicon_cached(bench):
+    # 同一尺寸、同一调色板再次绘制（watch 模式、多处引用同一尺寸）：只复制缓存的画布
+    gamepad.create_gamepad_favicon(512)
+    img = bench(gamepad.create_gamepad_favicon, 512)
+    assert img.size == (512, 512)
+
+
+def test_gamepad_favicon_all_sizes(bench):
+    """按场景图直接绘制全部尺寸，对照“绘制 512 母版 + 缩放链”"""
+    def all_sizes():
+        gamepad.GAMEPAD_FAVICON.clear_cache()
+        return [gamepad.create_gamepad_favicon(size) for size in ICON_SIZES]
+
+    images = bench(all_sizes)
+    assert [img.width for img in images] == ICON_SIZES
+
+
+def test_gamepad_favicon_themes(bench):
+    """全部主题各绘制一次：第一个主题直接绘制，其余共用一次栅格化的几何（覆盖率），只按主题着色"""
+    themes = list(load_themes())
+
+    def all_themes():
+        gamepad.GAMEPAD_FAVICON.clear_cache()
+        return [gamepad.create_gamepad_favicon(512, 3, theme) for theme in themes]
+
+    images = bench(all_themes)
+    # 与每个主题单独直接绘制的结果逐像素一致（对照 test_gamepad_favicon_supersampled[3] 的单次耗时）
+    expected = [cold(gamepad.GAMEPAD_FAVICON, gamepad.create_gamepad_favicon)(512, 3, theme) for theme in themes]
+    assert [img.tobytes() for img in images] == [img.tobytes() for img in expected]
+
+
+def test_gamepad_og_image(bench):
+    # 静态图层在第一次调用后已缓存，这里测的是每张卡片都要付出的成本：复制底图 + 绘制文字
+    img = bench(gamepad.create_gamepad_og_image)
+    assert img.size == gamepad.OG_SIZE
+
+
+@pytest.mark.parametrize('layer', ['draw_og_background', 'draw_og_circle', 'draw_og_badge'])
+def test_gamepad_og_layer(bench, layer):
+    img = bench(getattr(gamepad, layer))
+    assert img.size == gamepad.OG_SIZE
+
+
+def test_locale_og_cards(bench):
+    """一种语言的全部页面卡片（generate-locale-og-cards.py 中一个 worker 任务）：文字缓存从空开始，
+    站点名、页脚和截断时测量的前缀在卡片之间复用"""
+    catalog = locale_cards.load_catalogs(locales=['en'])['en']
+    typesetter = locale_cards.Typesetter('en')
+    texts = [locale_cards.card_text(catalog, page) for page in locale_cards.PAGES]
+
+    def batch():
+        locale_cards.measure.cache_clear()
+        locale_cards.rasterize.cache_clear()
+        return [locale_cards.render_card(text, typesetter) for text in texts]
+
+    images = bench(batch)
+    # 缓存命中时贴的是同一批遮罩，结果不变
+    warm = [locale_cards.render_card(text, typesetter) for text in texts]
+    assert [img.tobytes() for img in images] == [img.tobytes() for img in warm]
+    assert all(img.size == gamepad.OG_SIZE for img in images)
+
+
+def test_classic_og_image(bench):
+    img = bench(classic.create_og_image)
+    assert img.size == (1200, 630)
+
+
+def test_gamepad_app_icon(bench):
+    img = bench(cold(gamepad.SIMPLE_APP_ICON, gamepad.create_simple_app_icon))
+    assert img.size == (512, 512)
+
+
+def test_classic_app_icon(bench):
+    img = bench(cold(classic.APP_ICON, classic.create_app_icon))
+    assert img.size == (512, 512)
+
+
+@pytest.fixture(scope='module')
+def logo_512():
+    with Image.open('public/logo/logo-rungame-512.png') as img:
+        img.load()
+        return img
+
+
+def test_white_logo_recolor(bench, logo_512):
+    img = bench(recolor, logo_512, WHITE)
+    assert img.getpixel((256, 256))[:3] in ((255, 255, 255), (0, 0, 0))
+
+
+def test_white_logo_recolor_strips(bench, logo_512):
+    # 条带预算取 64KB，使 512×512 的图片切成多条，覆盖超大原图的处理路径
+    img = bench(recolor_strips, logo_512, WHITE, 64 * 1024)
+    assert img.size == logo_512.size
+
+
+@pytest.mark.skipif(default_backend() is None, reason='没有可用的 SVG 渲染后端')
+@pytest.mark.parametrize('size', [64, 512])
+def test_white_logo_svg(bench, size):
+    svg = substitute_fill(read_svg('public/logo/logo-rungame.svg'), '#FFFFFF')
+    img = bench(rasterize, svg, size, cache_dir=None)
+    assert img.size == (size, size)
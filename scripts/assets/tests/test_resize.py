@@ -0,0 +1,38 @@
+"""金字塔缩放链中每一步的基准测试"""
+
+from PIL import Image
+import pytest
+
+from assetkit.loader import load_script
+from assetkit.resize import Resizer, plan_resizes
+
+# 与 asset-spec.json 中游戏手柄母版的全部 resize 尺寸一致
+FAVICON_SIZES = [16, 32, 48, 64, 128, 180, 256, 512]
+MASTER_SIZE = 512
+
+PLAN = plan_resizes(MASTER_SIZE, FAVICON_SIZES)
+
+
+@pytest.fixture(scope='module')
+def resizer():
+    master = load_script('generate-icons-gamepad').create_gamepad_favicon(MASTER_SIZE)
+    resizer = Resizer(master, FAVICON_SIZES)
+    for size in FAVICON_SIZES:
+        resizer.get(size)
+    return resizer
+
+
+@pytest.mark.parametrize('target, source', PLAN, ids=[f"{t[0]}-from-{s[0]}" for t, s in PLAN])
+def test_resize_step(bench, resizer, target, source):
+    img = bench(resizer.images[source].resize, target, Image.Resampling.LANCZOS)
+    assert img.size == target
+
+
+def test_resize_chain(bench, resizer):
+    """整条缩放链（新建 Resizer 并取全部尺寸）"""
+    def chain():
+        chain = Resizer(resizer.master, FAVICON_SIZES)
+        return [chain.get(size) for size in FAVICON_SIZES]
+
+    images = bench(chain)
+    assert [img.width for img in images] == FAVICON_SIZES
@@ -0,0 +1,52 @@
+"""场景图的图层快照缓存和覆盖率着色：重复绘制、换调色板的结果与冷绘制逐像素一致"""
+
+import pytest
+
+from assetkit.loader import load_script
+from assetkit.scene import Scene, Shape, Text
+from assetkit.theme import load_themes
+
+gamepad = load_script('generate-icons-gamepad')
+classic = load_script('generate-icons')
+
+THEMES = list(load_themes().values())
+
+
+def cold_render(scene, size, palette, factor):
+    scene.clear_cache()
+    return scene.render(size, palette, factor).tobytes()
+
+
+@pytest.mark.parametrize('factor', [1, 3])
+@pytest.mark.parametrize('scene', [gamepad.GAMEPAD_FAVICON, classic.FAVICON], ids=['gamepad', 'classic'])
+def test_repeat_renders_match_cold(scene, factor):
+    """第二轮起走图层前缀快照和覆盖率着色，每个主题仍与单独冷绘制相同"""
+    expected = [cold_render(scene, 128, theme.colors, factor) for theme in THEMES]
+    scene.clear_cache()
+    for _ in range(2):
+        assert [scene.render(128, theme.colors, factor).tobytes() for theme in THEMES] == expected
+
+
+def test_prefix_reused_when_only_top_layer_changes():
+    """只改最上层图形的颜色：下层来自快照，结果与冷绘制相同"""
+    scene = Scene([
+        ("background", [Shape('rounded', (0, 0, 64, 64), fill='primary', radius=12)]),
+        ("mark", [Shape('ellipse', (16, 16, 48, 48), fill='accent', outline='dark', width=2)]),
+        ("label", [Text("R", 24, 'center', 'center', 'light')]),
+    ], unit=64)
+    base = {"primary": (255, 107, 53), "accent": (247, 184, 1), "dark": (26, 26, 46), "light": (255, 255, 255)}
+    recolored = {**base, "accent": (0, 78, 137)}
+
+    expected = [cold_render(scene, 64, palette, 2) for palette in (base, recolored, base)]
+    scene.clear_cache()
+    assert [scene.render(64, palette, 2).tobytes() for palette in (base, recolored, base)] == expected
+    assert scene._cache, "第二次绘制起应缓存图层快照"
+
+
+def test_clear_cache_drops_snapshots():
+    scene = gamepad.GAMEPAD_FAVICON
+    scene.clear_cache()
+    scene.render(64, THEMES[0].colors)
+    scene.render(64, THEMES[1].colors)
+    scene.clear_cache()
+    assert not scene._cache and not scene._coverages
@@ -0,0 +1,137 @@
+"""缩略图派生图：宽度阶梯、原图读取、单张处理、清单复用与批量生成"""
+
+from PIL import Image
+import json
+import os
+import sys
+
+import pytest
+
+from assetkit import thumbnails
+from assetkit.content_store import ContentStore
+from assetkit.loader import load_script
+
+generator = load_script('generate-thumbnails')
+
+
+@pytest.fixture
+def jpeg(tmp_path):
+    def make(size, name='source.jpg'):
+        path = tmp_path / name
+        Image.new('RGB', size, (200, 40, 40)).save(path, 'JPEG')
+        return str(path)
+    return make
+
+
+@pytest.fixture
+def worker(tmp_path):
+    output_dir = tmp_path / 'thumbs'
+    thumbnails.init_worker(str(output_dir), formats=("webp", "png"))
+    return output_dir
+
+
+def test_ladder_never_upscales():
+    assert thumbnails.ladder(640) == [160, 320, 480, 640]
+    assert thumbnails.ladder(5000) == list(thumbnails.WIDTHS)
+    assert thumbnails.ladder(100) == [100]
+
+
+@pytest.mark.parametrize('size', [(60, 60), (300, 300), (640, 360), (2000, 1000)])
+def test_load_source_decodes_before_closing(jpeg, size):
+    img, source_size = thumbnails.load_source(jpeg(size), max_width=960)
+    assert source_size == size
+    assert img.mode == 'RGB'
+    assert img.width == min(size[0], 960)
+    # 文件已关闭后仍可继续处理
+    assert img.resize((10, 10)).size == (10, 10)
+
+
+def test_load_source_keeps_alpha(tmp_path):
+    path = str(tmp_path / 'alpha.png')
+    Image.new('RGBA', (40, 20), (0, 0, 255, 128)).save(path)
+    img, size = thumbnails.load_source(path)
+    assert (img.mode, size) == ('RGBA', (40, 20))
+
+
+def test_process_small_rgb_jpeg(worker, jpeg):
+    entry, created = thumbnails.process(('games/a', jpeg((300, 200)), None))
+    assert created and "error" not in entry
+    assert (entry["width"], entry["height"]) == (300, 200)
+    assert [variant["width"] for variant in entry["variants"]] == [160]
+    assert entry["placeholder"]["type"] == "blurhash"
+    for variant in entry["variants"]:
+        for fmt, info in variant["files"].items():
+            with Image.open(worker / info["path"]) as thumb:
+                assert thumb.width == variant["width"]
+
+    # 输出仍然有效时直接复用上次的条目
+    assert thumbnails.process(('games/a', entry["source"], entry)) == (entry, False)
+
+
+def test_process_stale__when_config_changes(worker, jpeg):
+    entry, _ = thumbnails.process(('a', jpeg((300, 200)), None))
+    thumbnails.init_worker(str(worker), formats=("webp", "png"), placeholder_kind="lqip")
+    entry, created = thumbnails.process(('a', entry["source"], entry))
+    assert created and entry["placeholder"]["value"].startswith("data:image/webp;base64,")
+
+
+def test_process_reports_errors_per_image(worker, tmp_path):
+    broken = tmp_path / 'broken.jpg'
+    broken.write_bytes(b'not an image')
+    entry, created = thumbnails.process(('a', str(broken), None))
+    assert not created and entry["key"] == 'a' and entry["error"]
+
+    entry, created = thumbnails.process(('../escape', str(broken), None))
+    assert not created and "error" in entry
+    assert not (tmp_path / 'escape').exists()
+
+
+def test_process_stale_when_source_changes(worker, jpeg):
+    source = jpeg((300, 200))
+    entry, _ = thumbnails.process(('a', source, None))
+    future = os.stat(source).st_mtime_ns + 10 ** 9
+    os.utime(source, ns=(future, future))
+    assert thumbnails.process(('a', source, entry))[1]
+
+
+def test_process_catches_unexpected_errors(worker, jpeg, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(thumbnails, 'load_source', fail)
+    entry, created = thumbnails.process(('a', jpeg((300, 200)), None))
+    assert not created and entry["error"] == 'AssertionError'
+
+
+def run_generator(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['generate-thumbnails.py', '--workers', '1', *argv])
+    try:
+        generator.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def test_generator_writes_manifest_and_skips_unchanged(tmp_path, jpeg, monkeypatch, capsys):
+    (tmp_path / 'src').mkdir()
+    for i, size in enumerate([(60, 60), (640, 360), (1200, 800)]):
+        jpeg(size, f'src/game-{i}.jpg')
+    (tmp_path / 'src' / 'broken.jpg').write_bytes(b'not an image')
+    args = ['--input', str(tmp_path / 'src'), '--output-dir', str(tmp_path / 'out')]
+    manifest = str(tmp_path / 'out' / generator.MANIFEST_NAME)
+
+    # 损坏的图片记入清单并以非零状态退出，其余图片照常生成
+    assert run_generator(monkeypatch, *args, '--store', str(tmp_path / 'store')) == 1
+    with open(manifest, encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    assert len(entries) == 4
+    assert [entry["source"] for entry in entries if "error" in entry] == [str(tmp_path / 'src' / 'broken.jpg')]
+    assert "新生成 3 张" in capsys.readouterr().out
+    with ContentStore(str(tmp_path / 'store')) as store:
+        assert store.stats()["objects"] == 3
+
+    # 再次运行：load_manifest 只保留成功的条目，未变化的原图全部跳过
+    assert len(generator.load_manifest(manifest)) == 3
+    run_generator(monkeypatch, *args)
+    out = capsys.readouterr().out
+    assert "新生成 0 张" in out and "跳过 3 张" in out
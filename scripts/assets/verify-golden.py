@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+黄金图像比对：证明性能优化没有改变输出
+
+按 asset-spec.json 渲染全部资源（编码前的图片），与 scripts/assets/tests/golden/ 下
+提交的黄金图像比较逐通道差异、离群像素比例和 SSIM（预乘 alpha）。
+不通过时在 .asset-cache/golden-diff/ 写出热力图（期望 | 实际 | 差异），并以状态码 1 退出。
+实现见 assetkit/golden.py。
+
+用法:
+  python3 scripts/assets/verify-golden.py
+  python3 scripts/assets/verify-golden.py --only 'gamepad/*'
+  python3 scripts/assets/verify-golden.py --update            # 有意改变输出后更新黄金图像
+"""
+
+import argparse
+import os
+import time
+
+from assetkit.golden import GOLDEN_DIR, HEATMAP_DIR, TOLERANCE, verify
+from assetkit.pipeline import SPEC_FILE
+
+
+def main():
+    parser = argparse.ArgumentParser(description='与黄金图像逐像素比对')
+    parser.add_argument('--spec', default=SPEC_FILE, help='资源规格 JSON 路径')
+    parser.add_argument('--only', nargs='+', metavar='PATTERN', help='只比对匹配的节点或输出（支持通配符）')
+    parser.add_argument('--workers', type=int, help='并发线程数（默认 CPU 核数）')
+    parser.add_argument('--update', action='store_true', help='用本次渲染结果重写黄金图像')
+    parser.add_argument('--golden-dir', default=GOLDEN_DIR, help='黄金图像目录')
+    parser.add_argument('--heatmap-dir', default=HEATMAP_DIR, help='差异热力图目录（传空字符串不写出）')
+    parser.add_argument('--channel', type=float, default=TOLERANCE["channel"], help='单通道容差（0-255）')
+    parser.add_argument('--outliers', type=float, default=TOLERANCE["outliers"], help='超过通道容差的像素比例上限')
+    parser.add_argument('--mean', type=float, default=TOLERANCE["mean"], help='通道平均差上限')
+    parser.add_argument('--ssim', type=float, default=TOLERANCE["ssim"], help='SSIM 下限')
+    args = parser.parse_args()
+
+    tolerance = {"channel": args.channel, "outliers": args.outliers, "mean": args.mean, "ssim": args.ssim}
+    print("🔍 与黄金图像比对..." if not args.update else "📝 更新黄金图像...")
+    start = time.perf_counter()
+    try:
+        results = verify(args.spec, args.only, args.workers, args.update,
+                         args.golden_dir, args.heatmap_dir or None, tolerance)
+    except ValueError as e:
+        print(f"❌ 错误: {e}")
+        exit(1)
+
+    failed = [r for r in results if not r["ok"]]
+    for r in results:
+        if r.get("updated"):
+            print(f"  ✓ {os.path.relpath(r['golden'])}")
+        elif r["ok"]:
+            print(f"  ✓ {r['name']}  max {max(r['max'].values()):.0f}  SSIM {r['ssim']:.4f}")
+        else:
+            print(f"  ✗ {r['name']}: {'；'.join(r['failures'])}")
+            if r.get("heatmap"):
+                print(f"      热力图: {r['heatmap']}")
+
+    elapsed = time.perf_counter() - start
+    if args.update:
+        print(f"\n✅ 已更新 {len(results)} 张黄金图像（{elapsed:.2f}s）")
+    elif failed:
+        print(f"\n❌ {len(failed)}/{len(results)} 个资源与黄金图像不一致（{elapsed:.2f}s）")
+        exit(1)
+    else:
+        print(f"\n✅ {len(results)} 个资源全部一致（{elapsed:.2f}s）")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+/**
+ * 导出 OG 卡片记录（JSONL）
+ * 供 scripts/assets/generate-og-cards.py 离线批量渲染游戏 / 分类 / 标签的 OG 图片
+ *
+ * 用法: npx tsx scripts/utils/export-og-records.ts [输出文件，默认 og-records.jsonl]
+ */
+
+import { PrismaClient } from '@prisma/client'
+import { createWriteStream } from 'fs'
+
+const prisma = new PrismaClient()
+
+// 游戏分批读取，避免一次性加载全部记录
+const BATCH_SIZE = 500
+
+async function main() {
+  const args = process.argv.slice(2)
+  const outputFile = args[0] || 'og-records.jsonl'
+  const out = createWriteStream(outputFile, { encoding: 'utf-8' })
+  const write = (record: Record<string, unknown>) => out.write(JSON.stringify(record) + '\n')
+
+  let gameCount = 0
+  let cursor: string | undefined
+
+  while (true) {
+    const games = await prisma.game.findMany({
+      where: { status: 'PUBLISHED' },
+      select: {
+        id: true,
+        slug: true,
+        title: true,
+        gameCategories: {
+          where: { isPrimary: true },
+          select: { category: { select: { name: true } } },
+          take: 1,
+        },
+        tags: { select: { tag: { select: { name: true } } }, take: 3 },
+      },
+      orderBy: { id: 'asc' },
+      take: BATCH_SIZE,
+      ...(cursor ? { skip: 1, cursor: { id: cursor } } : {}),
+    })
+    if (games.length === 0) break
+
+    for (const game of games) {
+      write({
+        type: 'game',
+        slug: game.slug,
+        title: game.title,
+        category: game.gameCategories[0]?.category.name,
+        tags: game.tags.map(t => t.tag.name).join(', ') || undefined,
+      })
+    }
+    gameCount += games.length
+    cursor = games[games.length - 1].id
+  }
+
+  const categories = await prisma.category.findMany({
+    where: { isEnabled: true },
+    select: {
+      slug: true,
+      name: true,
+      description: true,
+      parentId: true,
+      _count: { select: { gameSubCategories: true, gameMainCategories: true } },
+    },
+  })
+  for (const category of categories) {
+    write({
+      type: 'category',
+      slug: category.slug,
+      name: category.name,
+      description: category.description || undefined,
+      // 主分类统计其下全部游戏，子分类只统计直接关联的游戏
+      gameCount: category.parentId ? category._count.gameSubCategories : category._count.gameMainCategories,
+    })
+  }
+
+  const tags = await prisma.tag.findMany({
+    where: { isEnabled: true },
+    select: { slug: true, name: true, description: true, _count: { select: { games: true } } },
+  })
+  for (const tag of tags) {
+    write({
+      type: 'tag',
+      slug: tag.slug,
+      name: tag.name,
+      description: tag.description || undefined,
+      gameCount: tag._count.games,
+    })
+  }
+
+  await new Promise<void>(resolve => out.end(resolve))
+
+  console.log(`✅ 已导出到 ${outputFile}`)
+  console.log(`- 游戏: ${gameCount}`)
+  console.log(`- 分类: ${categories.length}`)
+  console.log(`- 标签: ${tags.length}`)
+}
+
+main()
+  .catch(console.error)
+  .finally(() => prisma.$disconnect())